@@ -1,13 +1,20 @@
 """Vérifications système (direnv, pass, etc.)."""
 
+import os
 import shutil
-import subprocess
+import time
 from pathlib import Path
 
 from rich.console import Console
 
 console = Console()
 
+# Durée de validité du cache des secrets pass (secondes)
+SECRET_CACHE_TTL = 300.0
+
+# Cache (store, secret) -> (existe, expiration)
+_secret_cache: dict[tuple[Path, str], tuple[bool, float]] = {}
+
 
 def check_directory_not_exists(path: Path) -> bool:
     """Vérifie que le dossier cible n'existe pas déjà."""
@@ -35,25 +42,39 @@ def check_pass_installed() -> bool:
     return True
 
 
+def get_password_store_dir() -> Path:
+    """Retourne le dossier du store pass ($PASSWORD_STORE_DIR ou ~/.password-store)."""
+    store = os.environ.get("PASSWORD_STORE_DIR")
+    return Path(store).expanduser() if store else Path.home() / ".password-store"
+
+
+def pass_secret_exists(secret_path: str, ttl: float = SECRET_CACHE_TTL) -> bool:
+    """
+    Vérifie qu'un secret existe dans le store pass, sans le déchiffrer.
+
+    Le secret est cherché par son chemin (<store>/<secret>.gpg) : aucun appel
+    à gpg n'est fait. Le résultat est mis en cache pendant ttl secondes.
+    """
+    store = get_password_store_dir()
+    key = (store, secret_path)
+    now = time.monotonic()
+
+    cached = _secret_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    exists = (store / f"{secret_path.strip('/')}.gpg").is_file()
+    _secret_cache[key] = (exists, now + ttl)
+    return exists
+
+
 def check_pass_secret_exists(secret_path: str) -> bool:
     """Vérifie que le secret existe dans pass."""
-    try:
-        result = subprocess.run(
-            ["pass", secret_path],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            console.print(
-                f"[red]Le secret '{secret_path}' n'existe pas dans pass[/red]"
-            )
-            console.print(f"[dim]Créez-le avec : pass insert {secret_path}[/dim]")
-            return False
-        return True
-    except Exception:
-        console.print("[red]Erreur lors de la vérification du secret pass[/red]")
+    if not pass_secret_exists(secret_path):
+        console.print(f"[red]Le secret '{secret_path}' n'existe pas dans pass[/red]")
+        console.print(f"[dim]Créez-le avec : pass insert {secret_path}[/dim]")
         return False
+    return True
 
 
 def run_direnv_checks(pass_secret_path: str = "github/terraform-token") -> bool:
@@ -0,0 +1,143 @@
+"""Bench command for projinit v2.0."""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from rich.console import Console
+
+from projinit.core.bench import (
+    BENCH_TYPES,
+    FleetSpec,
+    new_project_renderer,
+    run_benchmark,
+)
+from projinit.core.models import ProjectType
+
+console = Console(stderr=True)
+
+
+def add_bench_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the bench subcommand to the parser."""
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark projinit on a synthetic fleet of projects",
+        description=(
+            "Generate synthetic projects with the `new` generators (missing "
+            "files, alternative paths, extra files of random sizes) and time "
+            "project creation, detection, checks and updates. Prints "
+            "throughput and latency percentiles as JSON."
+        ),
+    )
+    bench_parser.add_argument(
+        "-n",
+        "--projects",
+        type=int,
+        default=10,
+        help="Projects per project type (default: 10)",
+    )
+    bench_parser.add_argument(
+        "-t",
+        "--type",
+        type=str,
+        action="append",
+        choices=[pt.value for pt in BENCH_TYPES],
+        help="Project type to generate (repeatable, default: all)",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed of the fleet (default: 0)",
+    )
+    bench_parser.add_argument(
+        "--missing-rate",
+        type=float,
+        default=0.1,
+        help="Share of generated files left out (default: 0.1)",
+    )
+    bench_parser.add_argument(
+        "--alternative-rate",
+        type=float,
+        default=0.5,
+        help="Share of files moved to an alternative path (default: 0.5)",
+    )
+    bench_parser.add_argument(
+        "--max-extra-files",
+        type=int,
+        default=20,
+        help="Maximum extra files per project (default: 20)",
+    )
+    bench_parser.add_argument(
+        "--max-file-size",
+        type=int,
+        default=4096,
+        help="Maximum size of extra files in bytes (default: 4096)",
+    )
+    bench_parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Write the JSON report to FILE instead of stdout",
+    )
+    bench_parser.add_argument(
+        "--keep",
+        metavar="DIR",
+        help="Generate the fleet in DIR and keep it (default: temporary directory)",
+    )
+    bench_parser.set_defaults(func=run_bench)
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    """
+    Run the bench command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 = success, 1 = error).
+    """
+    for name in ("missing_rate", "alternative_rate"):
+        if not 0 <= getattr(args, name) <= 1:
+            option = name.replace("_", "-")
+            console.print(f"[red]Error: --{option} must be between 0 and 1[/red]")
+            return 1
+    if min(args.projects, args.max_extra_files, args.max_file_size) < 0:
+        console.print("[red]Error: counts and sizes must not be negative[/red]")
+        return 1
+
+    spec = FleetSpec(
+        projects_per_type=args.projects,
+        project_types=[ProjectType(t) for t in args.type]
+        if args.type
+        else list(BENCH_TYPES),
+        missing_rate=args.missing_rate,
+        alternative_rate=args.alternative_rate,
+        max_extra_files=args.max_extra_files,
+        max_file_size=args.max_file_size,
+        seed=args.seed,
+    )
+    render = new_project_renderer()
+
+    if args.keep:
+        root = Path(args.keep)
+        if root.exists() and any(root.iterdir()):
+            console.print(f"[red]Error: {root} is not empty[/red]")
+            return 1
+        benchmark = run_benchmark(root, spec, render)
+    else:
+        with tempfile.TemporaryDirectory(prefix="projinit-bench-") as tmp:
+            benchmark = run_benchmark(Path(tmp), spec, render)
+
+    document = json.dumps(benchmark.to_dict(), indent=2)
+    if args.output:
+        Path(args.output).write_text(document + "\n", encoding="utf-8")
+        console.print(
+            f"[green]✓[/green] {benchmark.projects} project(s) benchmarked, "
+            f"report written to {args.output}"
+        )
+    else:
+        print(document)
+    return 0
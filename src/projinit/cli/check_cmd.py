@@ -2,16 +2,56 @@
 
 import argparse
 import sys
+import time
+from functools import cache
 from pathlib import Path
-
-from rich.console import Console
+from typing import TYPE_CHECKING
 
 from projinit.core.checker import Checker
 from projinit.core.detector import detect_project_type
-from projinit.core.models import ProjectType
-from projinit.core.reporter import Reporter
+from projinit.core.memprofile import MemoryProfiler, NullProfiler
+from projinit.core.models import AuditReport, ProjectType
+from projinit.core.reporter import NdjsonReporter, Reporter
+from projinit.core.tracing import span
+from projinit.standards.loader import get_checks_for_type
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from projinit.core.drift import DriftChecker
+    from projinit.core.history import HistoryStore
+    from projinit.core.metrics import MetricsFile
+    from projinit.core.results import ResultTable
+
+FORMATS = ["auto", "text", "plain", "json", "markdown", "ndjson"]
+
+
+@cache
+def _console() -> "Console":
+    """Get the rich console (only imported for the rich text format)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _message(output_format: str, text: str, style: str = "") -> None:
+    """
+    Print a status message.
+
+    The rich text format gets a styled message on stdout; every other format
+    gets plain text on stderr, so stdout stays parseable and rich unused.
+    """
+    if output_format == "text":
+        _console().print(f"[{style}]{text}[/{style}]" if style else text)
+    else:
+        print(text, file=sys.stderr)
+
 
-console = Console()
+def resolve_format(output_format: str) -> str:
+    """Resolve "auto" to rich text on a terminal and plain text otherwise."""
+    if output_format == "auto":
+        return "text" if sys.stdout.isatty() else "plain"
+    return output_format
 
 
 def add_check_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -24,9 +64,9 @@ def add_check_parser(subparsers: argparse._SubParsersAction) -> None:
     check_parser.add_argument(
         "path",
         type=str,
-        nargs="?",
-        default=".",
-        help="Path to the project to check (default: current directory)",
+        nargs="*",
+        default=["."],
+        help="Path(s) of the project(s) to check (default: current directory)",
     )
     check_parser.add_argument(
         "-t",
@@ -39,9 +79,12 @@ def add_check_parser(subparsers: argparse._SubParsersAction) -> None:
         "-f",
         "--format",
         type=str,
-        choices=["text", "json", "markdown"],
-        default="text",
-        help="Output format (default: text)",
+        choices=FORMATS,
+        default="auto",
+        help=(
+            "Output format (default: auto = text on a terminal, plain otherwise; "
+            "ndjson streams one record per check)"
+        ),
     )
     check_parser.add_argument(
         "-v",
@@ -49,6 +92,49 @@ def add_check_parser(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Show detailed information and suggestions",
     )
+    check_parser.add_argument(
+        "--drift",
+        action="store_true",
+        help="Compare templated files to their templates (similarity score)",
+    )
+    check_parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Append results to the history database (see history)",
+    )
+    check_parser.add_argument(
+        "--record-db",
+        metavar="FILE",
+        help=(
+            "History database for --record, implies --record "
+            "(default: ~/.local/share/projinit/history.db)"
+        ),
+    )
+    check_parser.add_argument(
+        "--export",
+        metavar="FILE",
+        help="Save results as a compact columnar file (see stats, diff-report)",
+    )
+    check_parser.add_argument(
+        "--memprofile",
+        metavar="FILE",
+        help="Profile memory per project and phase (tracemalloc), saved as JSON",
+    )
+    check_parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help=(
+            "Write conformity gauges for the Prometheus textfile collector, "
+            "updated as projects complete"
+        ),
+    )
+    check_parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=5.0,
+        metavar="SECONDS",
+        help="Minimum time between two updates of --metrics-file (default: 5)",
+    )
     check_parser.set_defaults(func=run_check)
 
 
@@ -56,63 +142,322 @@ def run_check(args: argparse.Namespace) -> int:
     """
     Run the check command.
 
+    Several projects can be checked in one run; the exit code is then the
+    worst one.
+
     Args:
         args: Parsed command-line arguments.
 
     Returns:
         Exit code (0 = compliant, 1 = non-compliant, 2 = error).
     """
-    project_path = Path(args.path).resolve()
+    paths = args.path if isinstance(args.path, list) else [args.path]
+    paths = paths or ["."]
+    output_format = resolve_format(args.format)
+    args.format = output_format
 
-    # Validate path
-    if not project_path.is_dir():
-        console.print(f"[red]Error: {project_path} is not a directory[/red]")
+    if output_format == "json" and len(paths) > 1:
+        _message(
+            output_format,
+            "Error: -f json takes a single project, use -f ndjson to check several",
+            "red",
+        )
         return 2
 
-    # Detect or use specified project type
+    # Shared by all projects: identical templates and contexts render once
+    drift_checker = None
+    if getattr(args, "drift", False):
+        from projinit.core.drift import DriftChecker
+
+        drift_checker = DriftChecker()
+
+    profiler = NullProfiler()
+    if getattr(args, "memprofile", None):
+        profiler = MemoryProfiler()
+        profiler.start()
+
+    sinks = _ReportSinks(args)
+    if args.format == "ndjson":
+        exit_code = _run_ndjson(paths, args, drift_checker, sinks, profiler)
+    else:
+        exit_code = 0
+        for path in paths:
+            project_path = Path(path).resolve()
+            with profiler.repo(project_path):
+                code = _check_project(
+                    project_path, args, drift_checker, sinks, profiler
+                )
+            exit_code = max(exit_code, code)
+
+    if isinstance(profiler, MemoryProfiler):
+        profiler.save(Path(args.memprofile))
+        _message(args.format, f"Memory profile written to {args.memprofile}", "dim")
+    return max(exit_code, sinks.close())
+
+
+class _ReportSinks:
+    """
+    Destinations of finished audit reports: metrics file, history database
+    and exported result file.
+
+    Each report is handed over as soon as its checks complete and is not
+    kept afterwards, so a streamed run over a fleet keeps a constant memory
+    footprint (only the compact export table grows, when --export is set).
+    """
+
+    metrics: "MetricsFile | None"
+    store: "HistoryStore | None"
+    table: "ResultTable | None"
+
+    def __init__(self, args: argparse.Namespace):
+        """
+        Open the destinations selected on the command line.
+
+        Args:
+            args: Parsed command-line arguments.
+        """
+        self.output_format = args.format
+        self.exit_code = 0
+
+        self.metrics = None
+        self.metrics_path = getattr(args, "metrics_file", None)
+        if self.metrics_path:
+            from projinit.core.metrics import MetricsFile
+
+            self.metrics = MetricsFile(
+                Path(self.metrics_path), getattr(args, "metrics_interval", 5.0)
+            )
+
+        self.store = None
+        self.recorded = 0
+        self.recorded_at = time.time()
+        self.db_path: Path | None = None
+        if getattr(args, "record", False) or getattr(args, "record_db", None):
+            self._open_history(getattr(args, "record_db", None))
+
+        self.table = None
+        self.export_path = getattr(args, "export", None)
+        if self.export_path:
+            from projinit.core.results import ResultTable
+
+            self.table = ResultTable()
+
+    def _open_history(self, db: str | None) -> None:
+        """Open the history database (an error is reported and disables it)."""
+        import sqlite3
+
+        from projinit.core.history import DEFAULT_HISTORY_DB, HistoryStore
+
+        self.db_path = Path(db).expanduser() if db else DEFAULT_HISTORY_DB
+        try:
+            self.store = HistoryStore(self.db_path)
+        except (sqlite3.Error, OSError) as e:
+            self._record_failed(e)
+
+    def _record_failed(self, error: Exception) -> None:
+        """Report a history database error and stop recording."""
+        _message(
+            self.output_format,
+            f"Error: cannot record in {self.db_path}: {error}",
+            "red",
+        )
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+        self.exit_code = 2
+
+    def add(self, report: AuditReport) -> None:
+        """Send a finished report to every destination."""
+        if self.metrics is not None:
+            self.metrics.add(report)
+        if self.store is not None:
+            import sqlite3
+
+            try:
+                self.recorded += self.store.record([report], self.recorded_at)
+            except (sqlite3.Error, OSError) as e:
+                self._record_failed(e)
+        if self.table is not None:
+            self.table.add_report(report)
+
+    def close(self) -> int:
+        """
+        Flush and close the destinations.
+
+        Returns:
+            0 on success, 2 if the history database could not be written.
+        """
+        if self.metrics is not None:
+            self.metrics.write()
+            _message(
+                self.output_format, f"Metrics written to {self.metrics_path}", "dim"
+            )
+        if self.store is not None:
+            self.store.close()
+            _message(
+                self.output_format,
+                f"Recorded {self.recorded} audit(s) in {self.db_path}",
+                "dim",
+            )
+        if self.table is not None:
+            from projinit.core.resultfile import write_result_file
+
+            write_result_file(self.table, Path(self.export_path))
+            _message(
+                self.output_format,
+                f"Exported {len(self.table.projects)} audit(s) to {self.export_path}",
+                "dim",
+            )
+        return self.exit_code
+
+
+def _resolve_project_type(
+    project_path: Path, args: argparse.Namespace
+) -> ProjectType | None:
+    """Get the forced or detected project type (None if undetectable)."""
     if args.type:
         project_type = ProjectType(args.type)
         if args.verbose:
-            console.print(
-                f"[dim]Using specified project type: {project_type.display_name}[/dim]"
+            _message(
+                args.format,
+                f"Using specified project type: {project_type.display_name}",
+                "dim",
             )
-    else:
-        detection = detect_project_type(project_path)
-        project_type = detection.project_type
+        return project_type
 
-        if args.verbose:
-            console.print(
-                f"[dim]Detected project type: {project_type.display_name} "
-                f"(confidence: {detection.confidence:.0%})[/dim]"
+    detection = detect_project_type(project_path)
+    project_type = detection.project_type
+
+    if args.verbose:
+        _message(
+            args.format,
+            f"Detected project type: {project_type.display_name} "
+            f"(confidence: {detection.confidence:.0%})",
+            "dim",
+        )
+        if detection.markers_found:
+            _message(
+                args.format,
+                f"Markers found: {', '.join(detection.markers_found)}",
+                "dim",
             )
-            if detection.markers_found:
-                console.print(
-                    f"[dim]Markers found: {', '.join(detection.markers_found)}[/dim]"
-                )
 
-        if project_type == ProjectType.UNKNOWN:
-            console.print("[yellow]Warning: Could not detect project type[/yellow]")
-            console.print("[dim]Use --type to specify the project type manually[/dim]")
-            return 2
+    if project_type == ProjectType.UNKNOWN:
+        return None
+    return project_type
+
+
+def _check_project(
+    project_path: Path,
+    args: argparse.Namespace,
+    drift_checker: "DriftChecker | None",
+    sinks: _ReportSinks,
+    profiler: MemoryProfiler | NullProfiler,
+) -> int:
+    """Check one project, print its report and send it to sinks."""
+    # Validate path
+    if not project_path.is_dir():
+        _message(args.format, f"Error: {project_path} is not a directory", "red")
+        return 2
+
+    # Detect or use specified project type
+    project_type = _resolve_project_type(project_path, args)
+    if project_type is None:
+        _message(args.format, "Warning: Could not detect project type", "yellow")
+        _message(args.format, "Use --type to specify the project type manually", "dim")
+        return 2
+    profiler.phase("detection")
 
     # Run checks
-    checker = Checker(project_path, project_type)
-    report = checker.run_checks()
+    with span(
+        "audit", "check", repo=str(project_path), project_type=project_type.value
+    ):
+        checks = get_checks_for_type(project_type)
+        profiler.phase("standards")
+        checker = Checker(project_path, project_type, checks)
+        report = checker.run_checks()
+    sinks.add(report)
+    profiler.phase("checks")
+
+    # Compare templated files to their templates
+    drift = None
+    if drift_checker:
+        with span("drift", "render", repo=str(project_path)):
+            drift = drift_checker.check(project_path, project_type)
 
     # Generate output
-    reporter = Reporter(report, verbose=args.verbose)
+    reporter = Reporter(report, verbose=args.verbose, drift=drift)
 
-    if args.format == "json":
-        print(reporter.to_json())
-    elif args.format == "markdown":
-        print(reporter.to_markdown())
-    else:
-        reporter.to_text()
+    with span("report", "render", format=args.format):
+        if args.format == "json":
+            print(reporter.to_json())
+        elif args.format == "markdown":
+            print(reporter.to_markdown())
+        elif args.format == "plain":
+            reporter.to_plain()
+        else:
+            reporter.to_text()
+    profiler.phase("reporting")
 
     # Return appropriate exit code
     return 0 if report.is_compliant else 1
 
 
+def _run_ndjson(
+    paths: list[str],
+    args: argparse.Namespace,
+    drift_checker: "DriftChecker | None",
+    sinks: _ReportSinks,
+    profiler: MemoryProfiler | NullProfiler,
+) -> int:
+    """
+    Stream NDJSON records for each project as checks complete.
+
+    Check records are written while the checks run: for memory profiles,
+    the "checks" phase includes them and "reporting" covers drift records.
+    """
+    reporter = NdjsonReporter()
+    exit_code = 0
+
+    for path in paths:
+        project_path = Path(path).resolve()
+        with profiler.repo(project_path):
+            if not project_path.is_dir():
+                reporter.error(project_path, "not a directory")
+                exit_code = 2
+                continue
+
+            if args.type:
+                project_type = ProjectType(args.type)
+            else:
+                project_type = detect_project_type(project_path).project_type
+            if project_type == ProjectType.UNKNOWN:
+                reporter.error(project_path, "could not detect project type")
+                exit_code = 2
+                continue
+            profiler.phase("detection")
+
+            with span(
+                "audit",
+                "check",
+                repo=str(project_path),
+                project_type=project_type.value,
+            ):
+                checks = get_checks_for_type(project_type)
+                profiler.phase("standards")
+                report = reporter.audit(Checker(project_path, project_type, checks))
+            sinks.add(report)
+            profiler.phase("checks")
+            if drift_checker:
+                with span("drift", "render", repo=str(project_path)):
+                    reporter.drift(drift_checker.check(project_path, project_type))
+            profiler.phase("reporting")
+            if not report.is_compliant:
+                exit_code = max(exit_code, 1)
+
+    return exit_code
+
+
 def main() -> None:
     """Standalone entry point for check command."""
     parser = argparse.ArgumentParser(
@@ -123,9 +468,9 @@ def main() -> None:
     parser.add_argument(
         "path",
         type=str,
-        nargs="?",
-        default=".",
-        help="Path to the project to check (default: current directory)",
+        nargs="*",
+        default=["."],
+        help="Path(s) of the project(s) to check (default: current directory)",
     )
     parser.add_argument(
         "-t",
@@ -138,9 +483,12 @@ def main() -> None:
         "-f",
         "--format",
         type=str,
-        choices=["text", "json", "markdown"],
-        default="text",
-        help="Output format (default: text)",
+        choices=FORMATS,
+        default="auto",
+        help=(
+            "Output format (default: auto = text on a terminal, plain otherwise; "
+            "ndjson streams one record per check)"
+        ),
     )
     parser.add_argument(
         "-v",
@@ -148,6 +496,49 @@ def main() -> None:
         action="store_true",
         help="Show detailed information and suggestions",
     )
+    parser.add_argument(
+        "--drift",
+        action="store_true",
+        help="Compare templated files to their templates (similarity score)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Append results to the history database (see history)",
+    )
+    parser.add_argument(
+        "--record-db",
+        metavar="FILE",
+        help=(
+            "History database for --record, implies --record "
+            "(default: ~/.local/share/projinit/history.db)"
+        ),
+    )
+    parser.add_argument(
+        "--export",
+        metavar="FILE",
+        help="Save results as a compact columnar file (see stats, diff-report)",
+    )
+    parser.add_argument(
+        "--memprofile",
+        metavar="FILE",
+        help="Profile memory per project and phase (tracemalloc), saved as JSON",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help=(
+            "Write conformity gauges for the Prometheus textfile collector, "
+            "updated as projects complete"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=5.0,
+        metavar="SECONDS",
+        help="Minimum time between two updates of --metrics-file (default: 5)",
+    )
 
     args = parser.parse_args()
     sys.exit(run_check(args))
@@ -0,0 +1,101 @@
+"""Diff-report command for projinit v2.0."""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from projinit.core.diff import ChangeKind, DiffSummary, Transition, diff_reports
+from projinit.core.reporter import NdjsonReporter
+
+
+def add_diff_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the diff-report subcommand to the parser."""
+    diff_parser = subparsers.add_parser(
+        "diff-report",
+        help="Show check results that changed between two reports",
+        description=(
+            "Compare two reports saved with `projinit check -f json` or "
+            "`-f ndjson` and show the checks whose status changed."
+        ),
+    )
+    diff_parser.add_argument("old", type=str, help="Earlier report")
+    diff_parser.add_argument("new", type=str, help="Later report")
+    diff_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Output format (default: text; ndjson streams one record per change)",
+    )
+    diff_parser.add_argument(
+        "-r",
+        "--regressions",
+        action="store_true",
+        help="Only show checks that went from passed to failed or warning",
+    )
+    diff_parser.set_defaults(func=run_diff_report)
+
+
+def run_diff_report(args: argparse.Namespace) -> int:
+    """
+    Run the diff-report command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 = no regression, 1 = regressions found, 2 = error).
+    """
+    summary = DiffSummary()
+    collected: list[dict] = []
+    ndjson = NdjsonReporter() if args.format == "ndjson" else None
+
+    try:
+        for transition in diff_reports(Path(args.old), Path(args.new)):
+            summary.count(transition)
+            if args.regressions and not transition.is_regression:
+                continue
+            if ndjson:
+                ndjson.write({"type": "transition", **transition.to_dict()})
+            elif args.format == "json":
+                collected.append(transition.to_dict())
+            else:
+                print(_format_transition(transition))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: cannot read report: {e}", file=sys.stderr)
+        return 2
+
+    if ndjson:
+        ndjson.write({"type": "summary", **asdict(summary)})
+    elif args.format == "json":
+        print(
+            json.dumps({"summary": asdict(summary), "transitions": collected}, indent=2)
+        )
+    else:
+        print(
+            f"{summary.regressions} regression(s), {summary.fixes} fix(es), "
+            f"{summary.changed} changed, {summary.added} added, "
+            f"{summary.removed} removed"
+        )
+    return 1 if summary.regressions else 0
+
+
+def _format_transition(transition: Transition) -> str:
+    """Format a transition as one plain text line."""
+    if transition.kind == ChangeKind.CHANGED:
+        if transition.is_regression:
+            label = "REGRESSED"
+        elif transition.is_fix:
+            label = "FIXED"
+        else:
+            label = "CHANGED"
+    else:
+        label = transition.kind.value.upper()
+    old = transition.old.value if transition.old else "-"
+    new = transition.new.value if transition.new else "-"
+    return (
+        f"{label:<9}  {old:>7} -> {new:<7}  {transition.project}  {transition.check_id}"
+    )
@@ -0,0 +1,203 @@
+"""History command for projinit v2.0."""
+
+import argparse
+import json
+import re
+import time
+from contextlib import closing
+from dataclasses import asdict
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from projinit.core.history import DEFAULT_HISTORY_DB, HistoryStore
+
+console = Console()
+
+_DURATION_PATTERN = re.compile(r"^(\d+)([hdw])$")
+_DURATION_SECONDS = {"h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def add_history_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the history subcommand to the parser."""
+    history_parser = subparsers.add_parser(
+        "history",
+        help="Query recorded audits (see check --record)",
+        description="Query conformity trends recorded with `projinit check --record`.",
+    )
+    history_parser.add_argument(
+        "--db",
+        type=str,
+        default=str(DEFAULT_HISTORY_DB),
+        help=f"History database (default: {DEFAULT_HISTORY_DB})",
+    )
+    history_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+
+    history_subparsers = history_parser.add_subparsers(dest="history_command")
+
+    # history score
+    score_parser = history_subparsers.add_parser(
+        "score",
+        help="Show the score of a project over time",
+    )
+    score_parser.add_argument(
+        "path",
+        type=str,
+        nargs="?",
+        default=".",
+        help="Project path (default: current directory)",
+    )
+    score_parser.add_argument(
+        "--since",
+        type=str,
+        help="Only runs since a duration (e.g. 30d, 12h, 2w) or an ISO date",
+    )
+
+    # history regressions
+    regressions_parser = history_subparsers.add_parser(
+        "regressions",
+        help="Show checks that stopped passing",
+    )
+    regressions_parser.add_argument(
+        "--since",
+        type=str,
+        default="7d",
+        help="Window: duration (e.g. 7d, 12h, 2w) or ISO date (default: 7d)",
+    )
+    regressions_parser.add_argument(
+        "--check",
+        type=str,
+        metavar="CHECK_ID",
+        help="Only report this check",
+    )
+
+    # history worst
+    worst_parser = history_subparsers.add_parser(
+        "worst",
+        help="Show the projects with the lowest latest score",
+    )
+    worst_parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of projects (default: 10)",
+    )
+
+    history_parser.set_defaults(func=run_history)
+
+
+def parse_since(value: str, now: float | None = None) -> float:
+    """
+    Convert a --since value to a Unix timestamp.
+
+    Args:
+        value: Duration back from now ("7d", "12h", "2w") or ISO date.
+        now: Reference timestamp (defaults to now).
+
+    Returns:
+        Unix timestamp.
+
+    Raises:
+        ValueError: If the value is neither a duration nor a date.
+    """
+    match = _DURATION_PATTERN.match(value.strip())
+    if match:
+        seconds = int(match.group(1)) * _DURATION_SECONDS[match.group(2)]
+        return (time.time() if now is None else now) - seconds
+    return datetime.fromisoformat(value.strip()).timestamp()
+
+
+def run_history(args: argparse.Namespace) -> int:
+    """
+    Run the history command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 = success, 1 = error).
+    """
+    if getattr(args, "history_command", None) is None:
+        console.print(
+            "[yellow]Usage: projinit history {score|regressions|worst}[/yellow]"
+        )
+        return 1
+
+    db_path = Path(args.db).expanduser()
+    if not db_path.is_file():
+        console.print(f"[red]Error: no history database at {db_path}[/red]")
+        console.print("[dim]Record audits with: projinit check --record[/dim]")
+        return 1
+
+    try:
+        since = parse_since(args.since) if getattr(args, "since", None) else None
+    except ValueError:
+        console.print(f"[red]Error: invalid --since value: {args.since}[/red]")
+        return 1
+
+    with closing(HistoryStore(db_path)) as store:
+        if args.history_command == "score":
+            project = str(Path(args.path).resolve())
+            rows = store.score_history(project, since)
+            title = f"Score history: {project}"
+        elif args.history_command == "regressions":
+            rows = store.regressions(since, args.check)
+            title = "Regressions since " + _format_time(since)
+        else:
+            rows = store.worst_projects(args.limit)
+            title = "Worst projects (latest run)"
+
+    if args.format == "json":
+        print(json.dumps([asdict(row) for row in rows], indent=2, default=_json_value))
+    else:
+        _print_table(title, rows)
+    return 0
+
+
+def _json_value(value):
+    """Serialize enums in JSON output."""
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _format_time(timestamp: float) -> str:
+    """Format a Unix timestamp for display."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def _print_table(title: str, rows: list) -> None:
+    """Print query results as a table."""
+    if not rows:
+        console.print(f"[dim]{title}: no recorded runs[/dim]")
+        return
+
+    table = Table(title=title)
+    columns = list(asdict(rows[0]))
+    for column in columns:
+        table.add_column(column.replace("_", " "))
+    for row in rows:
+        values = asdict(row)
+        cells = []
+        for column in columns:
+            value = values[column]
+            if column == "recorded_at":
+                value = _format_time(value)
+            elif column == "score":
+                value = f"{value:.1f}%"
+            elif isinstance(value, Enum):
+                value = value.value
+            cells.append(str(value))
+        table.add_row(*cells)
+    console.print(table)
@@ -1,26 +1,43 @@
 """Init command for projinit v2.0 - Create new projects from standards."""
 
 import argparse
+import os
 import re
 import shutil
-import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import questionary
-from jinja2 import Environment, PackageLoader
+import yaml
+from jinja2 import Environment
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from projinit.core.config import load_config
+from projinit.core.fragments import gitignore_content, precommit_content
 from projinit.core.models import ProjectType
+from projinit.core.steps import run_post_generation
+from projinit.core.templates import (
+    add_custom_files,
+    create_template_env,
+    resolve_templates_dir,
+)
+from projinit.core.tracing import traced
+from projinit.core.tree import ArchiveSink, DiskSink, VirtualTree, archive_format
 
 console = Console()
 
 # Default path for secrets in pass
 DEFAULT_PASS_SECRET_PATH = "projects/secrets"
 
+# Project types that can be created
+CREATABLE_TYPES = [pt.value for pt in ProjectType if pt != ProjectType.UNKNOWN]
+
 
 def add_init_parser(subparsers: argparse._SubParsersAction) -> None:
     """Add the init subcommand to the parser."""
@@ -39,7 +56,7 @@ def add_init_parser(subparsers: argparse._SubParsersAction) -> None:
         "-t",
         "--type",
         type=str,
-        choices=[pt.value for pt in ProjectType if pt != ProjectType.UNKNOWN],
+        choices=CREATABLE_TYPES,
         help="Project type (will be prompted if not provided)",
     )
     init_parser.add_argument(
@@ -84,6 +101,29 @@ def add_init_parser(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Disable direnv + pass",
     )
+    init_parser.add_argument(
+        "--manifest",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Create every project listed in a YAML manifest (non-interactive)",
+    )
+    init_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of projects generated in parallel with --manifest "
+        "(default: CPU count)",
+    )
+    init_parser.add_argument(
+        "--output-archive",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Write the project into an archive (.tar, .tar.gz, .tar.xz, "
+        ".tar.bz2, .tar.zst, .zip) instead of a directory; skips git and direnv",
+    )
     init_parser.set_defaults(func=run_init)
 
 
@@ -107,6 +147,28 @@ def run_init(args: argparse.Namespace) -> int:
     )
     console.print()
 
+    output_archive = getattr(args, "output_archive", None)
+
+    # Batch mode
+    if getattr(args, "manifest", None):
+        if args.name:
+            console.print(
+                "[red]A project name cannot be combined with --manifest[/red]"
+            )
+            return 1
+        if output_archive:
+            console.print("[red]--output-archive cannot be used with --manifest[/red]")
+            return 1
+        return run_manifest(args)
+
+    # Validate archive format before asking anything
+    if output_archive:
+        try:
+            archive_format(Path(output_archive))
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            return 1
+
     # Get project name
     project_name = args.name
     if not project_name:
@@ -147,18 +209,23 @@ def run_init(args: argparse.Namespace) -> int:
     elif not args.yes:
         use_direnv = _ask_direnv()
 
-    # Validate direnv requirements if enabled
-    if use_direnv and not _check_direnv_requirements():
+    # Validate direnv requirements if enabled (direnv is not run for archives)
+    if use_direnv and not output_archive and not _check_direnv_requirements():
         return 1
 
-    # Determine target directory
-    parent_path = Path(args.path).resolve()
-    target_dir = parent_path / project_name
+    # Determine target directory, or archive
+    sink = None
+    if output_archive:
+        target_dir = Path(output_archive).resolve()
+        sink = ArchiveSink(target_dir, prefix=project_name)
+    else:
+        parent_path = Path(args.path).resolve()
+        target_dir = parent_path / project_name
 
-    # Check if directory exists
-    if target_dir.exists():
-        console.print(f"[red]Directory already exists: {target_dir}[/red]")
-        return 1
+        # Check if directory exists
+        if target_dir.exists():
+            console.print(f"[red]Directory already exists: {target_dir}[/red]")
+            return 1
 
     # Show summary
     _display_summary(project_name, project_type, description, target_dir, use_direnv)
@@ -173,27 +240,36 @@ def run_init(args: argparse.Namespace) -> int:
     # Generate project
     console.print()
     with console.status("[bold blue]Creating project...[/bold blue]"):
-        success = _generate_project(
+        tree = _generate_project(
             project_name=project_name,
             project_type=project_type,
             description=description,
             target_dir=target_dir,
             use_direnv=use_direnv,
+            sink=sink,
+            templates_dir=_custom_templates_dir(),
         )
 
-    if not success:
+    if tree is None:
         console.print("[red]Failed to create project[/red]")
         return 1
 
-    # Initialize git
-    if not args.no_git:
-        with console.status("[bold blue]Initializing git...[/bold blue]"):
-            _init_git(target_dir)
+    if sink:
+        console.print()
+        console.print(
+            f"[green]Project '{project_name}' written to {target_dir}[/green]"
+        )
+        return 0
 
-    # Allow direnv if enabled
-    if use_direnv:
-        with console.status("[bold blue]Configuring direnv...[/bold blue]"):
-            _allow_direnv(target_dir)
+    # Initialize git and allow direnv (if enabled), concurrently
+    with console.status("[bold blue]Initializing git and direnv...[/bold blue]"):
+        steps = run_post_generation(
+            target_dir, tree, init_git=not args.no_git, allow_direnv=use_direnv
+        )
+    if steps.get("git") is False:
+        console.print("[yellow]Warning: git initialization failed[/yellow]")
+    if steps.get("direnv") is False:
+        console.print("[yellow]Warning: direnv allow failed[/yellow]")
 
     console.print()
     console.print(f"[green]Project '{project_name}' created successfully![/green]")
@@ -336,60 +412,113 @@ def _get_files_for_type(project_type: ProjectType) -> list[str]:
     return common + type_specific.get(project_type, [])
 
 
+def _custom_templates_dir() -> Path | None:
+    """Get the custom templates directory from the configuration, if any."""
+    return resolve_templates_dir(load_config().templates.templates_dir)
+
+
+def _create_template_env() -> Environment:
+    """Create the Jinja2 environment used to render project templates."""
+    return create_template_env()
+
+
 def _generate_project(
     project_name: str,
     project_type: ProjectType,
     description: str,
     target_dir: Path,
     use_direnv: bool = False,
-) -> bool:
-    """Generate project files based on type."""
+    env: Environment | None = None,
+    sink: DiskSink | ArchiveSink | None = None,
+    templates_dir: Path | None = None,
+) -> VirtualTree | None:
+    """
+    Generate project files based on type.
+
+    The project is rendered in memory, then written in one pass by the
+    sink (target_dir on disk by default).
+
+    Returns:
+        The rendered tree, or None on failure.
+    """
     try:
-        env = Environment(
-            loader=PackageLoader("projinit", "templates"),
-            keep_trailing_newline=True,
+        tree = _build_project_tree(
+            env or _create_template_env(),
+            project_name,
+            project_type,
+            description,
+            use_direnv,
+            templates_dir,
         )
-
-        # Common context
-        project_name_snake = project_name.replace("-", "_")
-        context = {
-            "project_name": project_name,
-            "project_name_snake": project_name_snake,
-            "project_type": project_type.value,
-            "project_type_display": project_type.display_name,
-            "description": description,
-            "year": datetime.now().year,
-            "python_version": "3.10",
-            "use_direnv": use_direnv,
-        }
-
-        # Create base directory
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate common files
-        _generate_common_files(env, target_dir, context, project_type, use_direnv)
-
-        # Generate type-specific files
-        if project_type in (ProjectType.PYTHON_CLI, ProjectType.PYTHON_LIB):
-            _generate_python_project(env, target_dir, context, project_type)
-        elif project_type == ProjectType.NODE_FRONTEND:
-            _generate_node_project(env, target_dir, context)
-        elif project_type == ProjectType.INFRASTRUCTURE:
-            _generate_infra_project(env, target_dir, context)
-        elif project_type == ProjectType.DOCUMENTATION:
-            _generate_docs_project(env, target_dir, context)
-        elif project_type == ProjectType.LAB:
-            _generate_lab_project(env, target_dir, context)
-
-        return True
+        (sink or DiskSink(target_dir)).write(tree)
+        return tree
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
-        return False
+        return None
+
+
+@traced(
+    "render_project",
+    "render",
+    lambda env, project_name, project_type, *_, **__: {
+        "project": project_name,
+        "project_type": project_type.value,
+    },
+)
+def _build_project_tree(
+    env: Environment,
+    project_name: str,
+    project_type: ProjectType,
+    description: str,
+    use_direnv: bool = False,
+    templates_dir: Path | None = None,
+) -> VirtualTree:
+    """
+    Render all project files into an in-memory tree, raising on failure.
+
+    Files from a custom templates directory are added last, replacing
+    generated files with the same path.
+    """
+    tree = VirtualTree()
+
+    # Common context
+    project_name_snake = project_name.replace("-", "_")
+    context = {
+        "project_name": project_name,
+        "project_name_snake": project_name_snake,
+        "project_type": project_type.value,
+        "project_type_display": project_type.display_name,
+        "description": description,
+        "year": datetime.now().year,
+        "python_version": "3.10",
+        "use_direnv": use_direnv,
+    }
+
+    # Generate common files
+    _generate_common_files(env, tree, context, project_type, use_direnv)
+
+    # Generate type-specific files
+    if project_type in (ProjectType.PYTHON_CLI, ProjectType.PYTHON_LIB):
+        _generate_python_project(env, tree, context, project_type)
+    elif project_type == ProjectType.NODE_FRONTEND:
+        _generate_node_project(env, tree, context)
+    elif project_type == ProjectType.INFRASTRUCTURE:
+        _generate_infra_project(env, tree, context)
+    elif project_type == ProjectType.DOCUMENTATION:
+        _generate_docs_project(env, tree, context)
+    elif project_type == ProjectType.LAB:
+        _generate_lab_project(env, tree, context)
+
+    # Add files from the custom templates directory
+    if templates_dir:
+        add_custom_files(tree, templates_dir, project_type.value, context)
+
+    return tree
 
 
 def _generate_common_files(
     env: Environment,
-    target_dir: Path,
+    tree: VirtualTree,
     context: dict,
     project_type: ProjectType,
     use_direnv: bool = False,
@@ -397,15 +526,15 @@ def _generate_common_files(
     """Generate files common to all project types."""
     # README.md
     template = env.get_template("README.md.j2")
-    (target_dir / "README.md").write_text(template.render(**context))
+    tree.write("README.md", template.render(**context))
 
     # LICENSE
     template = env.get_template("LICENSE.j2")
-    (target_dir / "LICENSE").write_text(template.render(**context))
+    tree.write("LICENSE", template.render(**context))
 
     # CLAUDE.md
     template = env.get_template("CLAUDE.md.j2")
-    (target_dir / "CLAUDE.md").write_text(template.render(**context))
+    tree.write("CLAUDE.md", template.render(**context))
 
     # .gitignore - select appropriate technologies
     tech_map = {
@@ -416,40 +545,25 @@ def _generate_common_files(
         ProjectType.DOCUMENTATION: ["python"],
     }
     technologies = tech_map.get(project_type, []) + ["ide"]
-
-    gitignore_content = env.get_template("gitignore/_common.j2").render()
-    for tech in technologies:
-        try:
-            gitignore_content += env.get_template(f"gitignore/{tech}.j2").render()
-        except Exception:
-            pass
-    (target_dir / ".gitignore").write_text(gitignore_content)
+    tree.write(".gitignore", gitignore_content(technologies))
 
     # .pre-commit-config.yaml
-    precommit_content = env.get_template("precommit/_header.j2").render()
-    for tech in technologies:
-        if tech == "ide":
-            continue
-        try:
-            precommit_content += env.get_template(f"precommit/{tech}.j2").render()
-        except Exception:
-            pass
-    (target_dir / ".pre-commit-config.yaml").write_text(precommit_content)
+    tree.write(".pre-commit-config.yaml", precommit_content(technologies))
 
     # .envrc for direnv + pass
     if use_direnv:
-        _generate_envrc(target_dir, context)
+        _generate_envrc(tree, context)
 
     # .claude/commands/
-    _generate_claude_commands(env, target_dir, context, project_type)
+    _generate_claude_commands(env, tree, context, project_type)
 
     # doc/ technical documentation
-    _generate_technical_docs(env, target_dir, context, project_type)
+    _generate_technical_docs(env, tree, context, project_type)
 
 
 def _generate_python_project(
     env: Environment,
-    target_dir: Path,
+    tree: VirtualTree,
     context: dict,
     project_type: ProjectType,
 ) -> None:
@@ -458,15 +572,16 @@ def _generate_python_project(
 
     # pyproject.toml
     template = env.get_template("pyproject.toml.j2")
-    (target_dir / "pyproject.toml").write_text(template.render(**context))
+    tree.write("pyproject.toml", template.render(**context))
 
     # Create src directory structure
-    src_dir = target_dir / "src" / project_name_snake
-    src_dir.mkdir(parents=True, exist_ok=True)
+    src_dir = PurePosixPath("src", project_name_snake)
+    tree.mkdir(src_dir)
 
     # __init__.py
-    (src_dir / "__init__.py").write_text(
-        f'"""{context["project_name"]} package."""\n\n__version__ = "0.1.0"\n'
+    tree.write(
+        src_dir / "__init__.py",
+        f'"""{context["project_name"]} package."""\n\n__version__ = "0.1.0"\n',
     )
 
     # cli.py for CLI projects
@@ -491,30 +606,31 @@ def main() -> None:
 if __name__ == "__main__":
     main()
 '''.format(name=context["project_name"], description=context["description"])
-        (src_dir / "cli.py").write_text(cli_content)
+        tree.write(src_dir / "cli.py", cli_content)
 
     # Create tests directory
-    tests_dir = target_dir / "tests"
-    tests_dir.mkdir(exist_ok=True)
-    (tests_dir / "__init__.py").write_text("")
-    (tests_dir / f"test_{project_name_snake}.py").write_text(
+    tests_dir = PurePosixPath("tests")
+    tree.mkdir(tests_dir)
+    tree.write(tests_dir / "__init__.py", "")
+    tree.write(
+        tests_dir / f"test_{project_name_snake}.py",
         f'''"""Tests for {context["project_name"]}."""
 
 def test_import():
     """Test that the package can be imported."""
     import {project_name_snake}
     assert {project_name_snake}.__version__ == "0.1.0"
-'''
+''',
     )
 
 
-def _generate_node_project(env: Environment, target_dir: Path, context: dict) -> None:
+def _generate_node_project(env: Environment, tree: VirtualTree, context: dict) -> None:
     """Generate Node.js frontend project files."""
     context["framework"] = "react"  # Default to React
 
     # package.json
     template = env.get_template("package.json.j2")
-    (target_dir / "package.json").write_text(template.render(**context))
+    tree.write("package.json", template.render(**context))
 
     # tsconfig.json
     tsconfig = """{
@@ -538,15 +654,17 @@ def _generate_node_project(env: Environment, target_dir: Path, context: dict) ->
   "include": ["src"]
 }
 """
-    (target_dir / "tsconfig.json").write_text(tsconfig)
+    tree.write("tsconfig.json", tsconfig)
 
     # Create src directory
-    src_dir = target_dir / "src"
-    src_dir.mkdir(exist_ok=True)
+    src_dir = PurePosixPath("src")
+    tree.mkdir(src_dir)
 
     # Basic index.tsx
     project_name = context["project_name"]
-    (src_dir / "main.tsx").write_text(f"""import React from 'react'
+    tree.write(
+        src_dir / "main.tsx",
+        f"""import React from 'react'
 import ReactDOM from 'react-dom/client'
 
 function App() {{
@@ -562,14 +680,17 @@ def _generate_node_project(env: Environment, target_dir: Path, context: dict) ->
     <App />
   </React.StrictMode>,
 )
-""")
+""",
+    )
 
     # Create public directory
-    public_dir = target_dir / "public"
-    public_dir.mkdir(exist_ok=True)
+    public_dir = PurePosixPath("public")
+    tree.mkdir(public_dir)
 
     # index.html
-    (target_dir / "index.html").write_text(f"""<!DOCTYPE html>
+    tree.write(
+        "index.html",
+        f"""<!DOCTYPE html>
 <html lang="en">
   <head>
     <meta charset="UTF-8" />
@@ -581,23 +702,27 @@ def _generate_node_project(env: Environment, target_dir: Path, context: dict) ->
     <script type="module" src="/src/main.tsx"></script>
   </body>
 </html>
-""")
+""",
+    )
 
     # vite.config.ts
-    (target_dir / "vite.config.ts").write_text("""import { defineConfig } from 'vite'
+    tree.write(
+        "vite.config.ts",
+        """import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
 export default defineConfig({
   plugins: [react()],
 })
-""")
+""",
+    )
 
 
-def _generate_infra_project(env: Environment, target_dir: Path, context: dict) -> None:
+def _generate_infra_project(env: Environment, tree: VirtualTree, context: dict) -> None:
     """Generate Infrastructure project files."""
     # Create terraform directory
-    tf_dir = target_dir / "terraform"
-    tf_dir.mkdir(exist_ok=True)
+    tf_dir = PurePosixPath("terraform")
+    tree.mkdir(tf_dir)
 
     # Generate terraform files using existing templates
     tf_templates = [
@@ -609,18 +734,20 @@ def _generate_infra_project(env: Environment, target_dir: Path, context: dict) -
     for template_name, output_name in tf_templates:
         try:
             template = env.get_template(template_name)
-            (tf_dir / output_name).write_text(template.render(**context))
+            tree.write(tf_dir / output_name, template.render(**context))
         except Exception:
             # Create minimal file if template not available
-            (tf_dir / output_name).write_text(f"# {output_name}\n")
+            tree.write(tf_dir / output_name, f"# {output_name}\n")
 
     # Create ansible directory
-    ansible_dir = target_dir / "ansible"
-    ansible_dir.mkdir(exist_ok=True)
-    (ansible_dir / "inventory").mkdir(exist_ok=True)
+    ansible_dir = PurePosixPath("ansible")
+    tree.mkdir(ansible_dir)
+    tree.mkdir(ansible_dir / "inventory")
 
     # Basic playbook
-    (ansible_dir / "playbook.yml").write_text(f"""---
+    tree.write(
+        ansible_dir / "playbook.yml",
+        f"""---
 - name: {context["project_name"]} playbook
   hosts: all
   become: true
@@ -629,33 +756,39 @@ def _generate_infra_project(env: Environment, target_dir: Path, context: dict) -
     - name: Example task
       ansible.builtin.debug:
         msg: "Hello from {context["project_name"]}!"
-""")
+""",
+    )
 
     # Inventory file
-    (ansible_dir / "inventory" / "hosts.yml").write_text("""---
+    tree.write(
+        ansible_dir / "inventory" / "hosts.yml",
+        """---
 all:
   hosts:
     localhost:
       ansible_connection: local
-""")
+""",
+    )
 
 
-def _generate_docs_project(env: Environment, target_dir: Path, context: dict) -> None:
+def _generate_docs_project(env: Environment, tree: VirtualTree, context: dict) -> None:
     """Generate Documentation project files."""
     # pyproject.toml for docs
     template = env.get_template("pyproject-docs.toml.j2")
-    (target_dir / "pyproject.toml").write_text(template.render(**context))
+    tree.write("pyproject.toml", template.render(**context))
 
     # mkdocs.yml
     template = env.get_template("mkdocs.yml.j2")
-    (target_dir / "mkdocs.yml").write_text(template.render(**context))
+    tree.write("mkdocs.yml", template.render(**context))
 
     # Create docs directory
-    docs_dir = target_dir / "docs"
-    docs_dir.mkdir(exist_ok=True)
+    docs_dir = PurePosixPath("docs")
+    tree.mkdir(docs_dir)
 
     # index.md
-    (docs_dir / "index.md").write_text(f"""# {context["project_name"]}
+    tree.write(
+        docs_dir / "index.md",
+        f"""# {context["project_name"]}
 
 {context["description"]}
 
@@ -677,28 +810,31 @@ def _generate_docs_project(env: Environment, target_dir: Path, context: dict) ->
 
 - `docs/` - Documentation source files
 - `mkdocs.yml` - MkDocs configuration
-""")
+""",
+    )
 
 
-def _generate_lab_project(env: Environment, target_dir: Path, context: dict) -> None:
+def _generate_lab_project(env: Environment, tree: VirtualTree, context: dict) -> None:
     """Generate Lab/Tutorial/Dojo project files."""
     # pyproject.toml for docs
     template = env.get_template("pyproject-docs.toml.j2")
-    (target_dir / "pyproject.toml").write_text(template.render(**context))
+    tree.write("pyproject.toml", template.render(**context))
 
     # mkdocs.yml
     template = env.get_template("mkdocs.yml.j2")
-    (target_dir / "mkdocs.yml").write_text(template.render(**context))
+    tree.write("mkdocs.yml", template.render(**context))
 
     # Create labs directory structure
-    labs_dir = target_dir / "labs"
-    labs_dir.mkdir(exist_ok=True)
+    labs_dir = PurePosixPath("labs")
+    tree.mkdir(labs_dir)
 
     # Create example lab
     lab01_dir = labs_dir / "01-getting-started"
-    lab01_dir.mkdir(exist_ok=True)
+    tree.mkdir(lab01_dir)
 
-    (lab01_dir / "README.md").write_text(f"""# Lab 01: Getting Started
+    tree.write(
+        lab01_dir / "README.md",
+        f"""# Lab 01: Getting Started
 
 ## Objectives
 
@@ -720,21 +856,21 @@ def _generate_lab_project(env: Environment, target_dir: Path, context: dict) ->
 ## Solutions
 
 See the `solutions/` directory for reference implementations.
-""")
+""",
+    )
 
     # Create solutions directory
-    solutions_dir = target_dir / "solutions"
-    solutions_dir.mkdir(exist_ok=True)
-    (solutions_dir / "01-getting-started" / ".gitkeep").parent.mkdir(
-        parents=True, exist_ok=True
-    )
-    (solutions_dir / "01-getting-started" / ".gitkeep").write_text("")
+    solutions_dir = PurePosixPath("solutions")
+    tree.mkdir(solutions_dir)
+    tree.write(solutions_dir / "01-getting-started" / ".gitkeep", "")
 
     # Create docs directory for mkdocs
-    docs_dir = target_dir / "docs"
-    docs_dir.mkdir(exist_ok=True)
+    docs_dir = PurePosixPath("docs")
+    tree.mkdir(docs_dir)
 
-    (docs_dir / "index.md").write_text(f"""# {context["project_name"]}
+    tree.write(
+        docs_dir / "index.md",
+        f"""# {context["project_name"]}
 
 {context["description"]}
 
@@ -755,10 +891,11 @@ def _generate_lab_project(env: Environment, target_dir: Path, context: dict) ->
 ## Prerequisites
 
 List prerequisites here.
-""")
+""",
+    )
 
 
-def _generate_envrc(target_dir: Path, context: dict) -> None:
+def _generate_envrc(tree: VirtualTree, context: dict) -> None:
     """Generate .envrc file for direnv + pass integration."""
     project_name = context["project_name"]
     secret_path = f"{DEFAULT_PASS_SECRET_PATH}/{project_name}"
@@ -778,18 +915,18 @@ def _generate_envrc(target_dir: Path, context: dict) -> None:
 # Python virtual environment (uncomment if using venv)
 # layout python3
 """
-    (target_dir / ".envrc").write_text(envrc_content)
+    tree.write(".envrc", envrc_content)
 
 
 def _generate_claude_commands(
     env: Environment,
-    target_dir: Path,
+    tree: VirtualTree,
     context: dict,
     project_type: ProjectType,
 ) -> None:
     """Generate .claude/commands/ directory with standard commands."""
-    commands_dir = target_dir / ".claude" / "commands"
-    commands_dir.mkdir(parents=True, exist_ok=True)
+    commands_dir = PurePosixPath(".claude", "commands")
+    tree.mkdir(commands_dir)
 
     # Commands common to all project types
     common_commands = [
@@ -805,20 +942,20 @@ def _generate_claude_commands(
         template_name = f"commands/{cmd}.j2"
         try:
             template = env.get_template(template_name)
-            (commands_dir / cmd).write_text(template.render(**context))
+            tree.write(commands_dir / cmd, template.render(**context))
         except Exception:
             pass
 
 
 def _generate_technical_docs(
     env: Environment,
-    target_dir: Path,
+    tree: VirtualTree,
     context: dict,
     project_type: ProjectType,
 ) -> None:
     """Generate doc/ directory with technical documentation."""
-    doc_dir = target_dir / "doc"
-    doc_dir.mkdir(parents=True, exist_ok=True)
+    doc_dir = PurePosixPath("doc")
+    tree.mkdir(doc_dir)
 
     # Documentation files to generate
     doc_files = ["README.md", "architecture.md", "development.md", "configuration.md"]
@@ -827,47 +964,284 @@ def _generate_technical_docs(
         template_name = f"doc/{doc_file}.j2"
         try:
             template = env.get_template(template_name)
-            (doc_dir / doc_file).write_text(template.render(**context))
+            tree.write(doc_dir / doc_file, template.render(**context))
         except Exception:
             pass
 
 
-def _allow_direnv(target_dir: Path) -> bool:
-    """Allow direnv for the project directory."""
-    try:
-        subprocess.run(
-            ["direnv", "allow"],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        console.print(f"[yellow]Warning: direnv allow failed: {e}[/yellow]")
-        return False
+# ---------------------------------------------------------------------------
+# Batch creation from a manifest
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ProjectSpec:
+    """A project to create, as described by a manifest entry."""
+
+    name: str
+    project_type: ProjectType
+    description: str
+    target_dir: Path
+    use_direnv: bool = False
 
 
-def _init_git(target_dir: Path) -> bool:
-    """Initialize git repository."""
+@dataclass
+class BatchResult:
+    """Outcome and timings of one project created in batch mode."""
+
+    spec: ProjectSpec
+    success: bool
+    error: str | None = None
+    git_ok: bool | None = None
+    render_time: float = 0.0
+    git_time: float = 0.0
+
+    @property
+    def total_time(self) -> float:
+        """Total wall time spent on this project."""
+        return self.render_time + self.git_time
+
+
+def load_manifest(
+    manifest_path: Path,
+    parent_path: Path,
+    default_type: str | None = None,
+    default_direnv: bool = False,
+) -> tuple[list[ProjectSpec], list[str]]:
+    """
+    Load and validate a project manifest.
+
+    The manifest is either a list of entries or a mapping with optional
+    ``defaults`` and a ``projects`` list. An entry is a project name or a
+    mapping with ``name``, ``type``, ``description``, ``direnv`` and ``path``
+    (parent directory, relative to parent_path).
+
+    Every entry is validated before anything is created, so a single bad
+    entry never leaves a half-created batch behind.
+
+    Args:
+        manifest_path: Path to the YAML manifest.
+        parent_path: Default parent directory for the projects.
+        default_type: Project type used when neither the entry nor the
+            manifest defaults specify one.
+        default_direnv: direnv setting used when not specified.
+
+    Returns:
+        Tuple of (project specs, validation errors).
+    """
     try:
-        subprocess.run(
-            ["git", "init", "-b", "main"],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
+        data = yaml.safe_load(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as e:
+        return [], [f"Cannot read manifest {manifest_path}: {e}"]
+
+    defaults: dict = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults") or {}
+        entries = data.get("projects")
+    else:
+        entries = data
+
+    if not isinstance(entries, list) or not entries:
+        return [], ["Manifest must define a non-empty list of projects"]
+    if not isinstance(defaults, dict):
+        return [], ["Manifest defaults must be a mapping"]
+
+    specs: list[ProjectSpec] = []
+    errors: list[str] = []
+    seen: dict[Path, str] = {}
+
+    for index, entry in enumerate(entries, start=1):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict):
+            errors.append(f"Entry {index}: expected a name or a mapping")
+            continue
+
+        fields = {**defaults, **entry}
+        name = fields.get("name")
+        label = f"Entry {index} ({name})" if name else f"Entry {index}"
+
+        if not isinstance(name, str) or not _is_valid_slug(name):
+            errors.append(f"{label}: invalid project name")
+            continue
+
+        type_value = fields.get("type", default_type)
+        if type_value not in CREATABLE_TYPES:
+            errors.append(f"{label}: invalid or missing project type: {type_value}")
+            continue
+
+        path = fields.get("path", ".")
+        if not isinstance(path, str):
+            errors.append(f"{label}: path must be a string: {path!r}")
+            continue
+
+        description = fields.get("description")
+        if description is not None and not isinstance(description, str):
+            errors.append(f"{label}: description must be a string: {description!r}")
+            continue
+
+        target_dir = (parent_path / path).resolve() / name
+        if target_dir in seen:
+            errors.append(f"{label}: same directory as {seen[target_dir]}")
+            continue
+        seen[target_dir] = name
+
+        if target_dir.exists():
+            errors.append(f"{label}: directory already exists: {target_dir}")
+            continue
+
+        specs.append(
+            ProjectSpec(
+                name=name,
+                project_type=ProjectType(type_value),
+                description=description or f"Project {name}",
+                target_dir=target_dir,
+                use_direnv=bool(fields.get("direnv", default_direnv)),
+            )
         )
-        subprocess.run(
-            ["git", "add", "."], cwd=target_dir, capture_output=True, check=True
+
+    return specs, errors
+
+
+def run_manifest(args: argparse.Namespace) -> int:
+    """
+    Create every project of a manifest, in parallel.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 = all projects created, 1 = error).
+    """
+    manifest_path = Path(args.manifest)
+    parent_path = Path(args.path).resolve()
+    default_direnv = bool(args.direnv) and not args.no_direnv
+
+    specs, errors = load_manifest(manifest_path, parent_path, args.type, default_direnv)
+    if errors:
+        console.print(f"[red]Invalid manifest: {manifest_path}[/red]")
+        for error in errors:
+            console.print(f"  [red]-[/red] {error}")
+        return 1
+
+    if any(spec.use_direnv for spec in specs) and not _check_direnv_requirements():
+        return 1
+
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+
+    table = Table(title=f"Projects to create ({len(specs)})")
+    table.add_column("Name", style="cyan")
+    table.add_column("Type")
+    table.add_column("Path", style="dim")
+    for spec in specs:
+        table.add_row(spec.name, spec.project_type.display_name, str(spec.target_dir))
+    console.print(table)
+    console.print()
+
+    if not args.yes:
+        confirm = questionary.confirm(
+            f"Create {len(specs)} projects?", default=True
+        ).ask()
+        if not confirm:
+            console.print("[dim]Cancelled[/dim]")
+            return 1
+
+    # One shared environment: templates are loaded and compiled only once
+    env = _create_template_env()
+    templates_dir = _custom_templates_dir()
+    init_git = not args.no_git
+
+    status = f"[bold blue]Creating {len(specs)} projects ({jobs} jobs)...[/bold blue]"
+    start = time.perf_counter()
+    with console.status(status), ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(
+            executor.map(
+                lambda spec: _create_from_spec(env, spec, init_git, templates_dir),
+                specs,
+            )
         )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit - project scaffolding"],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
+    elapsed = time.perf_counter() - start
+
+    _display_batch_results(results, init_git)
+
+    created = sum(1 for r in results if r.success)
+    color = "green" if created == len(results) else "red"
+    console.print(
+        f"[{color}]Created {created}/{len(results)} projects "
+        f"in {elapsed:.2f}s ({jobs} jobs)[/{color}]"
+    )
+    return 0 if created == len(results) else 1
+
+
+@traced(
+    "create_project",
+    "new",
+    lambda env, spec, *_, **__: {"repo": str(spec.target_dir), "project": spec.name},
+)
+def _create_from_spec(
+    env: Environment,
+    spec: ProjectSpec,
+    init_git: bool,
+    templates_dir: Path | None = None,
+) -> BatchResult:
+    """Render one manifest project, then initialize git and direnv."""
+    result = BatchResult(spec=spec, success=False)
+
+    start = time.perf_counter()
+    try:
+        tree = _build_project_tree(
+            env,
+            spec.name,
+            spec.project_type,
+            spec.description,
+            spec.use_direnv,
+            templates_dir,
         )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+        DiskSink(spec.target_dir).write(tree)
+    except Exception as e:  # noqa: BLE001 - reported per project
+        result.error = str(e)
+        return result
+    finally:
+        result.render_time = time.perf_counter() - start
+
+    result.success = True
+
+    start = time.perf_counter()
+    steps = run_post_generation(
+        spec.target_dir, tree, init_git=init_git, allow_direnv=spec.use_direnv
+    )
+    result.git_ok = steps.get("git")
+    result.git_time = time.perf_counter() - start
+
+    return result
+
+
+def _display_batch_results(results: list[BatchResult], init_git: bool) -> None:
+    """Display per-project status and timings."""
+    table = Table(title="Batch results")
+    table.add_column("Project", style="cyan")
+    table.add_column("Status")
+    table.add_column("Render", justify="right")
+    if init_git:
+        table.add_column("Git", justify="right")
+    table.add_column("Total", justify="right")
+
+    for result in results:
+        if not result.success:
+            status = f"[red]failed: {result.error}[/red]"
+        elif result.git_ok is False:
+            status = "[yellow]created (git failed)[/yellow]"
+        else:
+            status = "[green]created[/green]"
+
+        row = [result.spec.name, status, f"{result.render_time * 1000:.0f} ms"]
+        if init_git:
+            row.append(f"{result.git_time * 1000:.0f} ms")
+        row.append(f"{result.total_time * 1000:.0f} ms")
+        table.add_row(*row)
+
+    console.print()
+    console.print(table)
 
 
 def _display_next_steps(
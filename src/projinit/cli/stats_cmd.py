@@ -0,0 +1,162 @@
+"""Stats command for projinit v2.0."""
+
+import argparse
+import json
+from dataclasses import asdict
+from enum import Enum
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from projinit.core.stats import ComplianceMatrix
+
+console = Console()
+
+
+def add_stats_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the stats subcommand to the parser."""
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Summarize the conformity of a fleet of projects",
+        description=(
+            "Analyze reports saved with `projinit check -f json` or `-f ndjson`: "
+            "failure rates, co-failing checks, weighted score distribution per "
+            "project type and failure patterns. Requires numpy "
+            "(pip install projinit[stats])."
+        ),
+    )
+    stats_parser.add_argument(
+        "reports", type=str, nargs="+", metavar="REPORT", help="Saved reports"
+    )
+    stats_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    stats_parser.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=10,
+        help="Rows per section (default: 10)",
+    )
+    stats_parser.set_defaults(func=run_stats)
+
+
+def run_stats(args: argparse.Namespace) -> int:
+    """
+    Run the stats command.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 = success, 1 = error).
+    """
+    try:
+        matrix = ComplianceMatrix.from_reports(Path(p) for p in args.reports)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"[red]Error: cannot read report: {e}[/red]")
+        return 1
+
+    projects, checks = matrix.shape
+    sections = {
+        "failure_rates": matrix.failure_rates()[: args.top],
+        "co_failures": matrix.co_failures(args.top),
+        "scores": matrix.score_distributions(),
+        "patterns": matrix.failure_patterns(args.top),
+    }
+
+    if args.format == "json":
+        document = {"projects": projects, "checks": checks}
+        for name, rows in sections.items():
+            document[name] = [_row_dict(row) for row in rows]
+        print(json.dumps(document, indent=2))
+        return 0
+
+    console.print(f"[bold]{projects} project(s), {checks} check(s)[/bold]")
+    _print_failure_rates(sections["failure_rates"])
+    _print_co_failures(sections["co_failures"])
+    _print_scores(sections["scores"])
+    _print_patterns(sections["patterns"])
+    return 0
+
+
+def _row_dict(row) -> dict:
+    """Serialize a result row, with enum values and the failure rate."""
+    values = {
+        key: value.value if isinstance(value, Enum) else value
+        for key, value in asdict(row).items()
+    }
+    if hasattr(row, "rate"):
+        values["rate"] = round(row.rate, 2)
+    return values
+
+
+def _print_failure_rates(rows: list) -> None:
+    """Print the most failed checks."""
+    table = Table(title="Most failed checks")
+    for column in ("check", "level", "failed", "applicable", "rate"):
+        table.add_column(column, justify="left" if column == "check" else "right")
+    for row in rows:
+        table.add_row(
+            row.check_id,
+            row.level.value,
+            str(row.failed),
+            str(row.applicable),
+            f"{row.rate:.1f}%",
+        )
+    console.print(table)
+
+
+def _print_co_failures(rows: list) -> None:
+    """Print the most correlated failing checks."""
+    if not rows:
+        console.print("[dim]No co-failing checks[/dim]")
+        return
+    table = Table(title="Checks failing together")
+    table.add_column("check")
+    table.add_column("check")
+    table.add_column("correlation", justify="right")
+    table.add_column("both failed", justify="right")
+    for row in rows:
+        table.add_row(
+            row.check_a, row.check_b, f"{row.correlation:.2f}", str(row.both_failed)
+        )
+    console.print(table)
+
+
+def _print_scores(rows: list) -> None:
+    """Print the weighted score distribution per project type."""
+    table = Table(title="Weighted score by project type")
+    table.add_column("type")
+    table.add_column("projects", justify="right")
+    table.add_column("mean", justify="right")
+    percentiles = list(rows[0].percentiles) if rows else []
+    for p in percentiles:
+        table.add_column(f"p{p}", justify="right")
+    for row in rows:
+        table.add_row(
+            row.project_type or "-",
+            str(row.projects),
+            f"{row.mean:.1f}",
+            *(f"{row.percentiles[p]:.1f}" for p in percentiles),
+        )
+    console.print(table)
+
+
+def _print_patterns(rows: list) -> None:
+    """Print the most common sets of failing checks."""
+    table = Table(title="Failure patterns")
+    table.add_column("projects", justify="right")
+    table.add_column("failed checks")
+    for row in rows:
+        table.add_row(str(row.projects), ", ".join(row.failed_checks) or "(none)")
+    console.print(table)
@@ -8,6 +8,7 @@
 from rich.console import Console
 from rich.table import Table
 
+from projinit.core.backup import BackupStore
 from projinit.core.checker import Checker
 from projinit.core.detector import detect_project_type
 from projinit.core.models import ActionType, ProjectType
@@ -52,7 +53,14 @@ def add_update_parser(subparsers: argparse._SubParsersAction) -> None:
     update_parser.add_argument(
         "--no-backup",
         action="store_true",
-        help="Don't create backup files before modifying",
+        help="Don't back up files before modifying",
+    )
+    update_parser.add_argument(
+        "--restore",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Restore files backed up by a previous run ('latest' for the last one)",
     )
     update_parser.add_argument(
         "-v",
@@ -80,6 +88,10 @@ def run_update(args: argparse.Namespace) -> int:
         console.print(f"[red]Error: {project_path} is not a directory[/red]")
         return 2
 
+    # Restore a previous backup run
+    if getattr(args, "restore", None):
+        return _restore_backup(project_path, args.restore)
+
     # Detect or use specified project type
     if args.type:
         project_type = ProjectType(args.type)
@@ -143,6 +155,17 @@ def run_update(args: argparse.Namespace) -> int:
 
     # Report results
     console.print()
+    if updater.backup_index:
+        run_id = updater.backup_store.run_id
+        console.print(
+            f"[dim]Backup saved as run {run_id} "
+            f"(restore with: projinit update --restore {run_id})[/dim]"
+        )
+    if updater.unchanged_actions:
+        console.print(
+            f"[dim]{len(updater.unchanged_actions)} file(s) already up to date, "
+            "left untouched[/dim]"
+        )
     if len(applied) == len(actions):
         console.print(f"[green]Successfully applied {len(applied)} update(s)[/green]")
         return 0
@@ -156,6 +179,29 @@ def run_update(args: argparse.Namespace) -> int:
         return 2
 
 
+def _restore_backup(project_path: Path, run_id: str) -> int:
+    """Restore files from the project backup store."""
+    store = BackupStore(project_path)
+    runs = store.list_runs()
+
+    if not runs:
+        console.print("[yellow]No backups found for this project[/yellow]")
+        return 2
+
+    if run_id == "latest":
+        run_id = runs[-1]
+    elif run_id not in runs:
+        console.print(f"[red]Unknown backup run: {run_id}[/red]")
+        console.print(f"[dim]Available runs: {', '.join(runs)}[/dim]")
+        return 2
+
+    restored = store.restore(run_id)
+    for path in restored:
+        console.print(f"  [green]RESTORED[/green] {path.relative_to(project_path)}")
+    console.print(f"[green]Restored {len(restored)} file(s) from run {run_id}[/green]")
+    return 0
+
+
 def _display_actions(actions: list, dry_run: bool) -> None:
     """Display the planned actions."""
     title = "Planned updates" if dry_run else "Updates to apply"
@@ -242,7 +288,14 @@ def main() -> None:
     parser.add_argument(
         "--no-backup",
         action="store_true",
-        help="Don't create backup files before modifying",
+        help="Don't back up files before modifying",
+    )
+    parser.add_argument(
+        "--restore",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Restore files backed up by a previous run ('latest' for the last one)",
     )
     parser.add_argument(
         "-v",
@@ -0,0 +1,194 @@
+"""Content-addressed backup store for projinit v2.0.
+
+Backups are written once into ``.projinit/backups`` inside the project:
+
+- ``objects/<xx>/<sha256>[.z]`` holds each distinct file content, optionally
+  zlib-compressed. Identical contents are stored only once.
+- ``runs/<run_id>.json`` maps project-relative paths to object digests for
+  a single update run.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from projinit.core.writer import atomic_write
+
+# Location of the store, relative to the project root
+BACKUP_DIR = Path(".projinit") / "backups"
+
+# Suffix used for zlib-compressed objects
+COMPRESSED_SUFFIX = ".z"
+
+
+def _new_run_id() -> str:
+    """
+    Generate a unique run identifier that sorts by creation time.
+
+    The nanosecond part orders runs started within the same second; the
+    random suffix only keeps concurrent runs apart.
+    """
+    now_ns = time.time_ns()
+    timestamp = datetime.fromtimestamp(now_ns // 1_000_000_000).strftime(
+        "%Y%m%dT%H%M%S"
+    )
+    return f"{timestamp}.{now_ns % 1_000_000_000:09d}-{uuid.uuid4().hex[:8]}"
+
+
+class BackupStore:
+    """Deduplicated backup store for files modified by an update run."""
+
+    def __init__(
+        self,
+        project_path: Path,
+        compress: bool = True,
+        run_id: str | None = None,
+    ):
+        """
+        Initialize the backup store.
+
+        Args:
+            project_path: Path to the project root.
+            compress: If True, new objects are stored zlib-compressed.
+            run_id: Identifier of the current run (generated if not provided).
+        """
+        self.project_path = project_path
+        self.root = project_path / BACKUP_DIR
+        self.compress = compress
+        self.run_id = run_id or _new_run_id()
+        self._files: dict[str, str] = {}
+
+    @property
+    def objects_dir(self) -> Path:
+        """Directory holding content objects."""
+        return self.root / "objects"
+
+    @property
+    def runs_dir(self) -> Path:
+        """Directory holding per-run indexes."""
+        return self.root / "runs"
+
+    def backup(self, path: Path) -> str | None:
+        """
+        Back up a file for the current run.
+
+        Only the first backup of a path within a run is recorded, so the
+        index always reflects the state before the run started.
+
+        Args:
+            path: File to back up.
+
+        Returns:
+            SHA-256 digest of the stored content, or None if path is not a file.
+        """
+        if not path.is_file():
+            return None
+
+        relative = self._relative(path)
+        if relative in self._files:
+            return self._files[relative]
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        self._write_object(digest, data)
+        self._files[relative] = digest
+        return digest
+
+    def commit(self) -> Path | None:
+        """
+        Write the index for the current run.
+
+        Returns:
+            Path to the run index, or None if nothing was backed up.
+        """
+        if not self._files:
+            return None
+
+        index = {
+            "run_id": self.run_id,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "files": dict(sorted(self._files.items())),
+        }
+        index_path = self.runs_dir / f"{self.run_id}.json"
+        atomic_write(index_path, json.dumps(index, indent=2).encode("utf-8"))
+        return index_path
+
+    def list_runs(self) -> list[str]:
+        """List recorded run ids, oldest first."""
+        if not self.runs_dir.is_dir():
+            return []
+        return sorted(p.stem for p in self.runs_dir.glob("*.json"))
+
+    def load_run(self, run_id: str) -> dict[str, str]:
+        """
+        Load the file-to-digest mapping of a run.
+
+        Raises:
+            FileNotFoundError: If the run does not exist.
+        """
+        index_path = self.runs_dir / f"{run_id}.json"
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        return data.get("files", {})
+
+    def read_object(self, digest: str) -> bytes:
+        """
+        Read the content stored under a digest.
+
+        Raises:
+            FileNotFoundError: If the object is missing from the store.
+        """
+        raw_path = self._object_path(digest)
+        compressed_path = raw_path.with_name(raw_path.name + COMPRESSED_SUFFIX)
+        if compressed_path.exists():
+            return zlib.decompress(compressed_path.read_bytes())
+        return raw_path.read_bytes()
+
+    def restore(self, run_id: str, paths: list[str] | None = None) -> list[Path]:
+        """
+        Restore files to their content before a given run.
+
+        Args:
+            run_id: Run to restore from.
+            paths: Project-relative paths to restore (all files of the run if None).
+
+        Returns:
+            List of restored file paths.
+        """
+        files = self.load_run(run_id)
+        restored = []
+
+        for relative, digest in files.items():
+            if paths is not None and relative not in paths:
+                continue
+            target = self.project_path / relative
+            atomic_write(target, self.read_object(digest))
+            restored.append(target)
+
+        return restored
+
+    def _relative(self, path: Path) -> str:
+        """Get a project-relative POSIX path for the index."""
+        try:
+            return path.resolve().relative_to(self.project_path.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def _object_path(self, digest: str) -> Path:
+        """Get the path of an uncompressed object."""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _write_object(self, digest: str, data: bytes) -> None:
+        """Store an object unless an identical one already exists."""
+        raw_path = self._object_path(digest)
+        compressed_path = raw_path.with_name(raw_path.name + COMPRESSED_SUFFIX)
+        if raw_path.exists() or compressed_path.exists():
+            return
+
+        if self.compress:
+            atomic_write(compressed_path, zlib.compress(data))
+        else:
+            atomic_write(raw_path, data)
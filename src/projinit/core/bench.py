@@ -0,0 +1,300 @@
+"""Synthetic fleet benchmark for projinit v2.0.
+
+`projinit bench` renders synthetic projects of every project type with the
+generators of `projinit new`, writes them to disk, then times each phase
+of projinit on every project:
+
+- new: rendering the project and writing it to disk;
+- detect: detect_project_type;
+- check: Checker.run_checks;
+- generate_actions / apply_actions: Updater, on the audit of the project.
+
+Projects vary from one to the next, from a seeded random generator (the
+same seed gives the same fleet): some generated files are left out, files
+checked with alternative paths are moved to one of their alternatives, and
+extra files of random sizes are added. The result is a JSON document of
+throughput and latency percentiles per phase, overall and per project
+type, that can be compared between runs.
+"""
+
+import platform
+import random
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePosixPath
+
+from projinit import __version__
+from projinit.core.checker import Checker
+from projinit.core.detector import detect_project_type
+from projinit.core.models import ProjectType
+from projinit.core.tree import DiskSink, VirtualTree
+from projinit.core.updater import Updater
+from projinit.standards.loader import get_checks_for_type
+
+PHASES = ("new", "detect", "check", "generate_actions", "apply_actions")
+PERCENTILES = (50, 90, 99)
+
+# Project types the generators of `projinit new` can render
+BENCH_TYPES = tuple(t for t in ProjectType if t != ProjectType.UNKNOWN)
+
+# Renders a project tree, given a project name and type
+Renderer = Callable[[str, ProjectType], VirtualTree]
+
+_FILLER = b"synthetic benchmark content\n"
+
+
+@dataclass
+class FleetSpec:
+    """Shape of a synthetic fleet."""
+
+    projects_per_type: int = 10
+    project_types: list[ProjectType] = field(default_factory=lambda: list(BENCH_TYPES))
+    missing_rate: float = 0.1
+    alternative_rate: float = 0.5
+    max_extra_files: int = 20
+    max_file_size: int = 4096
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize the spec, with project type values."""
+        values = asdict(self)
+        values["project_types"] = [t.value for t in self.project_types]
+        return values
+
+
+@dataclass
+class PhaseStats:
+    """Timings of one phase over a set of projects."""
+
+    count: int
+    total_ms: float
+    per_second: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    percentiles: dict[int, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(cls, samples_ns: list[int]) -> "PhaseStats":
+        """Summarize durations in nanoseconds."""
+        values = sorted(ns / 1e6 for ns in samples_ns)
+        total = sum(values)
+        count = len(values)
+        return cls(
+            count=count,
+            total_ms=round(total, 3),
+            per_second=round(count / total * 1000, 2) if total else 0.0,
+            mean_ms=round(total / count, 4) if count else 0.0,
+            min_ms=round(values[0], 4) if values else 0.0,
+            max_ms=round(values[-1], 4) if values else 0.0,
+            percentiles={p: round(percentile(values, p), 4) for p in PERCENTILES},
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize with one "p<N>_ms" key per percentile."""
+        values = asdict(self)
+        del values["percentiles"]
+        values.update({f"p{p}_ms": v for p, v in self.percentiles.items()})
+        return values
+
+
+def percentile(values: list[float], p: float) -> float:
+    """
+    Percentile of sorted values, interpolated between the closest ranks.
+
+    Args:
+        values: Values sorted in ascending order.
+        p: Percentile, from 0 to 100.
+
+    Returns:
+        The percentile (0.0 if there are no values).
+    """
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def synthesize(
+    tree: VirtualTree,
+    project_type: ProjectType,
+    spec: FleetSpec,
+    rng: random.Random,
+) -> VirtualTree:
+    """
+    Derive a synthetic variant of a generated project.
+
+    Args:
+        tree: Project rendered by the `new` generators.
+        project_type: Type of the project.
+        spec: Fleet shape (missing, alternative and extra file settings).
+        rng: Random generator of the fleet.
+
+    Returns:
+        A new tree.
+    """
+    # Paths checked with alternatives, moved to one of them
+    moves: dict[PurePosixPath, PurePosixPath] = {}
+    for check_def in get_checks_for_type(project_type):
+        alternatives = check_def.get("alternatives")
+        path = PurePosixPath(check_def.get("path", ""))
+        if alternatives and path in tree and rng.random() < spec.alternative_rate:
+            moves[path] = PurePosixPath(rng.choice(alternatives))
+
+    variant = VirtualTree()
+    for entry in tree:
+        if entry.is_dir:
+            continue
+        if rng.random() < spec.missing_rate:
+            continue
+        path = _moved(entry.path, moves)
+        if entry.is_copy:
+            variant.copy(path, entry.source, entry.mode)
+        else:
+            variant.write(path, entry.data, entry.mode)
+
+    for i in range(rng.randint(0, spec.max_extra_files)):
+        size = rng.randint(0, spec.max_file_size)
+        data = (_FILLER * (size // len(_FILLER) + 1))[:size]
+        variant.write(f"synthetic/group_{i % 4}/file_{i}.txt", data)
+    return variant
+
+
+def _moved(
+    path: PurePosixPath, moves: dict[PurePosixPath, PurePosixPath]
+) -> PurePosixPath:
+    """Apply the moves of a file, or of one of its parent directories."""
+    for source, target in moves.items():
+        if path == source:
+            return target
+        if source in path.parents:
+            return target / path.relative_to(source)
+    return path
+
+
+class Benchmark:
+    """Durations of every phase, by project type."""
+
+    def __init__(self, spec: FleetSpec):
+        """
+        Initialize an empty benchmark.
+
+        Args:
+            spec: Shape of the benchmarked fleet.
+        """
+        self.spec = spec
+        self.samples: dict[ProjectType, dict[str, list[int]]] = {}
+        self.files = 0
+        self.bytes = 0
+        self.detected = 0
+
+    @property
+    def projects(self) -> int:
+        """Number of benchmarked projects."""
+        return sum(len(phases["new"]) for phases in self.samples.values())
+
+    def add(self, project_type: ProjectType, phase: str, duration_ns: int) -> None:
+        """Record the duration of a phase on one project."""
+        phases = self.samples.setdefault(project_type, {p: [] for p in PHASES})
+        phases[phase].append(duration_ns)
+
+    def to_dict(self) -> dict:
+        """Build the JSON report: environment, spec, overall and per-type stats."""
+        projects = self.projects
+        return {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "spec": self.spec.to_dict(),
+            "projects": projects,
+            "files": self.files,
+            "bytes": self.bytes,
+            "detection_accuracy": round(self.detected / projects, 4)
+            if projects
+            else 0.0,
+            "phases": {
+                phase: PhaseStats.from_samples(
+                    [ns for phases in self.samples.values() for ns in phases[phase]]
+                ).to_dict()
+                for phase in PHASES
+            },
+            "by_type": {
+                project_type.value: {
+                    phase: PhaseStats.from_samples(samples).to_dict()
+                    for phase, samples in phases.items()
+                }
+                for project_type, phases in self.samples.items()
+            },
+        }
+
+
+def new_project_renderer() -> Renderer:
+    """Get a renderer using the generators of `projinit new`."""
+    # Imported here: the generators live in the CLI layer
+    from projinit.cli.init_cmd import _build_project_tree, _create_template_env
+
+    env = _create_template_env()
+
+    def render(name: str, project_type: ProjectType) -> VirtualTree:
+        return _build_project_tree(
+            env, name, project_type, f"Synthetic {project_type.display_name} project"
+        )
+
+    return render
+
+
+def run_benchmark(root: Path, spec: FleetSpec, render: Renderer) -> Benchmark:
+    """
+    Generate a synthetic fleet under a directory and time every phase.
+
+    Projects are written to `root/<type>/<name>`; update actions modify
+    them in place (without backups).
+
+    Args:
+        root: Directory of the fleet (should be empty).
+        spec: Shape of the fleet.
+        render: Generator of `projinit new` (see Renderer).
+
+    Returns:
+        The collected durations.
+    """
+    rng = random.Random(spec.seed)
+    benchmark = Benchmark(spec)
+    clock = time.perf_counter_ns
+
+    for project_type in spec.project_types:
+        for i in range(spec.projects_per_type):
+            name = f"bench-{project_type.value}-{i}"
+            path = root / project_type.value / name
+
+            start = clock()
+            tree = render(name, project_type)
+            rendered = clock() - start
+            tree = synthesize(tree, project_type, spec, rng)
+            start = clock()
+            DiskSink(path).write(tree)
+            benchmark.add(project_type, "new", rendered + clock() - start)
+            benchmark.files += len(tree.files())
+            benchmark.bytes += tree.size
+
+            start = clock()
+            detection = detect_project_type(path)
+            benchmark.add(project_type, "detect", clock() - start)
+            benchmark.detected += detection.project_type == project_type
+
+            start = clock()
+            report = Checker(path, project_type).run_checks()
+            benchmark.add(project_type, "check", clock() - start)
+
+            updater = Updater(path, project_type, create_backup=False)
+            start = clock()
+            actions = updater.generate_actions(report)
+            benchmark.add(project_type, "generate_actions", clock() - start)
+            start = clock()
+            updater.apply_actions(actions)
+            benchmark.add(project_type, "apply_actions", clock() - start)
+
+    return benchmark
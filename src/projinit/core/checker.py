@@ -1,6 +1,7 @@
 """Conformity checker for projinit v2.0."""
 
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
 from projinit.core.models import (
@@ -10,24 +11,34 @@
     CheckStatus,
     ProjectType,
 )
+from projinit.core.tracing import active_tracer, traced
 from projinit.standards.loader import get_checks_for_type
 
 
 class Checker:
     """Checks project conformity against standards."""
 
-    def __init__(self, project_path: Path, project_type: ProjectType):
+    def __init__(
+        self,
+        project_path: Path,
+        project_type: ProjectType,
+        checks: list[dict] | None = None,
+    ):
         """
         Initialize the checker.
 
         Args:
             project_path: Path to the project root.
             project_type: Detected or specified project type.
+            checks: Check definitions already loaded for the project type
+                (loaded from the standards when the checks run otherwise).
         """
         self.project_path = project_path
         self.project_type = project_type
+        self.checks = checks
         self._files_scanned: set[str] = set()
 
+    @traced("run_checks", "check", lambda self: {"repo": str(self.project_path)})
     def run_checks(self) -> AuditReport:
         """
         Run all applicable checks and return an audit report.
@@ -36,21 +47,47 @@ def run_checks(self) -> AuditReport:
             AuditReport with all check results.
         """
         start_time = time.perf_counter()
+        results = list(self.iter_checks())
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
+        return self.build_report(results, execution_time_ms)
 
-        checks = get_checks_for_type(self.project_type)
-        results = []
+    def iter_checks(self) -> Iterator[CheckResult]:
+        """
+        Run all applicable checks, yielding each result as soon as it is ready.
 
+        Yields:
+            CheckResult for each check, in standards order.
+        """
+        tracer = active_tracer()
+        checks = self.checks
+        if checks is None:
+            checks = get_checks_for_type(self.project_type)
         for check_def in checks:
-            result = self._run_single_check(check_def)
-            results.append(result)
+            if tracer is None:
+                result = self._run_single_check(check_def)
+            else:
+                with tracer.span(check_def.get("id", "unknown"), "check"):
+                    result = self._run_single_check(check_def)
             # Track scanned files
             if result.file_path:
                 self._files_scanned.add(
                     str(result.file_path.relative_to(self.project_path))
                 )
+            yield result
 
-        execution_time_ms = (time.perf_counter() - start_time) * 1000
+    def build_report(
+        self, results: list[CheckResult], execution_time_ms: float
+    ) -> AuditReport:
+        """
+        Assemble an audit report from check results.
+
+        Args:
+            results: Results produced by iter_checks.
+            execution_time_ms: Time spent running the checks.
 
+        Returns:
+            AuditReport for the project.
+        """
         return AuditReport(
             project_path=self.project_path,
             project_type=self.project_type,
@@ -11,6 +11,9 @@
 
 import yaml
 
+from projinit.core.merger import deep_merge, merge_lists
+from projinit.core.tracing import span, traced
+
 # Default config locations
 GLOBAL_CONFIG_DIR = Path.home() / ".config" / "projinit"
 GLOBAL_CONFIG_FILE = GLOBAL_CONFIG_DIR / "config.yaml"
@@ -67,6 +70,7 @@ class ProjInitConfig:
     _source: str = "defaults"
 
 
+@traced("load_config", "load")
 def load_config(project_path: Path | None = None) -> ProjInitConfig:
     """
     Load configuration with hierarchy: defaults < global < local.
@@ -125,7 +129,7 @@ def get_config_paths() -> dict[str, Path]:
 def _load_yaml_config(path: Path) -> dict:
     """Load configuration from YAML file."""
     try:
-        with open(path, encoding="utf-8") as f:
+        with span("yaml", "load", file=str(path)), open(path, encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
     except (OSError, yaml.YAMLError):
         return {}
@@ -146,20 +150,22 @@ def _merge_config(base: ProjInitConfig, overlay: dict) -> ProjInitConfig:
     if "default_license" in overlay:
         base.default_license = overlay["default_license"]
 
-    # Standards
+    # Standards (overlay items replace base items with the same key)
     if "standards" in overlay:
         standards = overlay["standards"]
         if isinstance(standards, dict):
-            if "check_overrides" in standards:
-                base.standards.check_overrides.update(standards["check_overrides"])
-            if "extra_checks" in standards:
-                base.standards.extra_checks.extend(standards["extra_checks"])
-            if "disabled_checks" in standards:
-                base.standards.disabled_checks.extend(standards["disabled_checks"])
-            if "extra_precommit_hooks" in standards:
-                base.standards.extra_precommit_hooks.extend(
-                    standards["extra_precommit_hooks"]
+            if isinstance(standards.get("check_overrides"), dict):
+                base.standards.check_overrides = deep_merge(
+                    base.standards.check_overrides,
+                    standards["check_overrides"],
+                    overwrite=True,
                 )
+            for name in ("extra_checks", "disabled_checks", "extra_precommit_hooks"):
+                if isinstance(standards.get(name), list):
+                    merged = merge_lists(
+                        getattr(base.standards, name), standards[name], replace=True
+                    )
+                    setattr(base.standards, name, merged)
 
     # Templates
     if "templates" in overlay:
@@ -167,8 +173,10 @@ def _merge_config(base: ProjInitConfig, overlay: dict) -> ProjInitConfig:
         if isinstance(templates, dict):
             if "templates_dir" in templates:
                 base.templates.templates_dir = Path(templates["templates_dir"])
-            if "overrides" in templates:
-                base.templates.overrides.update(templates["overrides"])
+            if isinstance(templates.get("overrides"), dict):
+                base.templates.overrides = deep_merge(
+                    base.templates.overrides, templates["overrides"], overwrite=True
+                )
 
     return base
 
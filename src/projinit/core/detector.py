@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from projinit.core.models import DetectionResult, ProjectType
+from projinit.core.tracing import traced
 
 # Markers for each project type with their weight
 PROJECT_MARKERS: dict[ProjectType, dict[str, float]] = {
@@ -62,6 +63,7 @@
 }
 
 
+@traced("detect_project_type", "detect", lambda path: {"repo": str(path)})
 def detect_project_type(path: Path) -> DetectionResult:
     """
     Detect the type of project at the given path.
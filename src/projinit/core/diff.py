@@ -0,0 +1,285 @@
+"""Audit report diffing for projinit v2.0.
+
+Compares two saved audits and yields only the results that changed:
+status transitions (passed -> failed, failed -> passed...), checks that
+appeared and checks that disappeared. `check -f json` reports (one
+project), `check -f ndjson` streams and `check --export` result files
+(any number of projects) are accepted, in any combination.
+
+The old report is indexed by project then check id, holding only interned
+check ids and one small integer packing status and level codes; the new
+report is streamed against that index, so transitions are emitted while it
+is read and only one side is ever held in memory.
+"""
+
+import json
+import re
+import sys
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass
+from enum import Enum
+from itertools import chain
+from pathlib import Path
+
+from projinit.core.models import CheckLevel, CheckStatus
+from projinit.core.resultfile import ResultFile, is_result_file
+from projinit.core.results import LEVEL_CODES, STATUS_CODES
+
+_STATUS_INDEX = {status.value: code for code, status in enumerate(STATUS_CODES)}
+_LEVEL_INDEX = {level.value: code for code, level in enumerate(LEVEL_CODES)}
+
+# Status and level codes packed in one int: status << _LEVEL_BITS | level
+_LEVEL_BITS = 4
+_LEVEL_MASK = (1 << _LEVEL_BITS) - 1
+
+# Substrings of check and summary records: other records are skipped unparsed
+_CHECK_MARKER = '"check"'
+_SUMMARY_MARKER = '"summary"'
+
+# Leading fields of the check records written by NdjsonReporter, matched
+# without a full JSON parse (records with escaped strings fall back to it)
+_CHECK_RECORD = re.compile(
+    r'\{"type": "check", "project": "([^"\\]*)", "id": "([^"\\]*)", '
+    r'"status": "(\w+)", "level": "(\w+)"'
+)
+
+
+class ChangeKind(Enum):
+    """Kind of difference between two reports."""
+
+    CHANGED = "changed"
+    ADDED = "added"
+    REMOVED = "removed"
+
+
+@dataclass(slots=True)
+class Transition:
+    """A check result that differs between two reports."""
+
+    project: str
+    check_id: str
+    kind: ChangeKind
+    level: CheckLevel
+    old: CheckStatus | None = None
+    new: CheckStatus | None = None
+
+    @property
+    def is_regression(self) -> bool:
+        """Check if a passing check now fails or warns."""
+        return self.old == CheckStatus.PASSED and self.new in (
+            CheckStatus.FAILED,
+            CheckStatus.WARNING,
+        )
+
+    @property
+    def is_fix(self) -> bool:
+        """Check if a failing or warning check now passes."""
+        return (
+            self.old in (CheckStatus.FAILED, CheckStatus.WARNING)
+            and self.new == CheckStatus.PASSED
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize for JSON output."""
+        return {
+            "project": self.project,
+            "check_id": self.check_id,
+            "kind": self.kind.value,
+            "level": self.level.value,
+            "old": self.old.value if self.old else None,
+            "new": self.new.value if self.new else None,
+        }
+
+
+@dataclass
+class DiffSummary:
+    """Counts of the transitions of a diff."""
+
+    regressions: int = 0
+    fixes: int = 0
+    changed: int = 0
+    added: int = 0
+    removed: int = 0
+
+    def count(self, transition: Transition) -> None:
+        """Account for one transition."""
+        if transition.kind == ChangeKind.ADDED:
+            self.added += 1
+        elif transition.kind == ChangeKind.REMOVED:
+            self.removed += 1
+        else:
+            self.changed += 1
+            if transition.is_regression:
+                self.regressions += 1
+            elif transition.is_fix:
+                self.fixes += 1
+
+
+def iter_report_results(
+    path: Path, project_types: dict[str, str] | None = None
+) -> Iterator[tuple[str, str, int, int]]:
+    """
+    Read the check results of a saved report.
+
+    Args:
+        path: `check -f json` document, `check -f ndjson` stream or
+            `check --export` result file.
+        project_types: If given, filled with project -> project type value.
+
+    Yields:
+        (project, check id, status code, level code) tuples, in file order.
+
+    Raises:
+        ValueError: If the file is not a projinit report.
+    """
+    if is_result_file(path):
+        yield from _iter_result_file(path, project_types)
+        return
+
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+        try:
+            record = json.loads(first)
+        except ValueError:
+            record = None
+        if isinstance(record, dict) and "type" in record:
+            yield from _iter_ndjson(first, f, project_types)
+            return
+        f.seek(0)
+        document = json.load(f)
+
+    if not isinstance(document, dict) or "checks" not in document:
+        raise ValueError(f"{path}: not a projinit report")
+    project = sys.intern(document.get("project_path", ""))
+    if project_types is not None:
+        project_types[project] = document.get("project_type", "")
+    for check in document["checks"]:
+        yield project, *_encode(check)
+
+
+def _iter_ndjson(
+    first: str, lines, project_types: dict[str, str] | None
+) -> Iterator[tuple[str, str, int, int]]:
+    """Read the check records (and project types) of an NDJSON stream."""
+    projects: dict[str, str] = {}
+    for line in chain((first,), lines):
+        if _CHECK_MARKER not in line:
+            if project_types is not None and _SUMMARY_MARKER in line:
+                record = json.loads(line)
+                if record.get("type") == "summary":
+                    project_types[record.get("project", "")] = record.get(
+                        "project_type", ""
+                    )
+            continue
+        match = _CHECK_RECORD.match(line)
+        if match:
+            project, check_id, status, level = match.groups()
+            encoded = (
+                sys.intern(check_id),
+                _STATUS_INDEX[status],
+                _LEVEL_INDEX.get(level, 0),
+            )
+        else:
+            record = json.loads(line)
+            if record.get("type") != "check":
+                continue
+            project = record.get("project", "")
+            encoded = _encode(record)
+        # One shared string per project
+        project = projects.setdefault(project, project)
+        yield project, *encoded
+
+
+def _iter_result_file(
+    path: Path, project_types: dict[str, str] | None
+) -> Iterator[tuple[str, str, int, int]]:
+    """Read the rows of a result file, project by project."""
+    with closing(ResultFile(path)) as results:
+        check_ids = [sys.intern(check_id) for check_id in results.check_ids.values]
+        for index, summary in enumerate(results.projects):
+            if project_types is not None:
+                project_types[summary.path] = summary.project_type.value
+            for i in results.rows_for(index):
+                yield (
+                    summary.path,
+                    check_ids[results.check[i]],
+                    results.status[i],
+                    results.level[i],
+                )
+
+
+def _encode(check: dict) -> tuple[str, int, int]:
+    """Convert a JSON check record to (interned id, status code, level code)."""
+    return (
+        sys.intern(check["id"]),
+        _STATUS_INDEX[check["status"]],
+        _LEVEL_INDEX.get(check.get("level"), 0),
+    )
+
+
+def diff_reports(old_path: Path, new_path: Path) -> Iterator[Transition]:
+    """
+    Compare two saved reports, keyed by (project, check id).
+
+    Transitions between results present in both reports are yielded while
+    the new report is read; checks missing from the new report are yielded
+    last, as REMOVED.
+
+    Args:
+        old_path: Earlier report.
+        new_path: Later report.
+
+    Yields:
+        Transitions, in new report order.
+    """
+    # project -> check id -> packed status and level (old results, pending
+    # a match); small ints are shared objects, so entries cost no allocation
+    index: dict[str, dict[str, int]] = {}
+    for project, check_id, status, level in iter_report_results(old_path):
+        index.setdefault(project, {})[check_id] = status << _LEVEL_BITS | level
+
+    for project, check_id, status, level in iter_report_results(new_path):
+        old = index.get(project)
+        previous = old.pop(check_id, None) if old is not None else None
+        if previous is None:
+            yield _transition(project, check_id, ChangeKind.ADDED, level, None, status)
+        elif previous >> _LEVEL_BITS != status:
+            yield _transition(
+                project,
+                check_id,
+                ChangeKind.CHANGED,
+                level,
+                previous >> _LEVEL_BITS,
+                status,
+            )
+
+    for project, checks in index.items():
+        for check_id, packed in checks.items():
+            yield _transition(
+                project,
+                check_id,
+                ChangeKind.REMOVED,
+                packed & _LEVEL_MASK,
+                packed >> _LEVEL_BITS,
+                None,
+            )
+
+
+def _transition(
+    project: str,
+    check_id: str,
+    kind: ChangeKind,
+    level: int,
+    old: int | None,
+    new: int | None,
+) -> Transition:
+    """Build a transition from status and level codes."""
+    return Transition(
+        project=project,
+        check_id=check_id,
+        kind=kind,
+        level=LEVEL_CODES[level],
+        old=None if old is None else STATUS_CODES[old],
+        new=None if new is None else STATUS_CODES[new],
+    )
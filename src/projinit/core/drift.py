@@ -0,0 +1,326 @@
+"""Template drift detection for projinit v2.0.
+
+Files scaffolded by `projinit new` slowly drift away from their templates.
+For every `file_exists` check that references a template, the template is
+rendered with a context inferred from the project (name, description,
+author...) and compared to the file: identical hashes mean no drift,
+otherwise a line-based similarity score tells how far the file has moved.
+
+Renders are memoized per (template hash, context hash), so scanning many
+projects costs one render per distinct context, not one per project.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from difflib import SequenceMatcher
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from projinit.core.models import ProjectType
+from projinit.core.tracing import span
+from projinit.standards.loader import get_checks_for_type
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Prefix of template references in standards files
+TEMPLATE_PREFIX = "templates/"
+
+_COPYRIGHT_PATTERN = re.compile(r"Copyright \(c\) (\d{4})[ \t]*(.*)")
+_PYTHON_VERSION_PATTERN = re.compile(r">=\s*(\d+\.\d+)")
+
+
+class DriftStatus(Enum):
+    """Drift state of a templated file."""
+
+    MATCH = "match"
+    DRIFTED = "drifted"
+    MISSING = "missing"
+    NO_TEMPLATE = "no_template"
+
+
+@dataclass
+class DriftResult:
+    """Drift of a single file from its template."""
+
+    check_id: str
+    path: str
+    template: str
+    status: DriftStatus
+    similarity: float = 0.0
+
+    @property
+    def is_drifted(self) -> bool:
+        """Check if the file exists but differs from its template."""
+        return self.status == DriftStatus.DRIFTED
+
+
+@dataclass
+class DriftReport:
+    """Drift of all templated files of a project."""
+
+    project_path: Path
+    project_type: ProjectType
+    results: list[DriftResult] = field(default_factory=list)
+
+    @property
+    def drifted_count(self) -> int:
+        """Number of files that differ from their template."""
+        return sum(1 for r in self.results if r.is_drifted)
+
+    @property
+    def compared(self) -> list[DriftResult]:
+        """Results for files that were compared to a template."""
+        return [
+            r
+            for r in self.results
+            if r.status in (DriftStatus.MATCH, DriftStatus.DRIFTED)
+        ]
+
+
+def infer_context(project_path: Path, project_type: ProjectType) -> dict:
+    """
+    Infer the template variables a project was most likely generated with.
+
+    Values are read from pyproject.toml, package.json, LICENSE and .envrc,
+    falling back to the defaults used by `projinit new`.
+
+    Args:
+        project_path: Path to the project root.
+        project_type: Project type.
+
+    Returns:
+        Template context.
+    """
+    name = project_path.name
+    description = None
+    author_name = None
+    author_email = None
+    python_version = "3.10"
+    year = datetime.now().year
+    owner = None
+
+    pyproject = _read_pyproject(project_path / "pyproject.toml")
+    project = pyproject.get("project", {})
+    if isinstance(project, dict):
+        name = project.get("name") or name
+        description = project.get("description")
+        authors = project.get("authors") or []
+        if authors and isinstance(authors[0], dict):
+            author_name = authors[0].get("name")
+            author_email = authors[0].get("email")
+        match = _PYTHON_VERSION_PATTERN.search(str(project.get("requires-python", "")))
+        if match:
+            python_version = match.group(1)
+
+    package = _read_json(project_path / "package.json")
+    name = package.get("name") or name
+    description = package.get("description") or description
+
+    license_file = project_path / "LICENSE"
+    if license_file.is_file():
+        match = _COPYRIGHT_PATTERN.search(
+            license_file.read_text(encoding="utf-8", errors="replace")
+        )
+        if match:
+            year = int(match.group(1))
+            owner = match.group(2).strip()
+
+    name = str(name)
+    return {
+        "project_name": name,
+        "project_name_snake": name.replace("-", "_"),
+        "project_type": project_type.value,
+        "project_type_display": project_type.display_name,
+        "description": description or f"Project {name}",
+        "year": year,
+        "owner": owner or author_name or "",
+        "author_name": author_name,
+        "author_email": author_email,
+        "python_version": python_version,
+        "use_direnv": (project_path / ".envrc").is_file(),
+    }
+
+
+def _read_pyproject(path: Path) -> dict:
+    """Parse a pyproject.toml, returning an empty dict on error."""
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def _read_json(path: Path) -> dict:
+    """Parse a JSON object file, returning an empty dict on error."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def context_hash(context: dict) -> str:
+    """Hash a template context independently of key order."""
+    encoded = json.dumps(context, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def similarity(expected: str, actual: str) -> float:
+    """
+    Score how close a file is to its rendered template.
+
+    Returns:
+        Ratio of matching lines, from 0.0 (unrelated) to 1.0 (identical).
+    """
+    matcher = SequenceMatcher(
+        None, expected.splitlines(), actual.splitlines(), autojunk=False
+    )
+    return matcher.ratio()
+
+
+class DriftChecker:
+    """Compares project files to their templates, memoizing renders."""
+
+    def __init__(self, env: "Environment | None" = None):
+        """
+        Initialize the drift checker.
+
+        Share one instance across projects so renders are reused.
+
+        Args:
+            env: Template environment (defaults to the configured layers).
+        """
+        if env is None:
+            # Only needed once drift is actually checked
+            from projinit.core.templates import create_template_env
+
+            env = create_template_env()
+        self.env = env
+        # template name -> source hash (None if the template does not exist)
+        self._template_hashes: dict[str, str | None] = {}
+        # (template hash, context hash) -> (content hash, content)
+        self._renders: dict[tuple[str, str], tuple[str, str]] = {}
+        self.render_count = 0
+
+    def check(
+        self,
+        project_path: Path,
+        project_type: ProjectType,
+        context: dict | None = None,
+    ) -> DriftReport:
+        """
+        Measure the drift of every templated file of a project.
+
+        Args:
+            project_path: Path to the project root.
+            project_type: Project type, selecting the applicable checks.
+            context: Template context (inferred from the project if None).
+
+        Returns:
+            Drift report.
+        """
+        if context is None:
+            context = infer_context(project_path, project_type)
+        ctx_hash = context_hash(context)
+
+        report = DriftReport(project_path=project_path, project_type=project_type)
+        for check_def in get_checks_for_type(project_type):
+            template = check_def.get("template")
+            if check_def.get("type") != "file_exists" or not template:
+                continue
+            report.results.append(
+                self._check_file(project_path, check_def, template, context, ctx_hash)
+            )
+        return report
+
+    def render(self, template: str, context: dict, ctx_hash: str | None = None):
+        """
+        Render a template, reusing a previous render of the same inputs.
+
+        Args:
+            template: Template name.
+            context: Template context.
+            ctx_hash: Precomputed context_hash(context).
+
+        Returns:
+            (content hash, content) tuple, or None if the template does not exist.
+        """
+        source_hash = self._template_hash(template)
+        if source_hash is None:
+            return None
+        key = (source_hash, ctx_hash or context_hash(context))
+        rendered = self._renders.get(key)
+        if rendered is None:
+            with span("render", "render", template=template):
+                content = self.env.get_template(template).render(context)
+            rendered = (_content_hash(content.encode("utf-8")), content)
+            self._renders[key] = rendered
+            self.render_count += 1
+        return rendered
+
+    def _template_hash(self, template: str) -> str | None:
+        """Hash a template source, once per template."""
+        from jinja2 import TemplateNotFound
+
+        if template not in self._template_hashes:
+            try:
+                source, _, _ = self.env.loader.get_source(self.env, template)
+            except TemplateNotFound:
+                self._template_hashes[template] = None
+            else:
+                self._template_hashes[template] = _content_hash(source.encode("utf-8"))
+        return self._template_hashes[template]
+
+    def _check_file(
+        self,
+        project_path: Path,
+        check_def: dict,
+        template_ref: str,
+        context: dict,
+        ctx_hash: str,
+    ) -> DriftResult:
+        """Compare one file to its template."""
+        path = check_def.get("path", "")
+        template = template_ref.removeprefix(TEMPLATE_PREFIX)
+        result = DriftResult(
+            check_id=check_def.get("id", ""),
+            path=path,
+            template=template,
+            status=DriftStatus.NO_TEMPLATE,
+        )
+
+        rendered = self.render(template, context, ctx_hash)
+        if rendered is None:
+            return result
+
+        try:
+            data = (project_path / path).read_bytes()
+        except OSError:
+            result.status = DriftStatus.MISSING
+            return result
+
+        expected_hash, expected = rendered
+        if _content_hash(data) == expected_hash:
+            result.status = DriftStatus.MATCH
+            result.similarity = 1.0
+        else:
+            result.status = DriftStatus.DRIFTED
+            result.similarity = similarity(
+                expected, data.decode("utf-8", errors="replace")
+            )
+        return result
+
+
+def _content_hash(data: bytes) -> str:
+    """Hash file or template content."""
+    return hashlib.sha256(data).hexdigest()
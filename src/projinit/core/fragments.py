@@ -0,0 +1,92 @@
+"""Template fragment assembly for projinit v2.0.
+
+.gitignore and .pre-commit-config.yaml files are built by concatenating a
+base fragment with one fragment per technology. Fragments take no template
+variables, so each one is rendered once on first use, and the assembled
+output is memoized per technology tuple: generating many projects with the
+same stack costs one lookup.
+"""
+
+from functools import cache, lru_cache
+
+from jinja2 import Environment, TemplateNotFound
+
+from projinit.core.templates import create_template_env
+
+# Base fragment rendered first for each fragment kind
+BASE_FRAGMENTS = {
+    "gitignore": "_common",
+    "precommit": "_header",
+}
+
+
+@lru_cache(maxsize=1)
+def _fragment_env() -> Environment:
+    """Get the environment used to render fragments (overrides apply)."""
+    return create_template_env()
+
+
+@cache
+def render_fragment(kind: str, name: str) -> str | None:
+    """
+    Render a single fragment, once.
+
+    Args:
+        kind: Fragment kind ("gitignore" or "precommit").
+        name: Technology or base fragment name.
+
+    Returns:
+        Rendered fragment, or None if no such fragment exists.
+    """
+    try:
+        return _fragment_env().get_template(f"{kind}/{name}.j2").render()
+    except TemplateNotFound:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _assemble(kind: str, technologies: tuple[str, ...]) -> str:
+    """Assemble a base fragment and technology fragments, in order."""
+    parts = [render_fragment(kind, BASE_FRAGMENTS[kind]) or ""]
+    parts.extend(render_fragment(kind, tech) or "" for tech in technologies)
+    return "".join(parts)
+
+
+def assemble_fragments(kind: str, technologies: list[str] | tuple[str, ...]) -> str:
+    """
+    Build a file from its base fragment and technology fragments.
+
+    Technologies are deduplicated and sorted, so the same stack always
+    produces the same output (and hits the same cache entry). Technologies
+    without a fragment of this kind are skipped.
+
+    Args:
+        kind: Fragment kind ("gitignore" or "precommit").
+        technologies: Selected technologies.
+
+    Returns:
+        Assembled file content.
+
+    Raises:
+        ValueError: If kind is not a known fragment kind.
+    """
+    if kind not in BASE_FRAGMENTS:
+        raise ValueError(f"Unknown fragment kind: {kind}")
+    return _assemble(kind, tuple(sorted(set(technologies))))
+
+
+def gitignore_content(technologies: list[str] | tuple[str, ...]) -> str:
+    """Build .gitignore content for a set of technologies."""
+    return assemble_fragments("gitignore", technologies)
+
+
+def precommit_content(technologies: list[str] | tuple[str, ...]) -> str:
+    """Build .pre-commit-config.yaml content for a set of technologies."""
+    return assemble_fragments("precommit", technologies)
+
+
+def clear_fragment_cache() -> None:
+    """Drop rendered fragments and assembled outputs."""
+    _assemble.cache_clear()
+    render_fragment.cache_clear()
+    _fragment_env.cache_clear()
@@ -0,0 +1,243 @@
+"""Git repository bootstrap for projinit v2.0.
+
+The initial commit of a generated project is built straight from its
+in-memory VirtualTree: blob, tree and commit objects are hashed and written
+as loose objects, so no `git add` pass re-reads and re-hashes the files
+that were just written. Only a few git processes run per project:
+`git init`, two `git var` for the author and committer identities,
+`git check-ignore` (files excluded by the generated `.gitignore` are left
+out, as with `git add`), `git update-ref` for the branch and
+`git read-tree` (to populate the index), plus one `git hash-object` for
+static files copied from disk, which git hashes straight from their
+source.
+"""
+
+import hashlib
+import subprocess
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from projinit.core.tracing import span, traced
+from projinit.core.tree import TreeEntry, VirtualTree
+
+INITIAL_COMMIT_MESSAGE = "Initial commit - project scaffolding"
+DEFAULT_BRANCH = "main"
+
+# Git tree entry modes
+_MODE_FILE = b"100644"
+_MODE_EXECUTABLE = b"100755"
+_MODE_TREE = b"40000"
+
+
+def _git(
+    args: list[str], cwd: Path | str | None, **kwargs
+) -> subprocess.CompletedProcess:
+    """
+    Run a git command, traced as a "git" span.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails.
+    """
+    with span(f"git {args[0]}", "git", cwd=str(cwd)):
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, check=True, **kwargs
+        )
+
+
+def git_identity(variable: str, cwd: Path | str) -> str:
+    """
+    Get the configured "Name <email>" identity of a repository.
+
+    It is read inside the repository, so identities set with conditional
+    includes (`includeIf "gitdir:..."`) apply as they would to `git commit`.
+
+    Args:
+        variable: GIT_AUTHOR_IDENT or GIT_COMMITTER_IDENT.
+        cwd: Repository whose git configuration applies.
+
+    Returns:
+        Identity without its timestamp.
+
+    Raises:
+        subprocess.CalledProcessError: If no identity is configured.
+    """
+    result = _git(["var", variable], cwd, text=True)
+    # "Name <email> 1700000000 +0100" -> "Name <email>"
+    return result.stdout.strip().rsplit(" ", 2)[0]
+
+
+def _ignored_paths(repo: Path, paths: list[str]) -> set[str]:
+    """
+    Get the paths excluded by the ignore rules of a repository.
+
+    The `.gitignore` files are read from the working tree, so paths need
+    not exist yet under an ignored directory.
+
+    Args:
+        repo: Repository directory.
+        paths: Repository-relative POSIX paths.
+
+    Returns:
+        Ignored paths among paths.
+
+    Raises:
+        subprocess.CalledProcessError: If git fails.
+    """
+    if not paths:
+        return set()
+    try:
+        result = _git(
+            ["check-ignore", "-z", "--stdin"],
+            repo,
+            input="".join(f"{path}\0" for path in paths),
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        # Exit status 1: no path is ignored
+        if e.returncode == 1:
+            return set()
+        raise
+    return set(result.stdout.split("\0")) - {""}
+
+
+@traced(
+    "bootstrap_repository",
+    "git",
+    lambda target_dir, *_, **__: {"repo": str(target_dir)},
+)
+def bootstrap_repository(
+    target_dir: Path,
+    tree: VirtualTree,
+    message: str = INITIAL_COMMIT_MESSAGE,
+    branch: str = DEFAULT_BRANCH,
+) -> bool:
+    """
+    Create a git repository whose first commit holds exactly the tree.
+
+    The tree must already be written to target_dir. Empty directories and
+    ignored files are not recorded, as with `git add`. Commit hooks and
+    signing do not apply to this initial commit.
+
+    Args:
+        target_dir: Project directory.
+        tree: Files of the project.
+        message: Commit message.
+        branch: Initial branch name.
+
+    Returns:
+        True if the repository and its first commit were created.
+    """
+    try:
+        _git(["init", "-q", "-b", branch, "--object-format=sha1"], target_dir)
+        author = git_identity("GIT_AUTHOR_IDENT", target_dir)
+        committer = git_identity("GIT_COMMITTER_IDENT", target_dir)
+
+        files = [entry for entry in tree if not entry.is_dir]
+        ignored = _ignored_paths(target_dir, [str(entry.path) for entry in files])
+        objects = _ObjectWriter(target_dir / ".git" / "objects")
+        tree_id = objects.write_tree(
+            [entry for entry in files if str(entry.path) not in ignored]
+        )
+        now = datetime.now().astimezone()
+        timestamp = f"{int(now.timestamp())} {now.strftime('%z')}"
+        commit_id = objects.write(
+            "commit",
+            (
+                f"tree {tree_id}\n"
+                f"author {author} {timestamp}\n"
+                f"committer {committer} {timestamp}\n"
+                f"\n{message}\n"
+            ).encode(),
+        )
+        subject = message.partition("\n")[0]
+        _git(
+            [
+                "update-ref",
+                "-m",
+                f"commit (initial): {subject}",
+                f"refs/heads/{branch}",
+                commit_id,
+            ],
+            target_dir,
+        )
+
+        _git(["read-tree", branch], target_dir)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+class _ObjectWriter:
+    """Writes loose objects into a repository object database."""
+
+    def __init__(self, objects_dir: Path):
+        self.objects_dir = objects_dir
+
+    def write(self, kind: str, body: bytes) -> str:
+        """Store an object and return its hex id."""
+        raw = f"{kind} {len(body)}\0".encode() + body
+        object_id = hashlib.sha1(raw).hexdigest()
+        path = self.objects_dir / object_id[:2] / object_id[2:]
+        if path.exists():
+            return object_id
+
+        # The repository was just created: nothing else writes to it
+        path.parent.mkdir(exist_ok=True)
+        with open(path, "xb") as f:
+            f.write(zlib.compress(raw, 1))
+        return object_id
+
+    def write_tree(self, entries: list[TreeEntry]) -> str:
+        """Store files of a virtual tree and return the root tree id."""
+        copied = self.write_copies([e.source for e in entries if e.is_copy])
+
+        root: dict = {}
+        for entry in entries:
+            node = root
+            for part in entry.path.parts[:-1]:
+                node = node.setdefault(part, {})
+            mode = _MODE_EXECUTABLE if entry.mode & 0o111 else _MODE_FILE
+            if entry.is_copy:
+                object_id = copied[entry.source]
+            else:
+                object_id = self.write("blob", entry.data)
+            node[entry.path.name] = (mode, object_id)
+        return self._write_node(root)
+
+    def write_copies(self, sources: list[Path]) -> dict[Path, str]:
+        """
+        Store files from disk as blobs, with a single git process.
+
+        Returns:
+            Mapping of source path to blob id.
+        """
+        if not sources:
+            return {}
+        result = _git(
+            ["hash-object", "-w", "--no-filters", "--stdin-paths"],
+            self.objects_dir.parent.parent,
+            input="".join(f"{source.resolve()}\n" for source in sources),
+            text=True,
+        )
+        return dict(zip(sources, result.stdout.split(), strict=True))
+
+    def _write_node(self, node: dict) -> str:
+        """Store one directory level as a tree object."""
+        entries = []
+        for name, value in node.items():
+            if isinstance(value, dict):
+                object_id = self._write_node(value)
+                # Git sorts directories as if their name ended with "/"
+                entries.append((f"{name}/", _MODE_TREE, name, object_id))
+            else:
+                mode, object_id = value
+                entries.append((name, mode, name, object_id))
+
+        body = b"".join(
+            mode + b" " + name.encode("utf-8") + b"\0" + bytes.fromhex(object_id)
+            for _, mode, name, object_id in sorted(
+                entries, key=lambda e: e[0].encode("utf-8")
+            )
+        )
+        return self.write("tree", body)
@@ -0,0 +1,343 @@
+"""Audit history store for projinit v2.0.
+
+`projinit check --record DB` appends every audit to a local SQLite
+database, so conformity can be followed per project and per check over
+time. The schema is normalized for size (a result row is three small
+integers plus its run id) and indexed for the `projinit history` queries:
+
+- projects(id, path, project_type)
+- checks(id, name)
+- runs(id, project_id, recorded_at, score, counters...)
+  indexed on (project_id, recorded_at) and recorded_at
+- results(run_id, check_id, status, level), keyed on (run_id, check_id)
+- changes(run_id, check_id, previous, status, level): the results whose
+  status differs from the previous run of the project, keyed like results
+  and indexed on (check_id, run_id)
+
+Status changes are found once, when a run is recorded (against the latest
+run of its project, so runs must be recorded in chronological order).
+Queries then only touch the rows they report on (latest run per project,
+changes of a time window) through these indexes, and answer in
+milliseconds however many results accumulated. The database uses WAL
+journaling, and records are inserted in a single transaction with batched
+executemany calls.
+"""
+
+import os
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from projinit.core.models import AuditReport, CheckLevel, CheckStatus
+from projinit.core.results import LEVEL_CODES, STATUS_CODES
+
+# Default database of `check --record` and `projinit history`
+DEFAULT_HISTORY_DB = (
+    Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    / "projinit"
+    / "history.db"
+)
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    project_type TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id),
+    recorded_at REAL NOT NULL,
+    score REAL NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    is_compliant INTEGER NOT NULL,
+    execution_time_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_project_time ON runs(project_id, recorded_at);
+CREATE INDEX IF NOT EXISTS runs_time ON runs(recorded_at);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    check_id INTEGER NOT NULL REFERENCES checks(id),
+    status INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    PRIMARY KEY (run_id, check_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS changes (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    check_id INTEGER NOT NULL REFERENCES checks(id),
+    previous INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    PRIMARY KEY (run_id, check_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_check ON changes(check_id, run_id);
+"""
+
+_STATUS_INDEX = {status: code for code, status in enumerate(STATUS_CODES)}
+_LEVEL_INDEX = {level: code for code, level in enumerate(LEVEL_CODES)}
+
+# Latest run of a project, found through runs_project_time
+_LATEST_RUN = """
+    SELECT id FROM runs WHERE project_id = {project}
+    ORDER BY recorded_at DESC LIMIT 1
+"""
+
+
+@dataclass
+class ScorePoint:
+    """Score of a project at one recorded audit."""
+
+    recorded_at: float
+    score: float
+    failed: int
+    is_compliant: bool
+
+
+@dataclass
+class Regression:
+    """A check that passed in a project's previous run and no longer does."""
+
+    project: str
+    check_id: str
+    level: CheckLevel
+    previous: CheckStatus
+    status: CheckStatus
+    recorded_at: float
+
+
+@dataclass
+class ProjectScore:
+    """Latest recorded audit of a project."""
+
+    project: str
+    project_type: str
+    recorded_at: float
+    score: float
+    failed: int
+    is_compliant: bool
+
+
+class HistoryStore:
+    """SQLite database of recorded audits."""
+
+    def __init__(self, db_path: Path | str):
+        """
+        Open (and create if needed) a history database.
+
+        Args:
+            db_path: SQLite database file.
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.conn:
+                self.conn.executescript(_SCHEMA)
+                self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+    def record(
+        self, reports: Iterable[AuditReport], recorded_at: float | None = None
+    ) -> int:
+        """
+        Append audit reports, in a single transaction.
+
+        Args:
+            reports: Reports to record.
+            recorded_at: Unix timestamp of the audits (defaults to now).
+
+        Returns:
+            Number of runs recorded.
+        """
+        if recorded_at is None:
+            recorded_at = time.time()
+        count = 0
+        with self.conn:
+            check_ids = dict(self.conn.execute("SELECT name, id FROM checks"))
+            for report in reports:
+                project_id = self._project_id(report)
+                previous = self._latest_statuses(project_id)
+                new_checks = [(c.id,) for c in report.checks if c.id not in check_ids]
+                if new_checks:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO checks(name) VALUES (?)", new_checks
+                    )
+                    check_ids = dict(self.conn.execute("SELECT name, id FROM checks"))
+
+                run_id = self.conn.execute(
+                    "INSERT INTO runs(project_id, recorded_at, score, passed, "
+                    "failed, warnings, total, is_compliant, execution_time_ms) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        project_id,
+                        recorded_at,
+                        report.score,
+                        report.passed_count,
+                        report.failed_count,
+                        report.warning_count,
+                        report.total_count,
+                        report.is_compliant,
+                        report.execution_time_ms,
+                    ),
+                ).lastrowid
+                # Duplicate check ids keep their last result
+                rows = {
+                    check_ids[c.id]: (_STATUS_INDEX[c.status], _LEVEL_INDEX[c.level])
+                    for c in report.checks
+                }
+                self.conn.executemany(
+                    "INSERT INTO results(run_id, check_id, status, level) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (run_id, check_id, status, level)
+                        for check_id, (status, level) in rows.items()
+                    ],
+                )
+                self.conn.executemany(
+                    "INSERT INTO changes(run_id, check_id, previous, status, level) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (run_id, check_id, previous[check_id], status, level)
+                        for check_id, (status, level) in rows.items()
+                        if previous.get(check_id, status) != status
+                    ],
+                )
+                count += 1
+        return count
+
+    def _project_id(self, report: AuditReport) -> int:
+        """Get (or create) the id of a report's project."""
+        path = str(report.project_path)
+        self.conn.execute(
+            "INSERT INTO projects(path, project_type) VALUES (?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET project_type = excluded.project_type",
+            (path, report.project_type.value),
+        )
+        return self.conn.execute(
+            "SELECT id FROM projects WHERE path = ?", (path,)
+        ).fetchone()[0]
+
+    def _latest_statuses(self, project_id: int) -> dict[int, int]:
+        """Get check id -> status code of a project's latest run."""
+        return dict(
+            self.conn.execute(
+                "SELECT check_id, status FROM results WHERE run_id = "
+                f"({_LATEST_RUN.format(project='?')})",
+                (project_id,),
+            )
+        )
+
+    def score_history(
+        self, project: Path | str, since: float | None = None
+    ) -> list[ScorePoint]:
+        """
+        Get the score of a project over time.
+
+        Args:
+            project: Project path, as recorded.
+            since: Only runs recorded at or after this Unix timestamp.
+
+        Returns:
+            Score points, oldest first.
+        """
+        rows = self.conn.execute(
+            "SELECT r.recorded_at, r.score, r.failed, r.is_compliant "
+            "FROM runs r JOIN projects ON projects.id = r.project_id "
+            "WHERE projects.path = ? AND r.recorded_at >= ? "
+            "ORDER BY r.recorded_at",
+            (str(project), since or 0),
+        )
+        return [
+            ScorePoint(recorded_at, score, failed, bool(compliant))
+            for recorded_at, score, failed, compliant in rows
+        ]
+
+    def regressions(
+        self, since: float, check_id: str | None = None
+    ) -> list[Regression]:
+        """
+        Find checks that stopped passing in runs recorded since a date.
+
+        Args:
+            since: Unix timestamp of the start of the window.
+            check_id: Only report this check.
+
+        Returns:
+            Regressions, most recent first.
+        """
+        where = "r.recorded_at >= ? AND c.previous = ? AND c.status IN (?, ?)"
+        params: list = [
+            since,
+            _STATUS_INDEX[CheckStatus.PASSED],
+            _STATUS_INDEX[CheckStatus.FAILED],
+            _STATUS_INDEX[CheckStatus.WARNING],
+        ]
+        if check_id is not None:
+            where += " AND checks.name = ?"
+            params.append(check_id)
+        # CROSS JOIN keeps SQLite on the time index: runs of the window first
+        rows = self.conn.execute(
+            f"""
+            SELECT projects.path, checks.name, c.level, c.previous, c.status,
+                   r.recorded_at
+            FROM runs r
+            CROSS JOIN changes c ON c.run_id = r.id
+            JOIN projects ON projects.id = r.project_id
+            JOIN checks ON checks.id = c.check_id
+            WHERE {where}
+            ORDER BY r.recorded_at DESC, projects.path, checks.name
+            """,
+            params,
+        )
+        return [
+            Regression(
+                project=path,
+                check_id=name,
+                level=LEVEL_CODES[level],
+                previous=STATUS_CODES[previous],
+                status=STATUS_CODES[status],
+                recorded_at=recorded_at,
+            )
+            for path, name, level, previous, status, recorded_at in rows
+        ]
+
+    def worst_projects(self, limit: int = 10) -> list[ProjectScore]:
+        """
+        Rank projects by the score of their latest run.
+
+        Args:
+            limit: Maximum number of projects.
+
+        Returns:
+            Latest runs, lowest score first.
+        """
+        rows = self.conn.execute(
+            f"""
+            SELECT projects.path, projects.project_type, r.recorded_at,
+                   r.score, r.failed, r.is_compliant
+            FROM projects JOIN runs r ON r.id = ({_LATEST_RUN.format(project="projects.id")})
+            ORDER BY r.score, r.failed DESC, projects.path
+            LIMIT ?
+            """,
+            (limit,),
+        )
+        return [
+            ProjectScore(path, project_type, recorded_at, score, failed, bool(ok))
+            for path, project_type, recorded_at, score, failed, ok in rows
+        ]
@@ -0,0 +1,178 @@
+"""Memory profiling of audits for projinit v2.0.
+
+`projinit check --memprofile FILE` traces allocations with tracemalloc and
+splits each project of the run into phases (detection, standards load,
+checks, reporting). At each phase boundary a snapshot is taken and its
+allocations per line are compared with those of the previous boundary,
+and the peak of the phase is read then reset. The JSON profile gives:
+
+- per phase: memory retained over all projects, highest peak and the
+  top allocation sites (file and line) of the memory it retained;
+- per project: peak traced memory and, for each phase, its peak and the
+  memory it retained.
+
+Without --memprofile, check uses NullProfiler, whose methods do nothing.
+"""
+
+import json
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+TOP_SITES = 10
+
+# Allocations of the profiler itself and of the import machinery. They are
+# left out of the per-line totals rather than filtered from snapshots:
+# Snapshot.filter_traces matches every trace in Python and would cost more
+# than the audit.
+_IGNORED_FILES = frozenset(
+    (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>")
+)
+
+
+class MemoryProfiler:
+    """Records the memory of each phase of each audited project."""
+
+    def __init__(self, top: int = TOP_SITES, frames: int = 1):
+        """
+        Initialize the profiler.
+
+        Args:
+            top: Allocation sites kept per phase.
+            frames: Stack frames stored per allocation (more frames cost
+                more memory and time).
+        """
+        self.top = top
+        self.frames = frames
+        self.repos: list[dict] = []
+        self.peak_bytes = 0
+        # Phase name -> retained bytes, highest peak and site -> [size, count]
+        self._phases: dict[str, dict] = {}
+        self._repo: dict | None = None
+        # (size, count) per allocation site at the previous phase boundary
+        self._sites: dict[str, tuple[int, int]] | None = None
+        self._owns_tracing = False
+
+    def start(self) -> None:
+        """Start tracing allocations (if not already traced)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+
+    @contextmanager
+    def repo(self, path: Path | str) -> Iterator[None]:
+        """Profile the audit of one project, as the phases recorded within."""
+        self._repo = {"repo": str(path), "peak_bytes": 0, "phases": {}}
+        if self._sites is None:
+            # Later projects start from the last boundary of the previous one
+            self._sites = _allocation_sites()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            _current, peak = tracemalloc.get_traced_memory()
+            repo = self._repo
+            repo["peak_bytes"] = max(repo["peak_bytes"], peak)
+            self.peak_bytes = max(self.peak_bytes, repo["peak_bytes"])
+            self.repos.append(repo)
+            self._repo = None
+
+    def phase(self, name: str) -> None:
+        """
+        End a phase of the current project.
+
+        The phase covers the allocations since the start of the project or
+        the end of its previous phase.
+        """
+        if self._repo is None:
+            return
+        _current, peak = tracemalloc.get_traced_memory()
+        previous, current = self._sites, _allocation_sites()
+        differences = {}
+        for site in previous.keys() | current.keys():
+            size, count = current.get(site, (0, 0))
+            old_size, old_count = previous.get(site, (0, 0))
+            if size != old_size or count != old_count:
+                differences[site] = (size - old_size, count - old_count)
+        retained = sum(size for size, _count in differences.values())
+        self._sites = current
+        tracemalloc.reset_peak()
+
+        self._repo["peak_bytes"] = max(self._repo["peak_bytes"], peak)
+        self._repo["phases"][name] = {"peak_bytes": peak, "retained_bytes": retained}
+
+        totals = self._phases.setdefault(
+            name, {"retained_bytes": 0, "peak_bytes": 0, "sites": {}}
+        )
+        totals["retained_bytes"] += retained
+        totals["peak_bytes"] = max(totals["peak_bytes"], peak)
+        sites = totals["sites"]
+        for site, (size, count) in differences.items():
+            entry = sites.setdefault(site, [0, 0])
+            entry[0] += size
+            entry[1] += count
+
+    def stop(self) -> dict:
+        """
+        Stop tracing and build the profile.
+
+        Returns:
+            The JSON-serializable profile.
+        """
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+        return {
+            "frames": self.frames,
+            "peak_bytes": self.peak_bytes,
+            "phases": {
+                name: {
+                    "retained_bytes": totals["retained_bytes"],
+                    "peak_bytes": totals["peak_bytes"],
+                    "top_sites": self._top_sites(totals["sites"]),
+                }
+                for name, totals in self._phases.items()
+            },
+            "repos": self.repos,
+        }
+
+    def save(self, path: Path) -> dict:
+        """Stop tracing and write the profile as JSON."""
+        profile = self.stop()
+        path.write_text(json.dumps(profile, indent=2) + "\n", encoding="utf-8")
+        return profile
+
+    def _top_sites(self, sites: dict[str, list[int]]) -> list[dict]:
+        """Sites that retained the most memory, largest first."""
+        ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {"site": site, "size_bytes": size, "count": count}
+            for site, (size, count) in ranked[: self.top]
+            if size > 0
+        ]
+
+
+def _allocation_sites() -> dict[str, tuple[int, int]]:
+    """Snapshot traced memory as (size, count) per "file:line" site."""
+    sites = {}
+    for statistic in tracemalloc.take_snapshot().statistics("lineno"):
+        frame = statistic.traceback[0]
+        if frame.filename not in _IGNORED_FILES:
+            sites[f"{frame.filename}:{frame.lineno}"] = (
+                statistic.size,
+                statistic.count,
+            )
+    return sites
+
+
+class NullProfiler:
+    """Profiler used without --memprofile: records nothing."""
+
+    @contextmanager
+    def repo(self, path: Path | str) -> Iterator[None]:
+        """Run the audit of a project unprofiled."""
+        yield
+
+    def phase(self, name: str) -> None:
+        """Do nothing."""
@@ -1,88 +1,202 @@
 """Intelligent file merging for projinit v2.0."""
 
+import json
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
 
-def merge_yaml(existing: dict, template: dict) -> dict:
+# Fields identifying list items when merging lists of mappings, in priority order
+DEFAULT_KEY_FIELDS: tuple[str, ...] = ("id", "name", "repo")
+
+
+def deep_merge(
+    base: dict,
+    overlay: dict,
+    key_fields: tuple[str, ...] = DEFAULT_KEY_FIELDS,
+    overwrite: bool = False,
+) -> dict:
     """
-    Merge a template YAML into existing YAML content.
+    Merge an overlay mapping into a base mapping.
 
-    Preserves existing values while adding missing keys from template.
-    Lists are concatenated (avoiding duplicates by key fields).
+    Missing keys are added, nested mappings are merged recursively and lists
+    are merged with merge_lists. Neither input is modified.
 
     Args:
-        existing: The existing YAML content as dict.
-        template: The template content to merge.
+        base: The base mapping.
+        overlay: The mapping to merge into base.
+        key_fields: Fields identifying list items (see merge_lists).
+        overwrite: If True, overlay scalars replace base values; otherwise
+            base values are kept.
 
     Returns:
         Merged dictionary.
     """
-    result = existing.copy()
+    result = dict(base)
 
-    for key, value in template.items():
+    for key, value in overlay.items():
         if key not in result:
-            # Key doesn't exist, add it
             result[key] = value
         elif isinstance(value, dict) and isinstance(result[key], dict):
-            # Both are dicts, merge recursively
-            result[key] = merge_yaml(result[key], value)
+            result[key] = deep_merge(result[key], value, key_fields, overwrite)
         elif isinstance(value, list) and isinstance(result[key], list):
-            # Both are lists, merge intelligently
-            result[key] = _merge_lists(result[key], value)
-        # else: keep existing value (don't overwrite)
+            result[key] = merge_lists(result[key], value, key_fields)
+        elif overwrite:
+            result[key] = value
 
     return result
 
 
-def _merge_lists(existing: list, template: list) -> list:
+def merge_lists(
+    existing: list,
+    template: list,
+    key_fields: tuple[str, ...] = DEFAULT_KEY_FIELDS,
+    replace: bool = False,
+) -> list:
     """
     Merge two lists, avoiding duplicates.
 
-    For lists of dicts, uses 'id', 'name', or 'repo' as unique key.
-    For lists of primitives, adds missing items.
-    """
-    result = existing.copy()
+    Mappings are matched on the first of key_fields they define; other items
+    are matched by value. Matching uses a hash index built in one pass over
+    existing, so merging is linear in the size of both lists.
 
-    # Try to find a unique key for dict items
-    key_fields = ["id", "name", "repo"]
+    Args:
+        existing: The existing list.
+        template: Items to merge into existing.
+        key_fields: Fields identifying mappings, in priority order.
+        replace: If True, template items replace the existing items they
+            match; otherwise existing items are kept.
+
+    Returns:
+        Merged list (existing is not modified).
+    """
+    result = list(existing)
+    index = _ListIndex(key_fields)
+    for position, item in enumerate(result):
+        index.add(item, position)
 
     for item in template:
-        if isinstance(item, dict):
-            # Find unique key
-            unique_key = None
-            unique_value = None
-            for kf in key_fields:
-                if kf in item:
-                    unique_key = kf
-                    unique_value = item[kf]
-                    break
-
-            if unique_key:
-                # Check if already exists
-                exists = any(
-                    isinstance(e, dict) and e.get(unique_key) == unique_value
-                    for e in result
-                )
-                if not exists:
-                    result.append(item)
-            else:
-                # No unique key, add if not equal to any existing
-                if item not in result:
-                    result.append(item)
-        else:
-            # Primitive value
-            if item not in result:
-                result.append(item)
+        position = index.find(item)
+        if position is None:
+            index.add(item, len(result))
+            result.append(item)
+        elif replace:
+            result[position] = item
 
     return result
 
 
+def merge_yaml(existing: dict, template: dict) -> dict:
+    """
+    Merge a template YAML into existing YAML content.
+
+    Preserves existing values while adding missing keys from template.
+    Lists are concatenated (avoiding duplicates by key fields).
+
+    Args:
+        existing: The existing YAML content as dict.
+        template: The template content to merge.
+
+    Returns:
+        Merged dictionary.
+    """
+    return deep_merge(existing, template)
+
+
+class _ListIndex:
+    """Hash index of list items by key field value or by content."""
+
+    def __init__(self, key_fields: tuple[str, ...]):
+        self.key_fields = key_fields
+        self.by_key: dict[tuple, int] = {}
+        self.by_value: dict[object, int] = {}
+
+    def add(self, item: object, position: int) -> None:
+        """Index an item at a position (first occurrence wins)."""
+        if isinstance(item, dict):
+            keyed = False
+            for field_name in self.key_fields:
+                if field_name in item:
+                    key = (field_name, _freeze(item[field_name]))
+                    self.by_key.setdefault(key, position)
+                    keyed = True
+            if keyed:
+                return
+        self.by_value.setdefault(_freeze(item), position)
+
+    def find(self, item: object) -> int | None:
+        """Get the position of the item matching this one, if any."""
+        if isinstance(item, dict):
+            for field_name in self.key_fields:
+                if field_name in item:
+                    return self.by_key.get((field_name, _freeze(item[field_name])))
+        return self.by_value.get(_freeze(item))
+
+
+def _freeze(value: object) -> object:
+    """Convert a YAML value into a hashable equivalent."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+# Line patterns used to locate blocks in .pre-commit-config.yaml
+_TOP_LEVEL_REPOS = re.compile(r"^repos:(?P<rest>.*)$")
+# Quoted or plain mapping key at column 0 (plain keys cannot start with an
+# indicator character)
+_TOP_LEVEL_KEY = re.compile(
+    r"^(?:\"[^\"]*\"|'[^']*'|[^\s#'\"{}\[\],&*!|>%@`?:-][^#]*?)[ \t]*:(?:[ \t]|$)"
+)
+_REPO_KEY = re.compile(r"^[ \t]*(?:-[ \t]+)?repo:[ \t]*(?P<value>[^\s#]+)")
+_REV_KEY = re.compile(r"^(?P<prefix>[ \t]*(?:-[ \t]+)?rev:[ \t]*)(?P<value>[^\s#]+)")
+_HOOKS_KEY = re.compile(r"^[ \t]*(?:-[ \t]+)?hooks:[ \t]*(?:#.*)?$")
+_HOOK_ID = re.compile(r"^[ \t]*(?:-[ \t]+)?id:[ \t]*(?P<value>[^\s#]+)")
+
+
+class _IndentDumper(yaml.SafeDumper):
+    """YAML dumper that indents block sequences under their parent key."""
+
+    def increase_indent(self, flow: bool = False, indentless: bool = False):
+        return super().increase_indent(flow, False)
+
+
+@dataclass
+class _RepoBlock:
+    """Location of a repo entry in the repos sequence (line indexes)."""
+
+    start: int
+    end: int
+    url: str | None = None
+    rev_line: int | None = None
+    hooks_line: int | None = None
+    hook_ids: set[str] = field(default_factory=set)
+
+
 def merge_precommit_config(existing_path: Path, hooks_to_add: list[dict]) -> str:
     """
     Merge pre-commit hooks into an existing config file.
 
+    Missing repo and hook blocks are inserted as text edits into the
+    ``repos:`` sequence, so comments and formatting are preserved. The
+    result is validated by a line check of the top-level structure and by
+    re-parsing only the edited blocks. Layouts that cannot be patched
+    safely (flow style, unusual nesting) fall back to a full parse-and-dump
+    merge.
+
     Args:
         existing_path: Path to existing .pre-commit-config.yaml
         hooks_to_add: List of repo definitions to add
@@ -92,39 +206,372 @@ def merge_precommit_config(existing_path: Path, hooks_to_add: list[dict]) -> str
     """
     try:
         content = existing_path.read_text(encoding="utf-8")
+    except OSError:
+        content = ""
+
+    try:
+        patched = _patch_precommit_text(content, hooks_to_add)
+    except (ValueError, yaml.YAMLError):
+        patched = None
+
+    if patched is not None:
+        return patched
+
+    return _merge_precommit_full(content, hooks_to_add)
+
+
+def _is_flow_document(lines: list[str]) -> bool:
+    """Check if the first YAML node of a document is in flow style."""
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(("#", "%", "---")):
+            return stripped.startswith(("{", "["))
+    return False
+
+
+def _patch_precommit_text(content: str, hooks_to_add: list[dict]) -> str | None:
+    """
+    Insert missing repos and hooks into the text of a pre-commit config.
+
+    Returns:
+        Patched content, or None if the layout cannot be patched safely.
+    """
+    lines = content.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+
+    repos_line = None
+    for i, line in enumerate(lines):
+        match = _TOP_LEVEL_REPOS.match(line)
+        if match:
+            rest = match.group("rest").strip()
+            if rest and not rest.startswith("#"):
+                # Flow style (e.g. "repos: []"), not patchable as text
+                return None
+            repos_line = i
+            break
+
+    if repos_line is None:
+        if _is_flow_document(lines):
+            # A flow mapping cannot take a block "repos:" key
+            return None
+        lines.append("repos:\n")
+        repos_line = len(lines) - 1
+
+    blocks, seq_indent, region_end = _scan_repos(lines, repos_line)
+    if blocks is None:
+        return None
+
+    by_url = {block.url: block for block in blocks if block.url}
+    separated = any(lines[block.start - 1].strip() == "" for block in blocks[1:])
+
+    # Edits are collected as (line index, new lines) insertions and
+    # (line index, replacement) substitutions, then applied bottom-up.
+    insertions: dict[int, list[str]] = {}
+    replacements: dict[int, str] = {}
+    new_repos: list[str] = []
+    edited: set[str] = set()
+
+    for hook_def in hooks_to_add:
+        repo_url = hook_def.get("repo")
+        if not repo_url:
+            continue
+
+        block = by_url.get(repo_url)
+        if block is None:
+            if separated:
+                new_repos.append("\n")
+            new_repos.extend(_render_block([hook_def], seq_indent))
+            by_url[repo_url] = _RepoBlock(start=-1, end=-1, url=repo_url)
+            edited.add(repo_url)
+            continue
+
+        if block.start < 0:
+            # Repo added earlier in this merge, nothing more to patch
+            continue
+
+        missing = [
+            hook
+            for hook in hook_def.get("hooks", [])
+            if hook.get("id") and hook["id"] not in block.hook_ids
+        ]
+        if missing:
+            if block.hooks_line is None:
+                return None
+            hook_indent, hooks_end = _scan_hooks(lines, block)
+            if hook_indent is None:
+                return None
+            insertions.setdefault(hooks_end, []).extend(
+                _render_block(missing, hook_indent)
+            )
+            block.hook_ids.update(h["id"] for h in missing)
+            edited.add(repo_url)
+
+        if hook_def.get("rev") and block.rev_line is not None:
+            rev_line = _replace_rev(lines[block.rev_line], str(hook_def["rev"]))
+            if rev_line != lines[block.rev_line]:
+                replacements[block.rev_line] = rev_line
+                edited.add(repo_url)
+
+    if new_repos:
+        insertions.setdefault(region_end, []).extend(new_repos)
+
+    if not insertions and not replacements:
+        return content
+
+    patched = list(lines)
+    for index, line in replacements.items():
+        patched[index] = line
+    for index in sorted(insertions, reverse=True):
+        patched[index:index] = insertions[index]
+
+    result = "".join(patched)
+    _validate_patch(result, hooks_to_add, edited)
+    return result
+
+
+def _scan_repos(
+    lines: list[str], repos_line: int
+) -> tuple[list[_RepoBlock] | None, int, int]:
+    """
+    Locate repo entries in the ``repos:`` sequence.
+
+    Returns:
+        Tuple of (blocks or None if unpatchable, item indent, insertion line).
+    """
+    blocks: list[_RepoBlock] = []
+    seq_indent: int | None = None
+    last_content = repos_line
+
+    i = repos_line + 1
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            i += 1
+            continue
+
+        indent = _indent(line)
+        is_item = stripped.startswith("-")
+
+        if indent == 0 and not (is_item and seq_indent in (None, 0)):
+            # Next top-level key: end of the repos sequence
+            break
+
+        if seq_indent is None:
+            if not is_item:
+                return None, 0, 0
+            seq_indent = indent
+
+        if is_item and indent == seq_indent:
+            if blocks:
+                blocks[-1].end = i
+            blocks.append(_RepoBlock(start=i, end=i))
+        elif indent <= seq_indent:
+            return None, 0, 0
+
+        block = blocks[-1]
+        if block.url is None and (match := _REPO_KEY.match(line)):
+            block.url = match.group("value").strip("\"'")
+        elif block.rev_line is None and _REV_KEY.match(line):
+            block.rev_line = i
+        elif block.hooks_line is None and _HOOKS_KEY.match(line):
+            block.hooks_line = i
+        elif block.hooks_line is not None and (match := _HOOK_ID.match(line)):
+            block.hook_ids.add(match.group("value").strip("\"'"))
+
+        last_content = i
+        i += 1
+
+    if blocks:
+        blocks[-1].end = last_content + 1
+
+    return blocks, 2 if seq_indent is None else seq_indent, last_content + 1
+
+
+def _scan_hooks(lines: list[str], block: _RepoBlock) -> tuple[int | None, int]:
+    """
+    Locate the hooks sequence of a repo entry.
+
+    Returns:
+        Tuple of (hook item indent or None if unpatchable, insertion line).
+    """
+    hooks_indent = _indent(lines[block.hooks_line].replace("-", " ", 1))
+    hook_indent = None
+    last_content = block.hooks_line
+
+    for i in range(block.hooks_line + 1, block.end):
+        stripped = lines[i].strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        indent = _indent(lines[i])
+        if hook_indent is None:
+            if not stripped.startswith("-") or indent < hooks_indent:
+                return None, 0
+            hook_indent = indent
+        if indent < hook_indent or (
+            indent == hook_indent and not stripped.startswith("-")
+        ):
+            break
+        last_content = i
+
+    return hook_indent, last_content + 1
+
+
+def _render_block(items: list[dict], indent: int) -> list[str]:
+    """Render sequence items as block YAML lines at a given indent."""
+    text = yaml.dump(
+        items,
+        Dumper=_IndentDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
+    # Re-parse only the rendered region to make sure it round-trips
+    if yaml.safe_load(text) != items:
+        raise ValueError("Rendered pre-commit block does not round-trip")
+    prefix = " " * indent
+    return [prefix + line if line.strip() else line for line in text.splitlines(True)]
+
+
+def _replace_rev(line: str, rev: str) -> str:
+    """Replace the value of a ``rev:`` line, keeping quoting and comments."""
+    match = _REV_KEY.match(line)
+    value = match.group("value")
+    quote = value[0] if value[:1] in ("'", '"') else ""
+    return (
+        line[: match.start("value")]
+        + f"{quote}{rev}{quote}"
+        + line[match.end("value") :]
+    )
+
+
+def _validate_patch(content: str, hooks_to_add: list[dict], edited: set[str]) -> None:
+    """
+    Validate a patched config.
+
+    The top-level structure is checked line by line, then only the entries
+    touched by the merge are extracted and re-parsed.
+
+    Raises:
+        ValueError: If the document is not a block mapping with one repos
+            key, or an edited entry does not contain the expected hooks.
+    """
+    lines = content.splitlines(keepends=True)
+    repos_line = _validate_top_level(lines)
+
+    blocks, _, _ = _scan_repos(lines, repos_line)
+    if blocks is None:
+        raise ValueError("repos sequence unreadable after patch")
+
+    by_url = {block.url: block for block in blocks}
+    for hook_def in hooks_to_add:
+        repo_url = hook_def.get("repo")
+        if repo_url not in edited:
+            continue
+
+        block = by_url.get(repo_url)
+        if block is None:
+            raise ValueError(f"repo {repo_url} missing after patch")
+
+        # An indented block sequence is a valid YAML document on its own
+        parsed = yaml.safe_load("".join(lines[block.start : block.end]))
+        if (
+            not isinstance(parsed, list)
+            or len(parsed) != 1
+            or not isinstance(parsed[0], dict)
+        ):
+            raise ValueError(f"invalid entry for repo {repo_url}")
+        ids = {hook.get("id") for hook in parsed[0].get("hooks") or []}
+        expected = {hook.get("id") for hook in hook_def.get("hooks", [])}
+        if not expected <= ids:
+            raise ValueError(f"hooks missing for repo {repo_url}")
+
+
+def _validate_top_level(lines: list[str]) -> int:
+    """
+    Check that a document is a block mapping with a single ``repos:`` key.
+
+    Every line at column 0 must be a mapping key, a comment, a document
+    marker or an item of the ``repos:`` sequence.
+
+    Returns:
+        Index of the ``repos:`` line.
+
+    Raises:
+        ValueError: If the top-level node is not a block mapping.
+    """
+    if _is_flow_document(lines):
+        raise ValueError("flow-style document after patch")
+
+    repos_line = None
+    in_repos = False
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#") or line[:1] in (" ", "\t"):
+            continue
+        if line.startswith(("---", "...", "%")):
+            in_repos = False
+            continue
+        if _TOP_LEVEL_REPOS.match(line):
+            if repos_line is not None:
+                raise ValueError("duplicate repos key after patch")
+            repos_line = i
+            in_repos = True
+        elif stripped.startswith("-") and in_repos:
+            continue
+        elif _TOP_LEVEL_KEY.match(line):
+            in_repos = False
+        else:
+            raise ValueError(f"unexpected top-level line {i + 1} after patch")
+
+    if repos_line is None:
+        raise ValueError("repos key missing after patch")
+    return repos_line
+
+
+def _indent(line: str) -> int:
+    """Get the indentation width of a line."""
+    return len(line) - len(line.lstrip(" \t"))
+
+
+def _merge_precommit_full(content: str, hooks_to_add: list[dict]) -> str:
+    """Merge pre-commit hooks by parsing and re-dumping the whole file."""
+    try:
         existing = yaml.safe_load(content) or {}
-    except (OSError, yaml.YAMLError):
+    except yaml.YAMLError:
+        existing = {}
+    if not isinstance(existing, dict):
         existing = {}
 
     if "repos" not in existing:
         existing["repos"] = []
 
+    repos_by_url = {
+        repo.get("repo"): repo for repo in existing["repos"] if isinstance(repo, dict)
+    }
+
     for hook_def in hooks_to_add:
         repo_url = hook_def.get("repo")
         if not repo_url:
             continue
 
-        # Check if repo already exists
-        existing_repo = None
-        for repo in existing["repos"]:
-            if repo.get("repo") == repo_url:
-                existing_repo = repo
-                break
-
+        existing_repo = repos_by_url.get(repo_url)
         if existing_repo:
             # Merge hooks into existing repo
-            existing_hooks = existing_repo.get("hooks", [])
-            for hook in hook_def.get("hooks", []):
-                hook_id = hook.get("id")
-                if hook_id and not any(h.get("id") == hook_id for h in existing_hooks):
-                    existing_hooks.append(hook)
-            existing_repo["hooks"] = existing_hooks
+            existing_repo["hooks"] = merge_lists(
+                existing_repo.get("hooks") or [],
+                hook_def.get("hooks", []),
+                key_fields=("id",),
+            )
             # Update rev if newer
             if hook_def.get("rev"):
                 existing_repo["rev"] = hook_def["rev"]
         else:
             # Add new repo
             existing["repos"].append(hook_def)
+            repos_by_url[repo_url] = hook_def
 
     return yaml.dump(
         existing, default_flow_style=False, allow_unicode=True, sort_keys=False
@@ -133,9 +580,12 @@ def merge_precommit_config(existing_path: Path, hooks_to_add: list[dict]) -> str
 
 def merge_toml_section(existing_content: str, section: str, values: dict) -> str:
     """
-    Add or update a TOML section in existing content.
+    Add a TOML table or its missing keys to existing content.
 
-    Simple implementation that appends section if not present.
+    The document is parsed once with tomllib to find which keys are missing.
+    Table boundaries are then located in the source by offset, and only the
+    missing ``key = value`` lines are spliced into the table body (or a new
+    table is appended). Comments and formatting are preserved.
 
     Args:
         existing_content: Existing TOML file content.
@@ -143,24 +593,176 @@ def merge_toml_section(existing_content: str, section: str, values: dict) -> str
         values: Dict of values to set in section.
 
     Returns:
-        Updated TOML content.
+        Updated TOML content (unchanged if the document is not valid TOML).
     """
-    # Check if section exists
-    if section in existing_content:
-        # Section exists, don't modify
+    table_path = _split_toml_key(section.strip().strip("[]"))
+    try:
+        document = tomllib.loads(existing_content)
+    except tomllib.TOMLDecodeError:
         return existing_content
 
-    # Append section
-    lines = [existing_content.rstrip(), "", section]
-    for key, value in values.items():
-        if isinstance(value, str):
-            lines.append(f'{key} = "{value}"')
-        elif isinstance(value, list):
-            list_str = ", ".join(
-                f'"{v}"' if isinstance(v, str) else str(v) for v in value
-            )
-            lines.append(f"{key} = [{list_str}]")
-        else:
-            lines.append(f"{key} = {value}")
+    table: object = document
+    for part in table_path:
+        table = table.get(part) if isinstance(table, dict) else None
+    if table is not None and not isinstance(table, dict):
+        # Scalar or array of tables: not a table we can extend
+        return existing_content
+
+    missing = {k: v for k, v in values.items() if table is None or k not in table}
+    if not missing:
+        return existing_content
+
+    new_lines = [
+        f"{_format_toml_key(k)} = {_format_toml_value(v)}" for k, v in missing.items()
+    ]
+    # Re-parse only the generated lines to validate them
+    tomllib.loads("\n".join(new_lines))
+
+    # Added lines follow the line endings of the document
+    newline = "\r\n" if "\r\n" in existing_content else "\n"
+    headers = _scan_toml_tables(existing_content)
+    span = headers.get(tuple(table_path))
+    if span is not None:
+        insert_at = span
+        prefix = "" if existing_content[:insert_at].endswith("\n") else newline
+        insertion = prefix + newline.join(new_lines) + newline
+        return existing_content[:insert_at] + insertion + existing_content[insert_at:]
+
+    lines = [existing_content.rstrip(), "", section, *new_lines]
+    if not existing_content.strip():
+        lines = [section, *new_lines]
+    result = newline.join(lines) + newline
+
+    if table is None and _ancestors_declared_by_headers(document, table_path, headers):
+        return result
+
+    # The table (or an ancestor) is defined by dotted keys or inline tables:
+    # appending a header may be invalid, so validate the whole document.
+    try:
+        tomllib.loads(result)
+    except tomllib.TOMLDecodeError:
+        return existing_content
+    return result
+
 
-    return "\n".join(lines) + "\n"
+# Line patterns used to locate tables in TOML source
+_TOML_HEADER = re.compile(
+    r"^[ \t]*\[(?P<array>\[)?[ \t]*(?P<name>[^\]]+?)[ \t]*\]\]?[ \t]*(?:#.*)?\r?$"
+)
+_TOML_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+_TOML_STRING = re.compile(r"\"(?:\\.|[^\"\\])*\"|'[^']*'")
+_TOML_COMMENT = re.compile(r"#.*")
+
+
+def _scan_toml_tables(content: str) -> dict[tuple[str, ...], int]:
+    """
+    Locate table bodies in TOML source.
+
+    Returns:
+        Mapping of table path to the offset just after the last key/value
+        line of its body (or after the header line if the body is empty).
+    """
+    tables: dict[tuple[str, ...], int] = {}
+    current: tuple[str, ...] | None = None
+    in_string: str | None = None
+    depth = 0
+    offset = 0
+
+    for line in content.splitlines(keepends=True):
+        end = offset + len(line)
+        stripped = line.strip()
+
+        if in_string:
+            if line.count(in_string) % 2 == 1:
+                in_string = None
+            if current is not None:
+                tables[current] = end
+        elif stripped and not stripped.startswith("#"):
+            match = _TOML_HEADER.match(line) if depth == 0 else None
+            if match:
+                current = tuple(_split_toml_key(match.group("name")))
+                if match.group("array"):
+                    # Arrays of tables are never extended in place
+                    current = None
+                else:
+                    tables[current] = end
+            else:
+                for quote in ('"""', "'''"):
+                    if line.count(quote) % 2 == 1:
+                        in_string = quote
+                        break
+                # Track multi-line arrays so their lines are not taken as headers
+                code = _TOML_COMMENT.sub("", _TOML_STRING.sub("", line))
+                depth = max(depth + code.count("[") - code.count("]"), 0)
+                if current is not None:
+                    tables[current] = end
+
+        offset = end
+
+    return tables
+
+
+def _ancestors_declared_by_headers(
+    document: dict, table_path: list[str], headers: dict[tuple[str, ...], int]
+) -> bool:
+    """Check that every existing ancestor of a table comes from a [header]."""
+    node: object = document
+    for depth in range(1, len(table_path)):
+        node = node.get(table_path[depth - 1]) if isinstance(node, dict) else None
+        if node is None:
+            return True
+        prefix = tuple(table_path[:depth])
+        if prefix not in headers and not any(
+            h[:depth] == prefix and len(h) > depth for h in headers
+        ):
+            return False
+    return True
+
+
+def _split_toml_key(key: str) -> list[str]:
+    """Split a dotted TOML key into its parts, honouring quotes."""
+    parts: list[str] = []
+    current = ""
+    quote: str | None = None
+
+    for char in key:
+        if quote:
+            if char == quote:
+                quote = None
+            else:
+                current += char
+        elif char in ('"', "'"):
+            quote = char
+        elif char == ".":
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    parts.append(current.strip())
+
+    return parts
+
+
+def _format_toml_key(key: str) -> str:
+    """Format a TOML key, quoting it when it is not a bare key."""
+    return key if _TOML_BARE_KEY.match(key) else json.dumps(key)
+
+
+def _format_toml_value(value: object) -> str:
+    """Format a Python value as a TOML value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_format_toml_value(v) for v in value) + "]"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_format_toml_key(k)} = {_format_toml_value(v)}" for k, v in value.items()
+        )
+        return "{" + items + "}"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise ValueError(f"Unsupported TOML value: {value!r}")
@@ -0,0 +1,138 @@
+"""Prometheus textfile metrics for projinit v2.0.
+
+`projinit check --metrics-file FILE.prom` writes the conformity of the
+audited projects in the Prometheus text exposition format, for the
+textfile collector of node-exporter. Every sample is labelled by `repo`
+and `project_type`:
+
+- projinit_score_ratio: conformity score, from 0 to 1;
+- projinit_compliant: 1 if no required check failed;
+- projinit_failed_checks: failed checks, by `level`;
+- projinit_check_status: 1 for the status of each check (`check`,
+  `level` and `status` labels, one sample per check);
+- projinit_audit_duration_seconds: time spent running the checks;
+- projinit_audit_timestamp_seconds: when the project was audited.
+
+The whole file is rewritten atomically (core.writer.atomic_write), so the
+collector never reads a partial file. During a fleet run it is
+rewritten as projects complete, at most once per interval, then a last
+time at the end of the run.
+"""
+
+import time
+from pathlib import Path
+
+from projinit.core.models import AuditReport, CheckLevel
+from projinit.core.writer import atomic_write
+
+DEFAULT_INTERVAL = 5.0
+
+# Metric families: name -> help text (all gauges, written in this order)
+METRICS = {
+    "projinit_score_ratio": "Conformity score of the project (0 to 1).",
+    "projinit_compliant": "1 if the project passes all required checks.",
+    "projinit_failed_checks": "Number of failed checks, by level.",
+    "projinit_check_status": "1 for the current status of each check.",
+    "projinit_audit_duration_seconds": "Time spent running the checks.",
+    "projinit_audit_timestamp_seconds": "Unix time of the audit.",
+}
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value (backslash, double quote and line feed)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Format a label set."""
+    return ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items())
+
+
+def report_samples(report: AuditReport, timestamp: float) -> dict[str, list[str]]:
+    """
+    Render the samples of one project.
+
+    Args:
+        report: Audit of the project.
+        timestamp: Unix time of the audit.
+
+    Returns:
+        Sample lines per metric family.
+    """
+    project = _labels(
+        repo=str(report.project_path), project_type=report.project_type.value
+    )
+    failed = dict.fromkeys(CheckLevel, 0)
+    for check in report.failed_checks:
+        failed[check.level] += 1
+
+    return {
+        "projinit_score_ratio": [
+            f"projinit_score_ratio{{{project}}} {report.score / 100:.4g}"
+        ],
+        "projinit_compliant": [
+            f"projinit_compliant{{{project}}} {int(report.is_compliant)}"
+        ],
+        "projinit_failed_checks": [
+            f'projinit_failed_checks{{{project},level="{level.value}"}} {count}'
+            for level, count in failed.items()
+        ],
+        "projinit_check_status": [
+            f"projinit_check_status{{{project},"
+            + _labels(check=c.id, level=c.level.value, status=c.status.value)
+            + "} 1"
+            for c in report.checks
+        ],
+        "projinit_audit_duration_seconds": [
+            f"projinit_audit_duration_seconds{{{project}}} "
+            + f"{report.execution_time_ms / 1000:.6f}"
+        ],
+        "projinit_audit_timestamp_seconds": [
+            f"projinit_audit_timestamp_seconds{{{project}}} {timestamp:.3f}"
+        ],
+    }
+
+
+class MetricsFile:
+    """Prometheus textfile rewritten as audits complete."""
+
+    def __init__(self, path: Path, interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize the metrics file (nothing is written yet).
+
+        Args:
+            path: Destination file (node-exporter reads `*.prom` files).
+            interval: Minimum seconds between two rewrites during a run.
+        """
+        self.path = path
+        self.interval = interval
+        # Samples per project, replaced if a project is audited again
+        self._projects: dict[str, dict[str, list[str]]] = {}
+        self._last_write: float | None = None
+
+    def add(self, report: AuditReport) -> None:
+        """
+        Add the metrics of an audited project.
+
+        The file is rewritten if the interval has elapsed since the last
+        write (always for the first project).
+        """
+        self._projects[str(report.project_path)] = report_samples(report, time.time())
+        now = time.monotonic()
+        if self._last_write is None or now - self._last_write >= self.interval:
+            self.write()
+
+    def render(self) -> str:
+        """Render all metrics, grouped by family."""
+        lines = []
+        for name, help_text in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for samples in self._projects.values():
+                lines.extend(samples[name])
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Rewrite the file atomically."""
+        atomic_write(self.path, self.render())
+        self._last_write = time.monotonic()
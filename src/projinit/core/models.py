@@ -1,5 +1,11 @@
-"""Data models for projinit v2.0."""
+"""Data models for projinit v2.0.
 
+CheckResult and AuditReport use slotted dataclasses: fleet runs hold
+millions of results, and a per-instance __dict__ would dominate their
+memory. See core.results for the columnar form used across projects.
+"""
+
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -65,7 +71,7 @@ class MergeStrategy(Enum):
     SKIP_EXISTING = "skip_existing"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single conformity check."""
 
@@ -76,6 +82,14 @@ class CheckResult:
     suggestion: str | None = None
     file_path: Path | None = None
 
+    def __post_init__(self):
+        # The same ids and messages repeat for every project of a fleet
+        # (ids from the standards YAML may also be numbers, messages None)
+        if isinstance(self.id, str):
+            self.id = sys.intern(self.id)
+        if isinstance(self.message, str):
+            self.message = sys.intern(self.message)
+
     @property
     def is_passed(self) -> bool:
         """Check if the result indicates success."""
@@ -119,74 +133,115 @@ def is_confident(self) -> bool:
         return self.confidence >= 0.7
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditReport:
-    """Complete audit report for a project."""
+    """
+    Complete audit report for a project.
+
+    Summaries (counts, score, compliance, grouping by level) are tallied
+    incrementally: each check is counted once, the first time a summary is
+    read after it was appended, so reading them is O(1) however often the
+    reporters do. `checks` may be appended to or replaced at any time, but
+    its items must not be modified in place once counted.
+    """
 
     project_path: Path
     project_type: ProjectType
     checks: list[CheckResult] = field(default_factory=list)
     execution_time_ms: float = 0.0
     files_scanned: list[str] = field(default_factory=list)
+    # Tally of checks[:_tallied] (see _tally)
+    _tallied_list: list[CheckResult] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tallied: int = field(default=0, init=False, repr=False, compare=False)
+    _status_counts: dict[CheckStatus, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _required_failures: int = field(default=0, init=False, repr=False, compare=False)
+    _by_level: dict[CheckLevel, list[CheckResult]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _failed: list[CheckResult] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def _tally(self) -> None:
+        """Count the checks appended since the last summary access."""
+        checks = self.checks
+        if checks is not self._tallied_list or len(checks) < self._tallied:
+            # New or shrunk list: start over
+            self._tallied_list = checks
+            self._tallied = 0
+            self._status_counts = dict.fromkeys(CheckStatus, 0)
+            self._required_failures = 0
+            self._by_level = {level: [] for level in CheckLevel}
+            self._failed = []
+        counts = self._status_counts
+        by_level = self._by_level
+        for i in range(self._tallied, len(checks)):
+            check = checks[i]
+            counts[check.status] += 1
+            by_level[check.level].append(check)
+            if check.status == CheckStatus.FAILED:
+                self._failed.append(check)
+                if check.level == CheckLevel.REQUIRED:
+                    self._required_failures += 1
+        self._tallied = len(checks)
+
+    def count(self, status: CheckStatus) -> int:
+        """Number of checks with a given status."""
+        self._tally()
+        return self._status_counts[status]
 
     @property
     def passed_count(self) -> int:
         """Number of passed checks."""
-        return sum(1 for c in self.checks if c.status == CheckStatus.PASSED)
+        return self.count(CheckStatus.PASSED)
 
     @property
     def failed_count(self) -> int:
         """Number of failed checks."""
-        return sum(1 for c in self.checks if c.status == CheckStatus.FAILED)
+        return self.count(CheckStatus.FAILED)
 
     @property
     def warning_count(self) -> int:
         """Number of warnings."""
-        return sum(1 for c in self.checks if c.status == CheckStatus.WARNING)
+        return self.count(CheckStatus.WARNING)
 
     @property
     def total_count(self) -> int:
         """Total number of checks (excluding skipped)."""
-        return sum(1 for c in self.checks if c.status != CheckStatus.SKIPPED)
+        return len(self.checks) - self.count(CheckStatus.SKIPPED)
 
     @property
     def score(self) -> float:
         """Conformity score as percentage."""
-        if self.total_count == 0:
+        total = self.total_count
+        if total == 0:
             return 100.0
-        return (self.passed_count / self.total_count) * 100
+        return (self.passed_count / total) * 100
 
     @property
     def is_compliant(self) -> bool:
         """Check if project passes all required checks."""
-        return all(
-            c.status != CheckStatus.FAILED
-            for c in self.checks
-            if c.level == CheckLevel.REQUIRED
-        )
+        self._tally()
+        return self._required_failures == 0
 
     @property
     def checks_by_level(self) -> dict[CheckLevel, list[CheckResult]]:
-        """Group checks by their level."""
-        result: dict[CheckLevel, list[CheckResult]] = {
-            CheckLevel.REQUIRED: [],
-            CheckLevel.RECOMMENDED: [],
-            CheckLevel.OPTIONAL: [],
-        }
-        for check in self.checks:
-            result[check.level].append(check)
-        return result
+        """Group checks by their level (the lists must not be modified)."""
+        self._tally()
+        return dict(self._by_level)
 
     @property
     def failed_checks(self) -> list[CheckResult]:
         """Get all failed checks."""
-        return [c for c in self.checks if c.status == CheckStatus.FAILED]
+        self._tally()
+        return list(self._failed)
 
     @property
     def actionable_suggestions(self) -> list[tuple[str, str]]:
         """Get actionable suggestions with commands."""
-        suggestions = []
-        for check in self.failed_checks:
-            if check.suggestion:
-                suggestions.append((check.id, check.suggestion))
-        return suggestions
+        self._tally()
+        return [(c.id, c.suggestion) for c in self._failed if c.suggestion]
@@ -1,32 +1,59 @@
-"""Report generation for projinit v2.0."""
+"""Report generation for projinit v2.0.
 
-import json
-from typing import Literal
+rich is only imported by the rich text renderer: plain, JSON, Markdown and
+NDJSON output never load it, which keeps short CI runs fast.
+"""
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn
-from rich.table import Table
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, TextIO
 
+from projinit.core.drift import DriftReport, DriftStatus
 from projinit.core.models import AuditReport, CheckLevel, CheckResult, CheckStatus
 
-OutputFormat = Literal["text", "json", "markdown"]
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from projinit.core.checker import Checker
+
+OutputFormat = Literal["text", "plain", "json", "markdown", "ndjson"]
+
+# Width of the check id column in plain output
+PLAIN_ID_WIDTH = 32
 
 
 class Reporter:
     """Generates audit reports in various formats."""
 
-    def __init__(self, report: AuditReport, verbose: bool = False):
+    def __init__(
+        self,
+        report: AuditReport,
+        verbose: bool = False,
+        drift: DriftReport | None = None,
+    ):
         """
         Initialize the reporter.
 
         Args:
             report: The audit report to format.
             verbose: Whether to include detailed information.
+            drift: Template drift report to include (optional).
         """
         self.report = report
         self.verbose = verbose
-        self.console = Console()
+        self.drift = drift
+        self._console: Console | None = None
+
+    @property
+    def console(self) -> "Console":
+        """Get the rich console, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     def to_text(self) -> None:
         """Print a rich text report to the console."""
@@ -47,12 +74,18 @@ def to_text(self) -> None:
         if self.report.failed_checks:
             self._print_suggestions()
 
+        # Template drift
+        if self.drift:
+            self._print_drift()
+
         # Verbose info
         if self.verbose:
             self._print_verbose_info()
 
     def _print_header(self) -> None:
         """Print the report header."""
+        from rich.panel import Panel
+
         self.console.print(
             Panel(
                 f"[bold]Project Audit Report[/bold]\n"
@@ -65,6 +98,8 @@ def _print_header(self) -> None:
 
     def _print_checks_by_level(self) -> None:
         """Print checks grouped by level."""
+        from rich.table import Table
+
         checks_by_level = self.report.checks_by_level
 
         level_info = [
@@ -96,6 +131,8 @@ def _print_checks_by_level(self) -> None:
 
     def _print_score_bar(self) -> None:
         """Print a visual progress bar for the score."""
+        from rich.progress import BarColumn, Progress, TextColumn
+
         score = self.report.score
         score_color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
 
@@ -116,6 +153,8 @@ def _print_score_bar(self) -> None:
 
     def _print_summary(self) -> None:
         """Print the summary panel."""
+        from rich.panel import Panel
+
         status = "COMPLIANT" if self.report.is_compliant else "NON-COMPLIANT"
         status_color = "green" if self.report.is_compliant else "red"
 
@@ -195,6 +234,95 @@ def _print_verbose_info(self) -> None:
                     f"    [dim]... and {len(self.report.files_scanned) - 5} more[/dim]"
                 )
 
+    def _print_drift(self) -> None:
+        """Print how far templated files have drifted from their templates."""
+        from rich.table import Table
+
+        table = Table(title="Template Drift", show_header=True, header_style="bold")
+        table.add_column("File")
+        table.add_column("Template", style="dim")
+        table.add_column("Status")
+        table.add_column("Similarity", justify="right")
+
+        for result in self.drift.results:
+            table.add_row(
+                result.path,
+                result.template,
+                self._get_drift_icon(result.status),
+                f"{result.similarity:.0%}" if self._is_compared(result) else "-",
+            )
+
+        self.console.print()
+        self.console.print(table)
+        compared = len(self.drift.compared)
+        self.console.print(
+            f"[dim]{self.drift.drifted_count}/{compared} templated file(s) "
+            f"differ from their template[/dim]"
+        )
+
+    def to_plain(self, stream: TextIO | None = None) -> None:
+        """
+        Write a fixed-width plain text report, for logs and CI.
+
+        Args:
+            stream: Output stream (defaults to stdout).
+        """
+        out = stream or sys.stdout
+        report = self.report
+        lines = [
+            f"projinit check: {report.project_path} ({report.project_type.display_name})"
+        ]
+
+        for level, checks in report.checks_by_level.items():
+            if not checks:
+                continue
+            lines.append("")
+            lines.append(f"{level.value.upper()} CHECKS")
+            for check in checks:
+                status = self._get_status_emoji(check.status)
+                lines.append(
+                    f"  {status:<4}  {check.id:<{PLAIN_ID_WIDTH}}  {check.message}"
+                )
+
+        status = "COMPLIANT" if report.is_compliant else "NON-COMPLIANT"
+        filled = round(report.score / 5)
+        counts = (
+            f"{report.passed_count} passed, {report.failed_count} failed, "
+            f"{report.warning_count} warnings, {report.total_count} total"
+        )
+        lines.extend(
+            [
+                "",
+                f"Score:  {report.score:5.1f}%  [{'#' * filled}{'.' * (20 - filled)}]",
+                f"Status: {status} ({counts})",
+            ]
+        )
+
+        suggestions = report.actionable_suggestions
+        if suggestions:
+            lines.extend(["", "Quick fix: projinit update"])
+            if self.verbose:
+                lines.extend(f"  {check_id}: {fix}" for check_id, fix in suggestions)
+
+        if self.drift:
+            lines.extend(["", "TEMPLATE DRIFT"])
+            for r in self.drift.results:
+                score = f"{r.similarity:6.1%}" if self._is_compared(r) else "     -"
+                lines.append(f"  {r.status.value.upper():<11}  {score}  {r.path}")
+
+        if self.verbose:
+            lines.extend(
+                [
+                    "",
+                    f"Execution time: {report.execution_time_ms:.1f}ms",
+                    f"Files checked: {len(report.files_scanned)}",
+                ]
+            )
+            lines.extend(f"  - {f}" for f in report.files_scanned)
+
+        out.write("\n".join(lines) + "\n")
+        out.flush()
+
     def to_json(self) -> str:
         """Generate a JSON report."""
         data = {
@@ -225,6 +353,20 @@ def to_json(self) -> str:
         if self.verbose:
             data["files_scanned"] = self.report.files_scanned
 
+        if self.drift:
+            data["drift"] = [
+                {
+                    "check_id": r.check_id,
+                    "path": r.path,
+                    "template": r.template,
+                    "status": r.status.value,
+                    "similarity": (
+                        round(r.similarity, 3) if self._is_compared(r) else None
+                    ),
+                }
+                for r in self.drift.results
+            ]
+
         return json.dumps(data, indent=2)
 
     def to_markdown(self) -> str:
@@ -304,6 +446,23 @@ def to_markdown(self) -> str:
             ]
         )
 
+        # Template drift
+        if self.drift:
+            lines.extend(
+                [
+                    "## Template Drift",
+                    "",
+                    "| Status | File | Template | Similarity |",
+                    "|--------|------|----------|------------|",
+                ]
+            )
+            for r in self.drift.results:
+                score = f"{r.similarity:.0%}" if self._is_compared(r) else "-"
+                lines.append(
+                    f"| {r.status.value.upper()} | `{r.path}` | `{r.template}` | {score} |"
+                )
+            lines.append("")
+
         # Quick fix section
         if self.report.failed_checks:
             lines.extend(
@@ -340,6 +499,21 @@ def _get_status_icon(self, status: CheckStatus) -> str:
         }
         return icons.get(status, "[dim]?[/dim]")
 
+    def _get_drift_icon(self, status: DriftStatus) -> str:
+        """Get a colored label for a drift status."""
+        icons = {
+            DriftStatus.MATCH: "[green]MATCH[/green]",
+            DriftStatus.DRIFTED: "[yellow]DRIFTED[/yellow]",
+            DriftStatus.MISSING: "[red]MISSING[/red]",
+            DriftStatus.NO_TEMPLATE: "[dim]SKIP[/dim]",
+        }
+        return icons.get(status, "[dim]?[/dim]")
+
+    @staticmethod
+    def _is_compared(result) -> bool:
+        """Check if a drift result carries a similarity score."""
+        return result.status in (DriftStatus.MATCH, DriftStatus.DRIFTED)
+
     def _get_status_emoji(self, status: CheckStatus) -> str:
         """Get an emoji for the status (for markdown)."""
         emojis = {
@@ -358,3 +532,101 @@ def _get_level_style(self, level: CheckLevel) -> str:
             CheckLevel.OPTIONAL: "dim",
         }
         return styles.get(level, "white")
+
+
+class NdjsonReporter:
+    """
+    Streams audit results as newline-delimited JSON.
+
+    Each record is a JSON object on its own line with a "type" key:
+    "check" (one per CheckResult), "drift" (one per templated file),
+    "summary" (one per project) and "error" (project that could not be
+    audited). Records are written and flushed as soon as they are produced,
+    so consumers start immediately and memory does not grow with the
+    number of projects.
+    """
+
+    def __init__(self, stream: TextIO | None = None):
+        """
+        Initialize the reporter.
+
+        Args:
+            stream: Output stream (defaults to stdout).
+        """
+        self.stream = stream or sys.stdout
+
+    def audit(self, checker: "Checker") -> AuditReport:
+        """
+        Run a checker, emitting each result as it is produced.
+
+        Args:
+            checker: Checker for the project to audit.
+
+        Returns:
+            The complete audit report (after its summary record is written).
+        """
+        project = str(checker.project_path)
+        results = []
+        start_time = time.perf_counter()
+        for result in checker.iter_checks():
+            results.append(result)
+            self.write(
+                {
+                    "type": "check",
+                    "project": project,
+                    "id": result.id,
+                    "status": result.status.value,
+                    "level": result.level.value,
+                    "message": result.message,
+                    "suggestion": result.suggestion,
+                    "file_path": str(result.file_path) if result.file_path else None,
+                }
+            )
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
+
+        report = checker.build_report(results, execution_time_ms)
+        self.summary(report)
+        return report
+
+    def summary(self, report: AuditReport) -> None:
+        """Emit the summary record of a project."""
+        self.write(
+            {
+                "type": "summary",
+                "project": str(report.project_path),
+                "project_type": report.project_type.value,
+                "score": round(report.score, 1),
+                "is_compliant": report.is_compliant,
+                "execution_time_ms": round(report.execution_time_ms, 2),
+                "passed": report.passed_count,
+                "failed": report.failed_count,
+                "warnings": report.warning_count,
+                "total": report.total_count,
+            }
+        )
+
+    def drift(self, drift: DriftReport) -> None:
+        """Emit one record per templated file of a drift report."""
+        project = str(drift.project_path)
+        for r in drift.results:
+            compared = r.status in (DriftStatus.MATCH, DriftStatus.DRIFTED)
+            self.write(
+                {
+                    "type": "drift",
+                    "project": project,
+                    "check_id": r.check_id,
+                    "path": r.path,
+                    "template": r.template,
+                    "status": r.status.value,
+                    "similarity": round(r.similarity, 3) if compared else None,
+                }
+            )
+
+    def error(self, project_path: Path, message: str) -> None:
+        """Emit a record for a project that could not be audited."""
+        self.write({"type": "error", "project": str(project_path), "message": message})
+
+    def write(self, record: dict) -> None:
+        """Write one record and flush it."""
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
@@ -0,0 +1,319 @@
+"""Columnar result files for projinit v2.0.
+
+`projinit check --export FILE` saves the results of an audit (one project
+or a fleet) as the columns of a ResultTable, instead of a JSON document
+repeating every check id, message and suggestion per result:
+
+- a header: magic, format version, byte order mark, project and row
+  counts, then the (offset, item count) of every section;
+- string pools (check ids, messages, suggestions, file paths, project
+  paths, project types): end offsets of each UTF-8 string, then the
+  concatenated strings;
+- per-project columns: counters and the first row of each project (rows
+  are stored grouped by project);
+- per-result columns: pool indexes, status and level codes.
+
+Sections are 8-byte aligned arrays in native byte order. ResultFile maps
+the file in memory and casts each section to a memoryview: opening a file
+reads only its header, rows and strings are decoded when accessed, and
+NumPy can read the columns without copy.
+"""
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+
+from projinit.core.models import ProjectType
+from projinit.core.results import (
+    NONE_INDEX,
+    ProjectSummary,
+    ResultRows,
+    ResultTable,
+    StringPool,
+)
+from projinit.core.writer import atomic_open
+
+MAGIC = b"PJRF"
+FORMAT_VERSION = 1
+# Written in native order: a file from a host of the other endianness is
+# recognized and rejected
+_BYTE_ORDER_MARK = 0x01020304
+
+_HEADER = struct.Struct("=4sIIQQ")
+_SECTION = struct.Struct("=QQ")
+_ALIGNMENT = 8
+
+# String pools, each stored as "<name>.offsets" ("Q") and "<name>.data" ("B")
+_POOLS = (
+    "check_ids",
+    "messages",
+    "suggestions",
+    "paths",
+    "project_paths",
+    "project_types",
+)
+# Per-project columns ("row_start" has one more item: the row count)
+_PROJECT_COLUMNS = (
+    ("project_path", "I"),
+    ("project_type", "I"),
+    ("execution_time_ms", "d"),
+    ("passed", "I"),
+    ("failed", "I"),
+    ("warnings", "I"),
+    ("skipped", "I"),
+    ("required_failures", "I"),
+    ("row_start", "Q"),
+)
+# Per-result columns, as in ResultTable
+_ROW_COLUMNS = (
+    ("project", "I"),
+    ("check", "I"),
+    ("status", "B"),
+    ("level", "B"),
+    ("message", "I"),
+    ("suggestion", "i"),
+    ("path", "i"),
+)
+_SECTIONS = (
+    *(
+        (f"{pool}.{part}", typecode)
+        for pool in _POOLS
+        for part, typecode in (("offsets", "Q"), ("data", "B"))
+    ),
+    *_PROJECT_COLUMNS,
+    *_ROW_COLUMNS,
+)
+
+
+def is_result_file(path: Path) -> bool:
+    """Check if a file starts with the result file magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_result_file(table: ResultTable, path: Path) -> None:
+    """
+    Save a result table.
+
+    The file is written next to its destination then renamed, so readers
+    never see a partial file.
+
+    Args:
+        table: Results to save.
+        path: Destination file.
+    """
+    sections = {}
+    for pool in _POOLS[:4]:
+        _add_pool(sections, pool, getattr(table, pool).values)
+    project_paths = StringPool(summary.path for summary in table.projects)
+    project_types = StringPool()
+    _add_pool(sections, "project_paths", project_paths.values)
+    columns = {name: array(typecode) for name, typecode in _PROJECT_COLUMNS}
+    for summary in table.projects:
+        columns["project_path"].append(project_paths.add(summary.path))
+        columns["project_type"].append(project_types.add(summary.project_type.value))
+        for name, _ in _PROJECT_COLUMNS[2:-1]:
+            columns[name].append(getattr(summary, name))
+    _add_pool(sections, "project_types", project_types.values)
+
+    rows = {name: getattr(table, name) for name, _ in _ROW_COLUMNS}
+    project = rows["project"]
+    if any(a > b for a, b in zip(project, islice(project, 1, None))):
+        # Group rows by project (stable), so each project is a row range
+        order = sorted(range(len(project)), key=project.__getitem__)
+        rows = {
+            name: array(typecode, map(rows[name].__getitem__, order))
+            for name, typecode in _ROW_COLUMNS
+        }
+    columns["row_start"].extend(
+        bisect_left(rows["project"], index) for index in range(len(table.projects))
+    )
+    columns["row_start"].append(len(project))
+    sections.update(columns)
+    sections.update(rows)
+
+    directory_size = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    offset = _align(directory_size)
+    directory = []
+    for name, _ in _SECTIONS:
+        data = sections[name]
+        directory.append((offset, len(data)))
+        offset = _align(offset + len(data) * data.itemsize)
+
+    with atomic_open(path) as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                _BYTE_ORDER_MARK,
+                len(table.projects),
+                len(project),
+            )
+        )
+        f.writelines(_SECTION.pack(*entry) for entry in directory)
+        for (name, _), (section_offset, _count) in zip(
+            _SECTIONS, directory, strict=True
+        ):
+            f.write(b"\0" * (section_offset - f.tell()))
+            sections[name].tofile(f)
+
+
+def _add_pool(sections: dict, name: str, values: list[str]) -> None:
+    """Encode a string pool as end offsets and concatenated UTF-8 data."""
+    encoded = [value.encode("utf-8", "surrogateescape") for value in values]
+    offsets = array("Q")
+    end = 0
+    for data in encoded:
+        end += len(data)
+        offsets.append(end)
+    sections[f"{name}.offsets"] = offsets
+    sections[f"{name}.data"] = array("B", b"".join(encoded))
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the section alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class MappedStringPool:
+    """Read-only StringPool over a mapped pool section, decoded on access."""
+
+    __slots__ = ("_data", "_decoded", "_index", "_offsets")
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+        self._decoded: list[str | None] = [None] * len(offsets)
+        self._index: dict[str, int] | None = None
+
+    def get(self, index: int) -> str | None:
+        """Get the string at an index (None for NONE_INDEX)."""
+        if index == NONE_INDEX:
+            return None
+        value = self._decoded[index]
+        if value is None:
+            start = self._offsets[index - 1] if index else 0
+            value = str(
+                self._data[start : self._offsets[index]], "utf-8", "surrogateescape"
+            )
+            self._decoded[index] = value
+        return value
+
+    @property
+    def values(self) -> list[str]:
+        """All strings, in index order."""
+        return [self.get(i) for i in range(len(self))]
+
+    def find(self, value: str) -> int | None:
+        """Get the index of a string, or None if it is not in the pool."""
+        if self._index is None:
+            self._index = {v: i for i, v in enumerate(self.values)}
+        return self._index.get(value)
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+
+class ResultFile(ResultRows):
+    """
+    Memory-mapped result file, read like a ResultTable.
+
+    Columns are memoryviews over the mapping; call close() (or use
+    contextlib.closing) once they are no longer referenced.
+    """
+
+    def __init__(self, path: Path | str):
+        """
+        Map a result file.
+
+        Args:
+            path: File written by write_result_file.
+
+        Raises:
+            ValueError: If the file is not a result file of this format.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: list[memoryview] = []
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+        self._projects: list[ProjectSummary] | None = None
+
+    def _read_header(self) -> None:
+        """Check the header and cast every section to a memoryview."""
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        if len(buffer) < _HEADER.size:
+            raise ValueError(f"{self.path}: not a projinit result file")
+        magic, version, mark, self.project_count, self.row_count = _HEADER.unpack_from(
+            buffer
+        )
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a projinit result file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported result file version {version}")
+        if mark != _BYTE_ORDER_MARK:
+            raise ValueError(f"{self.path}: written on a host of another byte order")
+
+        sections = {}
+        for i, (name, typecode) in enumerate(_SECTIONS):
+            offset, count = _SECTION.unpack_from(
+                buffer, _HEADER.size + i * _SECTION.size
+            )
+            size = count * array(typecode).itemsize
+            if offset + size > len(buffer):
+                raise ValueError(f"{self.path}: truncated result file")
+            view = buffer[offset : offset + size].cast(typecode)
+            self._views.append(view)
+            sections[name] = view
+
+        for pool in _POOLS:
+            setattr(
+                self,
+                pool,
+                MappedStringPool(sections[f"{pool}.offsets"], sections[f"{pool}.data"]),
+            )
+        self._columns = {name: sections[name] for name, _ in _PROJECT_COLUMNS}
+        for name, _ in _ROW_COLUMNS:
+            setattr(self, name, sections[name])
+
+    def close(self) -> None:
+        """Release the columns and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    @property
+    def projects(self) -> list[ProjectSummary]:
+        """Project summaries, decoded on first access."""
+        if self._projects is None:
+            columns = self._columns
+            self._projects = [
+                ProjectSummary(
+                    path=self.project_paths.get(columns["project_path"][i]),
+                    project_type=ProjectType(
+                        self.project_types.get(columns["project_type"][i])
+                    ),
+                    execution_time_ms=columns["execution_time_ms"][i],
+                    passed=columns["passed"][i],
+                    failed=columns["failed"][i],
+                    warnings=columns["warnings"][i],
+                    skipped=columns["skipped"][i],
+                    required_failures=columns["required_failures"][i],
+                )
+                for i in range(self.project_count)
+            ]
+        return self._projects
+
+    def rows_for(self, project_index: int) -> range:
+        """Row numbers of one project's results."""
+        row_start = self._columns["row_start"]
+        return range(row_start[project_index], row_start[project_index + 1])
@@ -0,0 +1,248 @@
+"""Columnar check results for projinit v2.0.
+
+A fleet audit produces one CheckResult per check and project: the same
+check ids, messages and suggestions repeat for every project, and each
+result object costs hundreds of bytes. ResultTable stores a fleet as
+columns instead:
+
+- strings (check ids, messages, suggestions, file paths relative to their
+  project) are dictionary-encoded in StringPools, each distinct value
+  being stored once;
+- every result is a row of small integers in `array` columns (pool
+  indexes, status and level codes), 22 bytes per result;
+- per-project counters are updated as rows are added, so project summaries
+  are O(1).
+
+Rows convert back to CheckResult objects on demand. The columns can be
+saved to and mapped back from a file (see projinit.core.resultfile).
+"""
+
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from projinit.core.models import (
+    AuditReport,
+    CheckLevel,
+    CheckResult,
+    CheckStatus,
+    ProjectType,
+)
+
+# Small integer codes of statuses and levels, in declaration order
+STATUS_CODES: tuple[CheckStatus, ...] = tuple(CheckStatus)
+LEVEL_CODES: tuple[CheckLevel, ...] = tuple(CheckLevel)
+_STATUS_INDEX = {status: code for code, status in enumerate(STATUS_CODES)}
+_LEVEL_INDEX = {level: code for code, level in enumerate(LEVEL_CODES)}
+
+# Pool index of a missing optional string (suggestion, file path)
+NONE_INDEX = -1
+
+_PASSED = _STATUS_INDEX[CheckStatus.PASSED]
+_FAILED = _STATUS_INDEX[CheckStatus.FAILED]
+_SKIPPED = _STATUS_INDEX[CheckStatus.SKIPPED]
+_REQUIRED = _LEVEL_INDEX[CheckLevel.REQUIRED]
+
+
+class StringPool:
+    """Dictionary encoding of strings: each distinct value is stored once."""
+
+    __slots__ = ("_index", "values")
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+        for value in values:
+            self.add(value)
+
+    def add(self, value: str | None) -> int:
+        """Get the index of a string, adding it if new (NONE_INDEX for None)."""
+        if value is None:
+            return NONE_INDEX
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self.values.append(value)
+            self._index[value] = index
+        return index
+
+    def get(self, index: int) -> str | None:
+        """Get the string at an index (None for NONE_INDEX)."""
+        return None if index == NONE_INDEX else self.values[index]
+
+    def find(self, value: str) -> int | None:
+        """Get the index of a string, or None if it is not in the pool."""
+        return self._index.get(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass(slots=True)
+class ProjectSummary:
+    """Counters of one project, maintained as its results are added."""
+
+    path: str
+    project_type: ProjectType
+    execution_time_ms: float = 0.0
+    passed: int = 0
+    failed: int = 0
+    warnings: int = 0
+    skipped: int = 0
+    required_failures: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of checks (excluding skipped)."""
+        return self.passed + self.failed + self.warnings
+
+    @property
+    def score(self) -> float:
+        """Conformity score as percentage."""
+        if self.total == 0:
+            return 100.0
+        return (self.passed / self.total) * 100
+
+    @property
+    def is_compliant(self) -> bool:
+        """Check if the project passes all required checks."""
+        return self.required_failures == 0
+
+
+class ResultRows:
+    """
+    Row access shared by column stores (ResultTable, ResultFile).
+
+    Subclasses provide the check_ids, messages, suggestions and paths pools,
+    the projects summaries and the result columns.
+    """
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def row(self, i: int) -> CheckResult:
+        """Rebuild the CheckResult of a row."""
+        path = self.paths.get(self.path[i])
+        return CheckResult(
+            id=self.check_ids.get(self.check[i]),
+            status=STATUS_CODES[self.status[i]],
+            message=self.messages.get(self.message[i]),
+            level=LEVEL_CODES[self.level[i]],
+            suggestion=self.suggestions.get(self.suggestion[i]),
+            file_path=(
+                None
+                if path is None
+                else Path(self.projects[self.project[i]].path) / path
+            ),
+        )
+
+    def __iter__(self) -> Iterator[CheckResult]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def rows_for(self, project_index: int) -> Iterable[int]:
+        """Row numbers of one project's results, in insertion order."""
+        return (i for i, p in enumerate(self.project) if p == project_index)
+
+    def to_report(self, project_index: int) -> AuditReport:
+        """Rebuild the AuditReport of one project."""
+        summary = self.projects[project_index]
+        return AuditReport(
+            project_path=Path(summary.path),
+            project_type=summary.project_type,
+            checks=[self.row(i) for i in self.rows_for(project_index)],
+            execution_time_ms=summary.execution_time_ms,
+        )
+
+
+@dataclass
+class ResultTable(ResultRows):
+    """Check results of many projects, stored as columns."""
+
+    check_ids: StringPool = field(default_factory=StringPool)
+    messages: StringPool = field(default_factory=StringPool)
+    suggestions: StringPool = field(default_factory=StringPool)
+    paths: StringPool = field(default_factory=StringPool)
+    projects: list[ProjectSummary] = field(default_factory=list)
+    # One item per result
+    project: array = field(default_factory=lambda: array("I"))
+    check: array = field(default_factory=lambda: array("I"))
+    status: array = field(default_factory=lambda: array("B"))
+    level: array = field(default_factory=lambda: array("B"))
+    message: array = field(default_factory=lambda: array("I"))
+    suggestion: array = field(default_factory=lambda: array("i"))
+    path: array = field(default_factory=lambda: array("i"))
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[AuditReport]) -> "ResultTable":
+        """Build a table from audit reports."""
+        table = cls()
+        for report in reports:
+            table.add_report(report)
+        return table
+
+    def add_project(
+        self,
+        project_path: Path | str,
+        project_type: ProjectType,
+        execution_time_ms: float = 0.0,
+    ) -> int:
+        """
+        Register a project whose results will be added.
+
+        Returns:
+            Project index, to pass to add_result.
+        """
+        self.projects.append(
+            ProjectSummary(str(project_path), project_type, execution_time_ms)
+        )
+        return len(self.projects) - 1
+
+    def add_result(self, project_index: int, result: CheckResult) -> None:
+        """
+        Append one check result of a registered project.
+
+        File paths are stored relative to the project when possible.
+        """
+        summary = self.projects[project_index]
+        status = _STATUS_INDEX[result.status]
+        level = _LEVEL_INDEX[result.level]
+
+        file_path = None
+        if result.file_path is not None:
+            file_path = str(result.file_path).removeprefix(summary.path + os.sep)
+
+        self.project.append(project_index)
+        self.check.append(self.check_ids.add(result.id))
+        self.status.append(status)
+        self.level.append(level)
+        self.message.append(self.messages.add(result.message))
+        self.suggestion.append(self.suggestions.add(result.suggestion))
+        self.path.append(self.paths.add(file_path))
+
+        if status == _PASSED:
+            summary.passed += 1
+        elif status == _FAILED:
+            summary.failed += 1
+            if level == _REQUIRED:
+                summary.required_failures += 1
+        elif status == _SKIPPED:
+            summary.skipped += 1
+        else:
+            summary.warnings += 1
+
+    def add_report(self, report: AuditReport) -> int:
+        """
+        Append every result of an audit report.
+
+        Returns:
+            Project index of the report.
+        """
+        index = self.add_project(
+            report.project_path, report.project_type, report.execution_time_ms
+        )
+        for result in report.checks:
+            self.add_result(index, result)
+        return index
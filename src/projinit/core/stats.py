@@ -0,0 +1,365 @@
+"""Fleet compliance analytics for projinit v2.0.
+
+Loads the results of many projects into a compliance matrix (projects x
+checks, one int8 status code per cell, -1 where a check did not run) and
+answers fleet questions with vectorized NumPy operations instead of loops
+over reports:
+
+- failure rate of each check, over the projects where it applies;
+- co-failure correlation between checks (Pearson correlation of their
+  failure columns);
+- weighted score distribution per project type, required checks weighing
+  more than recommended and optional ones;
+- failure patterns: projects grouped by their exact set of failing checks.
+
+NumPy is an optional dependency (pip install projinit[stats]), imported
+only when a matrix is built.
+"""
+
+from array import array
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from projinit.core.diff import iter_report_results
+from projinit.core.models import CheckLevel, CheckStatus
+from projinit.core.resultfile import ResultFile, is_result_file
+from projinit.core.results import LEVEL_CODES, STATUS_CODES, ResultTable
+
+# Weight of a check in weighted scores, by level code
+LEVEL_WEIGHTS: tuple[int, ...] = tuple(
+    {CheckLevel.REQUIRED: 3, CheckLevel.RECOMMENDED: 2, CheckLevel.OPTIONAL: 1}[level]
+    for level in LEVEL_CODES
+)
+
+# Status code of a check that did not run on a project
+MISSING = -1
+
+_PASSED = STATUS_CODES.index(CheckStatus.PASSED)
+_FAILED = STATUS_CODES.index(CheckStatus.FAILED)
+_SKIPPED = STATUS_CODES.index(CheckStatus.SKIPPED)
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _numpy():
+    """
+    Import NumPy.
+
+    Raises:
+        RuntimeError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise RuntimeError(
+            "Fleet statistics require numpy (pip install projinit[stats])"
+        ) from e
+    return numpy
+
+
+@dataclass
+class CheckFailureRate:
+    """Failure rate of one check across the fleet."""
+
+    check_id: str
+    level: CheckLevel
+    failed: int
+    applicable: int
+
+    @property
+    def rate(self) -> float:
+        """Share of applicable projects failing the check, as percentage."""
+        return self.failed / self.applicable * 100 if self.applicable else 0.0
+
+
+@dataclass
+class CoFailure:
+    """Two checks that tend to fail on the same projects."""
+
+    check_a: str
+    check_b: str
+    correlation: float
+    both_failed: int
+
+
+@dataclass
+class ScoreDistribution:
+    """Weighted scores of the projects of one type."""
+
+    project_type: str
+    projects: int
+    mean: float
+    percentiles: dict[int, float] = field(default_factory=dict)
+
+
+@dataclass
+class FailurePattern:
+    """Projects sharing the exact same set of failing checks."""
+
+    failed_checks: list[str]
+    projects: int
+
+
+class ComplianceMatrix:
+    """Check statuses of a fleet, as a projects x checks int8 matrix."""
+
+    def __init__(
+        self,
+        projects: list[str],
+        project_types: list[str],
+        check_ids: list[str],
+        levels,
+        status,
+    ):
+        """
+        Wrap prebuilt arrays (see from_reports and from_table).
+
+        Args:
+            projects: Project paths, one per row.
+            project_types: Project type values, one per row.
+            check_ids: Check ids, one per column.
+            levels: int8 level code of each check.
+            status: int8 status codes, MISSING where a check did not run.
+        """
+        self.projects = projects
+        self.project_types = project_types
+        self.check_ids = check_ids
+        self.levels = levels
+        self.status = status
+
+    @classmethod
+    def from_reports(cls, paths: Iterable[Path]) -> "ComplianceMatrix":
+        """
+        Load saved reports (`check -f json`, `-f ndjson` or `--export`).
+
+        A project found in several reports keeps its last results. A single
+        result file is read through its mapped columns, without a row loop.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+            ValueError: If a file is not a projinit report.
+        """
+        np = _numpy()
+        paths = list(paths)
+        if len(paths) == 1 and is_result_file(paths[0]):
+            with closing(ResultFile(paths[0])) as results:
+                return cls.from_table(results)
+
+        project_index: dict[str, int] = {}
+        check_index: dict[str, int] = {}
+        types: dict[str, str] = {}
+        levels = array("b")
+        rows, columns, codes = array("I"), array("I"), array("b")
+
+        for path in paths:
+            for project, check_id, status, level in iter_report_results(path, types):
+                row = project_index.setdefault(project, len(project_index))
+                column = check_index.get(check_id)
+                if column is None:
+                    column = check_index[check_id] = len(check_index)
+                    levels.append(level)
+                rows.append(row)
+                columns.append(column)
+                codes.append(status)
+
+        return cls._build(
+            np,
+            list(project_index),
+            [types.get(project, "") for project in project_index],
+            list(check_index),
+            np.frombuffer(levels, dtype=np.int8).copy(),
+            (rows, columns, codes),
+        )
+
+    @classmethod
+    def from_table(cls, table: ResultTable | ResultFile) -> "ComplianceMatrix":
+        """
+        Build from column stores, reading their result columns without copy.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        np = _numpy()
+        levels = np.zeros(len(table.check_ids), dtype=np.int8)
+        # Level of each check (the same on every row of the check)
+        levels[np.frombuffer(table.check, dtype=np.uint32)] = np.frombuffer(
+            table.level, dtype=np.int8
+        )
+        return cls._build(
+            np,
+            [summary.path for summary in table.projects],
+            [summary.project_type.value for summary in table.projects],
+            list(table.check_ids.values),
+            levels,
+            (table.project, table.check, table.status),
+        )
+
+    @classmethod
+    def _build(
+        cls, np, projects, project_types, check_ids, levels, cells
+    ) -> "ComplianceMatrix":
+        """Scatter (row, column, status) buffers into the status matrix."""
+        rows, columns, codes = cells
+        status = np.full((len(projects), len(check_ids)), MISSING, dtype=np.int8)
+        status[
+            np.frombuffer(rows, dtype=np.uint32),
+            np.frombuffer(columns, dtype=np.uint32),
+        ] = np.frombuffer(codes, dtype=np.int8)
+        return cls(projects, project_types, check_ids, levels, status)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(projects, checks)."""
+        return self.status.shape
+
+    @property
+    def failed(self):
+        """Boolean matrix of failed checks."""
+        return self.status == _FAILED
+
+    @property
+    def applicable(self):
+        """Boolean matrix of checks that ran and were not skipped."""
+        return (self.status != MISSING) & (self.status != _SKIPPED)
+
+    def failure_rates(self) -> list[CheckFailureRate]:
+        """
+        Failure rate of every check.
+
+        Returns:
+            Checks, highest failure rate first.
+        """
+        np = _numpy()
+        failed = self.failed.sum(axis=0)
+        applicable = self.applicable.sum(axis=0)
+        rates = np.divide(
+            failed, applicable, out=np.zeros(len(failed)), where=applicable > 0
+        )
+        order = np.lexsort((-failed, -rates))
+        return [
+            CheckFailureRate(
+                self.check_ids[i],
+                LEVEL_CODES[self.levels[i]],
+                int(failed[i]),
+                int(applicable[i]),
+            )
+            for i in order
+        ]
+
+    def co_failures(self, top: int = 10) -> list[CoFailure]:
+        """
+        Pairs of checks whose failures are most correlated.
+
+        Checks that never or always fail have no correlation and are left
+        out.
+
+        Args:
+            top: Maximum number of pairs.
+
+        Returns:
+            Pairs, highest correlation first.
+        """
+        np = _numpy()
+        failed = self.failed.astype(np.float32)
+        count = len(failed)
+        if count < 2:
+            return []
+        # Pearson correlation of the columns: one matrix product
+        centered = failed - failed.mean(axis=0)
+        norms = np.sqrt((centered * centered).sum(axis=0))
+        covariance = centered.T @ centered
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = covariance / np.outer(norms, norms)
+        first, second = np.triu_indices(len(self.check_ids), k=1)
+        values = np.nan_to_num(correlation[first, second], nan=0.0)
+        order = np.argsort(-values, kind="stable")[:top]
+        order = order[values[order] > 0]
+        both = (failed.T @ failed)[first[order], second[order]]
+        return [
+            CoFailure(
+                self.check_ids[first[i]],
+                self.check_ids[second[i]],
+                round(float(values[i]), 4),
+                int(n),
+            )
+            for i, n in zip(order, both, strict=True)
+        ]
+
+    def weighted_scores(self):
+        """
+        Weighted conformity score of every project, as percentage.
+
+        Each applicable check counts for its level weight (LEVEL_WEIGHTS);
+        projects with no applicable check score 100.
+        """
+        np = _numpy()
+        weights = np.asarray(LEVEL_WEIGHTS, dtype=np.float64)[self.levels]
+        applicable = self.applicable @ weights
+        passed = (self.status == _PASSED) @ weights
+        return np.divide(
+            passed * 100,
+            applicable,
+            out=np.full(len(applicable), 100.0),
+            where=applicable > 0,
+        )
+
+    def score_distributions(
+        self, percentiles: Iterable[int] = DEFAULT_PERCENTILES
+    ) -> list[ScoreDistribution]:
+        """
+        Weighted score percentiles per project type.
+
+        Returns:
+            One distribution per project type, sorted by type.
+        """
+        np = _numpy()
+        percentiles = list(percentiles)
+        scores = self.weighted_scores()
+        types = np.asarray(self.project_types, dtype=object)
+        distributions = []
+        for project_type in sorted(set(self.project_types)):
+            selected = scores[types == project_type]
+            values = np.percentile(selected, percentiles)
+            distributions.append(
+                ScoreDistribution(
+                    project_type=project_type,
+                    projects=len(selected),
+                    mean=round(float(selected.mean()), 2),
+                    percentiles={
+                        p: round(float(v), 2)
+                        for p, v in zip(percentiles, values, strict=True)
+                    },
+                )
+            )
+        return distributions
+
+    def failure_patterns(self, top: int = 10) -> list[FailurePattern]:
+        """
+        Group projects by their exact set of failing checks.
+
+        Args:
+            top: Maximum number of patterns.
+
+        Returns:
+            Patterns shared by the most projects first.
+        """
+        np = _numpy()
+        if not self.projects:
+            return []
+        # One byte string per project row: unique rows in a single pass
+        packed = np.packbits(self.failed, axis=1)
+        patterns, counts = np.unique(packed, axis=0, return_counts=True)
+        order = np.argsort(-counts, kind="stable")[:top]
+        columns = len(self.check_ids)
+        return [
+            FailurePattern(
+                failed_checks=[
+                    self.check_ids[c]
+                    for c in np.flatnonzero(np.unpackbits(patterns[i])[:columns])
+                ],
+                projects=int(counts[i]),
+            )
+            for i in order
+        ]
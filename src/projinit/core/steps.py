@@ -0,0 +1,79 @@
+"""Post-generation steps for projinit v2.0.
+
+Once a project is written, git bootstrap and `direnv allow` are independent
+of each other, so they run concurrently on an asyncio event loop instead
+of one after the other.
+"""
+
+import asyncio
+from pathlib import Path
+
+from projinit.core.git import bootstrap_repository
+from projinit.core.tracing import traced
+from projinit.core.tree import VirtualTree
+
+
+async def run_command(args: list[str], cwd: Path) -> bool:
+    """
+    Run a command as an asyncio subprocess.
+
+    Args:
+        args: Command and arguments.
+        cwd: Working directory.
+
+    Returns:
+        True if the command exited with status 0.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return await process.wait() == 0
+
+
+async def _post_generation(
+    target_dir: Path,
+    tree: VirtualTree,
+    init_git: bool,
+    allow_direnv: bool,
+) -> dict[str, bool]:
+    """Run the selected steps concurrently."""
+    steps = {}
+    if init_git:
+        steps["git"] = asyncio.to_thread(bootstrap_repository, target_dir, tree)
+    if allow_direnv:
+        steps["direnv"] = run_command(["direnv", "allow"], target_dir)
+
+    results = await asyncio.gather(*steps.values())
+    return dict(zip(steps, results, strict=True))
+
+
+@traced(
+    "post_generation", "new", lambda target_dir, *_, **__: {"repo": str(target_dir)}
+)
+def run_post_generation(
+    target_dir: Path,
+    tree: VirtualTree,
+    init_git: bool = True,
+    allow_direnv: bool = False,
+) -> dict[str, bool]:
+    """
+    Run post-generation steps for a project written to disk.
+
+    Args:
+        target_dir: Project directory.
+        tree: Files of the project, used for the initial commit.
+        init_git: If True, create the git repository and first commit.
+        allow_direnv: If True, run `direnv allow`.
+
+    Returns:
+        Mapping of step name ("git", "direnv") to success, for the steps run.
+    """
+    if not (init_git or allow_direnv):
+        return {}
+    return asyncio.run(_post_generation(target_dir, tree, init_git, allow_direnv))
@@ -0,0 +1,298 @@
+"""Template resolution for projinit v2.0.
+
+Templates are resolved through three layers, by priority:
+
+1. per-template overrides (templates.overrides in the configuration),
+2. the custom templates directory (templates.templates_dir),
+3. the templates shipped with projinit.
+
+LayeredLoader indexes every template name of every layer once, when it is
+created, so a lookup is a dictionary hit instead of a filesystem probe per
+layer. The index of each directory is cached on disk across invocations
+and revalidated from directory mtimes, without walking the tree again.
+
+A custom templates directory can also ship files added to every generated
+project:
+
+    <templates_dir>/files/_common/...         every project
+    <templates_dir>/files/<project-type>/...  projects of that type only
+
+Files ending in .j2 are rendered with the project context and written
+without their suffix. Any other file (logos, fonts, datasets, binary
+fixtures) is added to the project tree as a copy entry: it is never read
+into memory nor passed through Jinja, and is copied by the kernel or
+cloned by the filesystem when the project is written.
+"""
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, TemplateNotFound
+
+from projinit.core.config import TemplatesConfig, load_config
+from projinit.core.tree import DEFAULT_FILE_MODE, EXECUTABLE_FILE_MODE, VirtualTree
+from projinit.core.writer import atomic_open
+
+# Templates shipped with projinit
+PACKAGED_TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+# On-disk cache of directory indexes, shared by all invocations
+INDEX_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "projinit"
+    / "template-index.json"
+)
+INDEX_CACHE_VERSION = 1
+
+# Subdirectory of a templates directory holding project files
+FILES_DIR = "files"
+# Group of files added to every project type
+COMMON_FILES = "_common"
+# Suffix of files rendered with Jinja2
+TEMPLATE_SUFFIX = ".j2"
+
+
+class LayeredLoader(BaseLoader):
+    """Jinja2 loader resolving templates through overrides, user and packaged layers."""
+
+    def __init__(
+        self,
+        templates_dir: Path | None = None,
+        overrides: dict[str, str] | None = None,
+        cache_file: Path | None = None,
+    ):
+        """
+        Build the template index.
+
+        Args:
+            templates_dir: Custom templates directory (optional).
+            overrides: Template name -> file replacing that template.
+            cache_file: Index cache (defaults to INDEX_CACHE_FILE).
+        """
+        self.layers = [d for d in (templates_dir, PACKAGED_TEMPLATES_DIR) if d]
+        self.index = build_template_index(
+            self.layers, INDEX_CACHE_FILE if cache_file is None else cache_file
+        )
+        for name, path in (overrides or {}).items():
+            path = Path(path).expanduser()
+            if path.is_file():
+                self.index[name] = str(path)
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        """Load a template source from the file it resolves to."""
+        filename = self.index.get(template)
+        if filename is None:
+            raise TemplateNotFound(template)
+        try:
+            mtime = os.path.getmtime(filename)
+            with open(filename, encoding="utf-8") as f:
+                source = f.read()
+        except OSError as e:
+            raise TemplateNotFound(template) from e
+
+        def uptodate() -> bool:
+            try:
+                return os.path.getmtime(filename) == mtime
+            except OSError:
+                return False
+
+        return source, filename, uptodate
+
+    def list_templates(self) -> list[str]:
+        """List every resolvable template name."""
+        return sorted(self.index)
+
+
+def build_template_index(layers: list[Path], cache_file: Path) -> dict[str, str]:
+    """
+    Map template names to files, higher-priority layers first.
+
+    Args:
+        layers: Template directories, by decreasing priority.
+        cache_file: Index cache, read and updated as needed.
+
+    Returns:
+        Template name -> absolute file path.
+    """
+    cached = _read_index_cache(cache_file)
+    changed = False
+    index: dict[str, str] = {}
+    for root in reversed(layers):
+        key = str(root)
+        layer = cached.get(key)
+        if layer is None or not _layer_is_fresh(root, layer):
+            layer = _scan_layer(root)
+            cached[key] = layer
+            changed = True
+        for name in layer["names"]:
+            index[name] = os.path.join(key, name)
+    if changed:
+        _write_index_cache(cache_file, cached)
+    return index
+
+
+def _scan_layer(root: Path) -> dict:
+    """Walk a template directory, recording names and directory mtimes."""
+    dirs: dict[str, int] = {}
+    names: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        if rel == ".":
+            rel = ""
+            # Project files are not templates addressed by name
+            dirnames[:] = [d for d in dirnames if d != FILES_DIR]
+        dirnames.sort()
+        try:
+            dirs[rel] = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            continue
+        names.extend(PurePosixPath(rel, f).as_posix() for f in sorted(filenames))
+    return {"dirs": dirs, "names": names}
+
+
+def _layer_is_fresh(root: Path, layer: dict) -> bool:
+    """Check that no directory of a cached layer changed since it was scanned."""
+    try:
+        return bool(layer["dirs"]) and all(
+            os.stat(root / rel).st_mtime_ns == mtime
+            for rel, mtime in layer["dirs"].items()
+        )
+    except (OSError, KeyError, TypeError, AttributeError):
+        return False
+
+
+def _read_index_cache(cache_file: Path) -> dict:
+    """Read cached layers, ignoring missing or invalid caches."""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_CACHE_VERSION:
+        return {}
+    layers = data.get("layers")
+    return layers if isinstance(layers, dict) else {}
+
+
+def _write_index_cache(cache_file: Path, layers: dict) -> None:
+    """Atomically store cached layers, dropping directories that are gone."""
+    layers = {root: layer for root, layer in layers.items() if Path(root).is_dir()}
+    data = {"version": INDEX_CACHE_VERSION, "layers": layers}
+    # The cache is an optimization: a read-only home must not fail generation
+    try:
+        with atomic_open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=8)
+def _layered_loader(
+    templates_dir: Path | None, overrides: tuple[tuple[str, str], ...]
+) -> LayeredLoader:
+    """Get the loader for a template configuration, built once per process."""
+    return LayeredLoader(templates_dir, dict(overrides))
+
+
+def create_template_env(templates: TemplatesConfig | None = None) -> Environment:
+    """
+    Create a Jinja2 environment honouring the template configuration.
+
+    Args:
+        templates: Template configuration (defaults to the loaded
+            configuration).
+
+    Returns:
+        Environment resolving overrides, then the custom templates
+        directory, then the packaged templates.
+    """
+    if templates is None:
+        templates = load_config().templates
+    loader = _layered_loader(
+        resolve_templates_dir(templates.templates_dir),
+        tuple(sorted((k, str(v)) for k, v in templates.overrides.items())),
+    )
+    return Environment(loader=loader, keep_trailing_newline=True)
+
+
+def resolve_templates_dir(templates_dir: Path | str | None) -> Path | None:
+    """
+    Expand a configured templates directory.
+
+    Returns:
+        Absolute directory path, or None if unset or not a directory.
+    """
+    if not templates_dir:
+        return None
+    path = Path(templates_dir).expanduser()
+    return path.resolve() if path.is_dir() else None
+
+
+def iter_project_files(
+    templates_dir: Path, project_type: str
+) -> Iterator[tuple[PurePosixPath, Path]]:
+    """
+    List the files of a templates directory that apply to a project type.
+
+    Common files come first, so type-specific files replace them.
+
+    Args:
+        templates_dir: Custom templates directory.
+        project_type: Project type value (e.g. "python-cli").
+
+    Yields:
+        (path relative to its group, source file) tuples, sorted per group.
+    """
+    for group in (COMMON_FILES, project_type):
+        base = templates_dir / FILES_DIR / group
+        if not base.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames.sort()
+            directory = Path(dirpath)
+            for filename in sorted(filenames):
+                source = directory / filename
+                if source.is_file():
+                    yield PurePosixPath(source.relative_to(base).as_posix()), source
+
+
+def add_custom_files(
+    tree: VirtualTree,
+    templates_dir: Path,
+    project_type: str,
+    context: dict,
+) -> int:
+    """
+    Add the files of a custom templates directory to a project tree.
+
+    Args:
+        tree: Project tree; custom files replace generated files.
+        templates_dir: Custom templates directory.
+        project_type: Project type value (e.g. "python-cli").
+        context: Template variables for .j2 files.
+
+    Returns:
+        Number of files added.
+    """
+    env = None
+    count = 0
+    for path, source in iter_project_files(templates_dir, project_type):
+        if path.suffix == TEMPLATE_SUFFIX:
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(templates_dir / FILES_DIR),
+                    keep_trailing_newline=True,
+                )
+            name = source.relative_to(templates_dir / FILES_DIR).as_posix()
+            executable = source.stat().st_mode & 0o111
+            mode = EXECUTABLE_FILE_MODE if executable else DEFAULT_FILE_MODE
+            tree.write(
+                path.with_suffix(""), env.get_template(name).render(context), mode
+            )
+        else:
+            tree.copy(path, source)
+        count += 1
+    return count
@@ -0,0 +1,205 @@
+"""Execution tracing for projinit v2.0.
+
+`projinit --trace FILE <command>` (or `<command> --trace FILE`) records
+nested spans across the phases of a run: detection, configuration and
+standards loading, YAML parsing, each check, update actions, template
+rendering and git subprocesses. The file is a Chrome trace (Trace Event
+Format, "complete" events) that loads in chrome://tracing and Perfetto:
+each span carries its process id and thread id, so the workers of a
+parallel run show as separate tracks, and its attributes (project path,
+check id, file...).
+
+Instrumented code uses `span()` blocks or the `@traced` decorator. When
+tracing is off, both only test a module global: `span()` returns a
+shared no-op context manager and traced functions are called directly.
+Hot loops fetch `active_tracer()` once and only open spans when it is not None,
+which costs one comparison per iteration when tracing is off.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Active tracer, None when tracing is off
+_tracer: "Tracer | None" = None
+
+
+class Tracer:
+    """Collects finished spans as Trace Event Format events."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.events: list[dict] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._threads: dict[int, str] = {}
+
+    def add(
+        self, name: str, category: str, start_ns: int, end_ns: int, args: dict
+    ) -> None:
+        """Record a finished span (list appends are thread-safe)."""
+        tid = threading.get_native_id()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self._origin_ns) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self.pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+
+    def to_dict(self) -> dict:
+        """Build the trace document, with process and thread names."""
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": 0,
+                "args": {"name": "projinit"},
+            }
+        ]
+        metadata.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self._threads.items()
+        )
+        return {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+    def span(self, name: str, category: str = "projinit", **attributes: Any):
+        """Time a block as a span of this tracer (see span())."""
+        return _Span(self, name, category, attributes)
+
+    def save(self, path: Path) -> None:
+        """Write the trace as JSON."""
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+
+class _Span:
+    """Times a block and records it on the active tracer."""
+
+    __slots__ = ("args", "category", "name", "start_ns", "tracer")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start_ns = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.add(
+            self.name, self.category, self.start_ns, time.perf_counter_ns(), self.args
+        )
+
+
+class _NoSpan:
+    """Context manager doing nothing, returned when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str, category: str = "projinit", **attributes: Any):
+    """
+    Time a block as a span.
+
+    Args:
+        name: Span name shown on the trace.
+        category: Phase of the span (detect, load, check, update...).
+        **attributes: Values shown with the span (project, file...).
+
+    Returns:
+        A context manager (a shared no-op one when tracing is off).
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(_tracer, name, category, attributes)
+
+
+def traced(
+    name: str,
+    category: str = "projinit",
+    attributes: Callable[..., dict[str, Any]] | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorate a function so each call is recorded as a span.
+
+    Args:
+        name: Span name shown on the trace.
+        category: Phase of the span.
+        attributes: Called with the arguments of each call (only when
+            tracing is on) to get the span attributes, e.g.
+            `lambda path, *_, **__: {"repo": str(path)}`.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            values = attributes(*args, **kwargs) if attributes else {}
+            with _Span(_tracer, name, category, values):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def active_tracer() -> Tracer | None:
+    """Get the active tracer (None when tracing is off)."""
+    return _tracer
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans (replacing any active tracer)."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing(path: Path | None = None) -> Tracer | None:
+    """
+    Stop recording spans.
+
+    Args:
+        path: If given, write the trace to this file.
+
+    Returns:
+        The tracer that was active, if any.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None and path is not None:
+        tracer.save(path)
+    return tracer
@@ -0,0 +1,370 @@
+"""In-memory project trees and output sinks for projinit v2.0.
+
+Generators render a project into a VirtualTree. A sink then writes the
+whole tree at once: DiskSink materializes it in a directory, ArchiveSink
+streams it straight into a tar or zip archive without touching the disk
+for individual files. Static files can be added as copies of an existing
+file: their content is never loaded, sinks copy or stream it from the
+source when the tree is written.
+"""
+
+import importlib
+import io
+import shutil
+import tarfile
+import time
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from projinit.core.tracing import traced
+from projinit.core.writer import atomic_open, copy_file, write_if_changed
+
+# Archive suffixes and the matching tarfile mode ("zip" and "zst" are special)
+ARCHIVE_FORMATS = {
+    ".zip": "zip",
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+    ".tar.bz2": "w:bz2",
+    ".tbz2": "w:bz2",
+    ".tar.xz": "w:xz",
+    ".txz": "w:xz",
+    ".tar.zst": "zst",
+    ".tzst": "zst",
+}
+
+DEFAULT_FILE_MODE = 0o644
+DEFAULT_DIR_MODE = 0o755
+EXECUTABLE_FILE_MODE = 0o755
+
+
+@dataclass
+class TreeEntry:
+    """A file or directory of a virtual tree."""
+
+    path: PurePosixPath
+    data: bytes | None = None
+    mode: int = DEFAULT_FILE_MODE
+    source: Path | None = None
+
+    @property
+    def is_dir(self) -> bool:
+        """Check if this entry is a directory."""
+        return self.data is None and self.source is None
+
+    @property
+    def is_copy(self) -> bool:
+        """Check if this entry is a copy of a file on disk."""
+        return self.source is not None
+
+    @property
+    def size(self) -> int:
+        """Size of the file content in bytes (0 for directories)."""
+        if self.source is not None:
+            return self.source.stat().st_size
+        return len(self.data) if self.data is not None else 0
+
+    def open(self):
+        """Open the file content as a binary stream."""
+        if self.source is not None:
+            return open(self.source, "rb")
+        return io.BytesIO(self.data)
+
+
+class VirtualTree:
+    """An in-memory project tree, keyed by project-relative POSIX path."""
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._entries: dict[PurePosixPath, TreeEntry] = {}
+
+    def write(
+        self,
+        path: str | PurePosixPath,
+        content: str | bytes,
+        mode: int = DEFAULT_FILE_MODE,
+    ) -> None:
+        """
+        Add or replace a file, creating its parent directories.
+
+        Args:
+            path: Project-relative path.
+            content: File content (text is encoded as UTF-8).
+            mode: Permission bits.
+        """
+        path = self._normalize(path)
+        self.mkdir(path.parent)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        self._entries[path] = TreeEntry(path, data, mode)
+
+    def copy(
+        self,
+        path: str | PurePosixPath,
+        source: Path,
+        mode: int | None = None,
+    ) -> None:
+        """
+        Add or replace a file with a copy of a file on disk.
+
+        The source is not read: it is copied when the tree is written.
+
+        Args:
+            path: Project-relative path.
+            source: File to copy.
+            mode: Permission bits (defaults to 755 if the source is
+                executable, 644 otherwise).
+        """
+        path = self._normalize(path)
+        if mode is None:
+            executable = source.stat().st_mode & 0o111
+            mode = EXECUTABLE_FILE_MODE if executable else DEFAULT_FILE_MODE
+        self.mkdir(path.parent)
+        self._entries[path] = TreeEntry(path, None, mode, source)
+
+    def mkdir(self, path: str | PurePosixPath) -> None:
+        """Add a directory and its parents (no-op for the tree root)."""
+        path = PurePosixPath(path)
+        for directory in [*reversed(path.parents), path]:
+            if directory.parts and directory not in self._entries:
+                self._entries[directory] = TreeEntry(directory, None, DEFAULT_DIR_MODE)
+
+    def read(self, path: str | PurePosixPath) -> bytes:
+        """
+        Get the content of a file.
+
+        Raises:
+            KeyError: If the path is not a file of the tree.
+        """
+        entry = self._entries[PurePosixPath(path)]
+        if entry.is_dir:
+            raise KeyError(path)
+        if entry.is_copy:
+            return entry.source.read_bytes()
+        return entry.data
+
+    def files(self) -> list[PurePosixPath]:
+        """List file paths, sorted."""
+        return sorted(p for p, e in self._entries.items() if not e.is_dir)
+
+    @property
+    def size(self) -> int:
+        """Total size of file contents in bytes."""
+        return sum(e.size for e in self._entries.values())
+
+    def __iter__(self) -> Iterator[TreeEntry]:
+        """Iterate over entries, parents before children."""
+        return iter(sorted(self._entries.values(), key=lambda e: e.path.parts))
+
+    def __contains__(self, path: str | PurePosixPath) -> bool:
+        return PurePosixPath(path) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(path: str | PurePosixPath) -> PurePosixPath:
+        """Validate a project-relative path."""
+        path = PurePosixPath(path)
+        if path.is_absolute() or ".." in path.parts or not path.parts:
+            raise ValueError(f"Invalid path in project tree: {path}")
+        return path
+
+
+class DiskSink:
+    """Writes a virtual tree into a directory."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize the sink.
+
+        Args:
+            root: Directory the tree is written into (created if needed).
+        """
+        self.root = root
+
+    @traced("write_tree", "write")
+    def write(self, tree: VirtualTree) -> int:
+        """
+        Write all entries of the tree.
+
+        Files whose content is already up to date are left untouched.
+        Copy entries are always copied, with copy_file.
+
+        Returns:
+            Number of files actually written.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        written = 0
+        for entry in tree:
+            target = self.root.joinpath(*entry.path.parts)
+            if entry.is_dir:
+                target.mkdir(exist_ok=True)
+                continue
+            if entry.is_copy:
+                copy_file(entry.source, target)
+                written += 1
+            elif write_if_changed(target, entry.data):
+                written += 1
+            if entry.mode != DEFAULT_FILE_MODE:
+                target.chmod(entry.mode)
+        return written
+
+
+class ArchiveSink:
+    """Streams a virtual tree into a tar or zip archive."""
+
+    def __init__(self, path: Path, prefix: str = "", mtime: float | None = None):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Archive to create; the format is taken from its suffix.
+            prefix: Top-level directory of the entries inside the archive.
+            mtime: Modification time of the entries (defaults to now).
+
+        Raises:
+            ValueError: If the suffix is not a supported archive format.
+        """
+        self.path = path
+        self.prefix = PurePosixPath(prefix) if prefix else PurePosixPath()
+        self.mtime = time.time() if mtime is None else mtime
+        self.format = archive_format(path)
+
+    @traced("write_archive", "write")
+    def write(self, tree: VirtualTree) -> int:
+        """
+        Write the tree as a single archive.
+
+        The archive is built in a temporary file next to the target and
+        renamed into place, so a partial archive is never left behind.
+
+        Returns:
+            Number of files in the archive.
+        """
+        with atomic_open(self.path) as f:
+            if self.format == "zip":
+                self._write_zip(tree, f)
+            elif self.format == "zst":
+                self._write_zstd_tar(tree, f)
+            else:
+                with tarfile.open(fileobj=f, mode=self.format) as tar:
+                    self._add_to_tar(tree, tar)
+        return len(tree.files())
+
+    def _name(self, entry: TreeEntry) -> str:
+        """Get the archive member name of an entry."""
+        return (self.prefix / entry.path).as_posix()
+
+    def _add_to_tar(self, tree: VirtualTree, tar: tarfile.TarFile) -> None:
+        """Add every entry of the tree to an open tar archive."""
+        if self.prefix.parts:
+            tar.addfile(
+                self._tar_info(str(self.prefix), tarfile.DIRTYPE, DEFAULT_DIR_MODE)
+            )
+        for entry in tree:
+            if entry.is_dir:
+                tar.addfile(
+                    self._tar_info(self._name(entry), tarfile.DIRTYPE, entry.mode)
+                )
+            else:
+                info = self._tar_info(self._name(entry), tarfile.REGTYPE, entry.mode)
+                info.size = entry.size
+                with entry.open() as content:
+                    tar.addfile(info, content)
+
+    def _tar_info(self, name: str, kind: bytes, mode: int) -> tarfile.TarInfo:
+        """Build a tar header."""
+        info = tarfile.TarInfo(name)
+        info.type = kind
+        info.mode = mode
+        info.mtime = self.mtime
+        return info
+
+    def _write_zip(self, tree: VirtualTree, f) -> None:
+        """Write the tree as a deflated zip archive."""
+        date_time = time.localtime(self.mtime)[:6]
+        with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for entry in tree:
+                if entry.is_dir:
+                    info = zipfile.ZipInfo(self._name(entry) + "/", date_time)
+                    info.external_attr = (0o40000 | entry.mode) << 16
+                    zf.writestr(info, b"")
+                else:
+                    info = zipfile.ZipInfo(self._name(entry), date_time)
+                    info.external_attr = (0o100000 | entry.mode) << 16
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    if entry.is_copy:
+                        info.file_size = entry.size
+                        with entry.open() as src, zf.open(info, "w") as dst:
+                            shutil.copyfileobj(src, dst, 1024 * 1024)
+                    else:
+                        zf.writestr(info, entry.data)
+
+    def _write_zstd_tar(self, tree: VirtualTree, f) -> None:
+        """Write the tree as a zstd-compressed tar stream."""
+        writer = _zstd_writer(f)
+        try:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                self._add_to_tar(tree, tar)
+        finally:
+            writer.close()
+
+
+_ZSTD_MISSING = (
+    "zstd archives require Python 3.14+ or the zstandard package "
+    "(pip install zstandard)"
+)
+
+
+def archive_format(path: Path) -> str:
+    """
+    Get the archive format for a path from its suffix.
+
+    Raises:
+        ValueError: If the suffix is not a supported archive format, or is a
+            zstd one and no zstd implementation is available.
+    """
+    name = path.name.lower()
+    for suffix, fmt in sorted(ARCHIVE_FORMATS.items(), key=lambda i: -len(i[0])):
+        if name.endswith(suffix):
+            if fmt == "zst" and not zstd_available():
+                raise ValueError(f"Cannot write {path.name}: {_ZSTD_MISSING}")
+            return fmt
+    supported = ", ".join(ARCHIVE_FORMATS)
+    raise ValueError(f"Unsupported archive format: {path.name} (use {supported})")
+
+
+def zstd_available() -> bool:
+    """Check whether zstd archives can be written (see _zstd_writer)."""
+    for module in ("compression.zstd", "zstandard"):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def _zstd_writer(f):
+    """
+    Open a zstd compression stream over a binary file.
+
+    Uses the standard library module on Python 3.14+, otherwise the optional
+    zstandard package.
+
+    Raises:
+        RuntimeError: If no zstd implementation is available.
+    """
+    try:
+        from compression import zstd
+
+        return zstd.ZstdFile(f, "wb")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(_ZSTD_MISSING) from e
+    return zstandard.ZstdCompressor().stream_writer(f, closefd=False)
@@ -1,11 +1,12 @@
 """Project updater for projinit v2.0."""
 
-import shutil
 from datetime import datetime
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import TemplateNotFound
 
+from projinit.core.backup import BackupStore
+from projinit.core.config import load_config
 from projinit.core.merger import merge_precommit_config, merge_toml_section
 from projinit.core.models import (
     ActionType,
@@ -15,11 +16,11 @@
     ProjectType,
     UpdateAction,
 )
+from projinit.core.templates import create_template_env
+from projinit.core.tracing import span, traced
+from projinit.core.writer import is_unchanged, write_if_changed
 from projinit.standards.loader import load_standards
 
-# Path to templates
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-
 
 class Updater:
     """Applies updates to make a project conform to standards."""
@@ -38,23 +39,24 @@ def __init__(
             project_path: Path to the project root.
             project_type: Detected or specified project type.
             dry_run: If True, don't actually modify files.
-            create_backup: If True, create .bak files before modifying.
+            create_backup: If True, back up files to the project backup store
+                before modifying them.
         """
         self.project_path = project_path
         self.project_type = project_type
         self.dry_run = dry_run
         self.create_backup = create_backup
         self.actions_taken: list[UpdateAction] = []
+        self.unchanged_actions: list[UpdateAction] = []
+        self.backup_store = BackupStore(project_path) if create_backup else None
+        self.backup_index: Path | None = None
 
-        # Setup Jinja2 environment
-        if TEMPLATES_DIR.exists():
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(str(TEMPLATES_DIR)),
-                keep_trailing_newline=True,
-            )
-        else:
-            self.jinja_env = None
+        # Setup Jinja2 environment (honours the project template configuration)
+        self.jinja_env = create_template_env(load_config(project_path).templates)
 
+    @traced(
+        "generate_actions", "update", lambda self, *_: {"repo": str(self.project_path)}
+    )
     def generate_actions(self, report: AuditReport) -> list[UpdateAction]:
         """
         Generate update actions based on an audit report.
@@ -83,6 +85,9 @@ def generate_actions(self, report: AuditReport) -> list[UpdateAction]:
 
         return actions
 
+    @traced(
+        "apply_actions", "update", lambda self, *_: {"repo": str(self.project_path)}
+    )
     def apply_actions(self, actions: list[UpdateAction]) -> list[UpdateAction]:
         """
         Apply a list of update actions.
@@ -96,11 +101,16 @@ def apply_actions(self, actions: list[UpdateAction]) -> list[UpdateAction]:
         applied = []
 
         for action in actions:
-            success = self._apply_single_action(action)
+            with span(action.action_type.value, "update", file=str(action.target)):
+                success = self._apply_single_action(action)
             if success:
                 applied.append(action)
                 self.actions_taken.append(action)
 
+        # Record which files were backed up during this run
+        if self.backup_store and not self.dry_run:
+            self.backup_index = self.backup_store.commit()
+
         return applied
 
     def _find_check_definition(self, standards: dict, check_id: str) -> dict | None:
@@ -213,7 +223,7 @@ def _apply_create(self, action: UpdateAction) -> bool:
             try:
                 template = self.jinja_env.get_template(str(action.source))
                 content = template.render(**action.template_vars)
-                target.write_text(content, encoding="utf-8")
+                write_if_changed(target, content)
                 return True
             except TemplateNotFound:
                 pass
@@ -228,26 +238,31 @@ def _apply_merge(self, action: UpdateAction) -> bool:
         if not target.exists():
             return False
 
-        # Backup if needed
-        if self.create_backup:
-            self._backup_file(target)
-
         # Handle pre-commit hooks merge
         if "hooks" in action.template_vars:
             hooks = action.template_vars["hooks"]
             content = merge_precommit_config(target, hooks)
-            target.write_text(content, encoding="utf-8")
-            return True
 
         # Handle TOML section merge
-        if "section" in action.template_vars:
+        elif "section" in action.template_vars:
             section = action.template_vars["section"]
             existing = target.read_text(encoding="utf-8")
             content = merge_toml_section(existing, section["name"], section["values"])
-            target.write_text(content, encoding="utf-8")
+
+        else:
+            return False
+
+        # Nothing to write: skip the backup and keep the file untouched
+        if is_unchanged(target, content):
+            self.unchanged_actions.append(action)
             return True
 
-        return False
+        # Backup if needed
+        if self.create_backup:
+            self._backup_file(target)
+
+        write_if_changed(target, content)
+        return True
 
     def _apply_modify(self, action: UpdateAction) -> bool:
         """Apply a modify action."""
@@ -255,11 +270,9 @@ def _apply_modify(self, action: UpdateAction) -> bool:
         return False
 
     def _backup_file(self, path: Path) -> None:
-        """Create a backup of a file."""
-        if path.exists():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = path.with_suffix(f"{path.suffix}.{timestamp}.bak")
-            shutil.copy2(path, backup_path)
+        """Back up a file to the content-addressed backup store."""
+        if self.backup_store:
+            self.backup_store.backup(path)
 
     def _get_template_vars(self) -> dict:
         """Get template variables for rendering."""
@@ -318,7 +331,7 @@ def _create_minimal_file(self, path: Path, vars: dict) -> bool:
         else:
             content = ""
 
-        path.write_text(content, encoding="utf-8")
+        write_if_changed(path, content)
         return True
 
     def _get_minimal_gitignore(self) -> str:
@@ -344,6 +357,9 @@ def _get_minimal_gitignore(self) -> str:
 # Environment
 .env
 .envrc
+
+# projinit
+.projinit/backups/
 """
 
     def _get_minimal_precommit(self) -> str:
@@ -0,0 +1,217 @@
+"""File writing helpers for projinit v2.0.
+
+Every file generated or updated by projinit goes through write_if_changed,
+so files whose content is already up to date are left untouched (no mtime
+bump, no editor reloads or rebuilds triggered by watchers). Static files
+are duplicated with copy_file, which lets the kernel (or the filesystem,
+through reflinks) do the copy.
+
+Files that other processes may read while projinit writes them (backups,
+archives, caches, result and metrics files) go through atomic_open: they
+are written to a unique temporary file next to the target, then renamed
+over it. Readers never see a partial file, concurrent writers of the same
+path do not share a temporary file, and a failed write leaves no
+temporary file behind.
+"""
+
+import errno
+import os
+import shutil
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+# Process umask, read once at import: os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _encode(content: str | bytes, encoding: str) -> bytes:
+    """Encode text content, passing bytes through."""
+    return content.encode(encoding) if isinstance(content, str) else content
+
+
+def is_unchanged(path: Path, content: str | bytes, encoding: str = "utf-8") -> bool:
+    """
+    Check whether a file already holds exactly the given content.
+
+    The file size is compared first, so differing files are usually
+    detected from a single stat call without reading them.
+
+    Args:
+        path: File to compare.
+        content: Expected content.
+        encoding: Encoding used for text content.
+
+    Returns:
+        True if the file exists with identical bytes.
+    """
+    data = _encode(content, encoding)
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_if_changed(path: Path, content: str | bytes, encoding: str = "utf-8") -> bool:
+    """
+    Write content to a file unless it is already up to date.
+
+    Args:
+        path: File to write.
+        content: Content to write.
+        encoding: Encoding used for text content.
+
+    Returns:
+        True if the file was written, False if the write was skipped.
+    """
+    data = _encode(content, encoding)
+    if is_unchanged(path, data):
+        return False
+    path.write_bytes(data)
+    return True
+
+
+@contextmanager
+def atomic_open(
+    path: Path, mode: str = "wb", encoding: str | None = None
+) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces path when the block exits cleanly.
+
+    The new file keeps the permissions of the file it replaces, or gets the
+    default permissions of a new file (mkstemp alone would create it 0600).
+    If the block raises, the temporary file is removed and path is left
+    untouched.
+
+    Args:
+        path: Target file (parent directories are created).
+        mode: "wb" or "w".
+        encoding: Encoding for text mode.
+
+    Yields:
+        The open temporary file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        try:
+            permissions = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            permissions = 0o666 & ~_UMASK
+        os.chmod(tmp_name, permissions)
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write(path: Path, content: str | bytes, encoding: str = "utf-8") -> None:
+    """Write content to a file atomically (see atomic_open)."""
+    with atomic_open(path) as f:
+        f.write(_encode(content, encoding))
+
+
+# ioctl request to clone a whole file (Linux, btrfs/xfs/bcachefs...)
+_FICLONE = 0x40049409
+
+# Errors meaning "this copy method is not available here, try the next one"
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.EPERM,
+}
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def copy_file(source: Path, target: Path) -> str:
+    """
+    Copy a file without reading it into Python when possible.
+
+    Methods are tried in order: reflink (copy-on-write clone, the copy
+    shares its blocks with the source), then os.copy_file_range and
+    os.sendfile (in-kernel copies), then a plain buffered copy.
+
+    Args:
+        source: File to copy.
+        target: Destination file (created or truncated).
+
+    Returns:
+        Name of the method used: "reflink", "copy_file_range", "sendfile"
+        or "copy".
+    """
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        size = os.fstat(src_fd).st_size
+        if size and _reflink(src_fd, dst_fd):
+            return "reflink"
+        for name, copy in _KERNEL_COPIES:
+            if size and hasattr(os, name) and _kernel_copy(copy, src_fd, dst_fd, size):
+                return name
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+        return "copy"
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone a file with the FICLONE ioctl."""
+    try:
+        import fcntl
+
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy a chunk with os.copy_file_range."""
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy a chunk with os.sendfile (writes at the destination position)."""
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+_KERNEL_COPIES = (
+    ("copy_file_range", _copy_file_range),
+    ("sendfile", _sendfile),
+)
+
+
+def _kernel_copy(copy, src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy a whole file with an in-kernel copy function.
+
+    Returns:
+        True on success. False if the method is unsupported for these
+        files; the destination is then reset so the next method starts
+        from an empty file.
+    """
+    offset = 0
+    try:
+        while offset < size:
+            copied = copy(src_fd, dst_fd, offset, size - offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED:
+            raise
+    if offset == size:
+        return True
+    os.ftruncate(dst_fd, 0)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    return False
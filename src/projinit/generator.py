@@ -2,11 +2,16 @@
 
 import subprocess
 from dataclasses import dataclass, field
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment
 from rich.console import Console
 
+from projinit.core.fragments import gitignore_content, precommit_content
+from projinit.core.git import bootstrap_repository
+from projinit.core.templates import create_template_env
+from projinit.core.tree import ArchiveSink, DiskSink, VirtualTree
+
 console = Console()
 
 
@@ -35,58 +40,40 @@ def hcl_escape(value: str) -> str:
 
 def get_template_env() -> Environment:
     """Retourne l'environnement Jinja2 avec les templates."""
-    env = Environment(
-        loader=PackageLoader("projinit", "templates"),
-        keep_trailing_newline=True,
-    )
+    env = create_template_env()
     # Filtres personnalisés
     env.filters["hcl_escape"] = hcl_escape
     return env
 
 
 def generate_gitignore_content(env: Environment, technologies: list[str]) -> str:
-    """Génère le contenu du .gitignore en concaténant les fragments."""
-    # Toujours inclure les patterns communs en premier
-    content = env.get_template("gitignore/_common.j2").render()
+    """
+    Génère le contenu du .gitignore en concaténant les fragments.
 
-    # Ajouter les fragments pour chaque technologie sélectionnée (ordre alphabétique)
-    for tech in sorted(technologies):
-        template_path = f"gitignore/{tech}.j2"
-        content += env.get_template(template_path).render()
-
-    return content
+    Les fragments sont rendus une seule fois puis assemblés par ensemble de
+    technologies (ordre alphabétique) ; le paramètre env est conservé pour
+    compatibilité.
+    """
+    return gitignore_content(technologies)
 
 
 def generate_precommit_content(env: Environment, technologies: list[str]) -> str:
-    """Génère le contenu du .pre-commit-config.yaml en concaténant les fragments."""
-    # Toujours inclure le header avec les hooks communs
-    content = env.get_template("precommit/_header.j2").render()
-
-    # Ajouter les fragments pour chaque technologie sélectionnée (ordre alphabétique)
-    # Exclure 'ide' car il n'a pas de hooks pre-commit
-    for tech in sorted(technologies):
-        if tech == "ide":
-            continue
-        template_path = f"precommit/{tech}.j2"
-        try:
-            content += env.get_template(template_path).render()
-        except Exception:
-            # Template non trouvé pour cette technologie, ignorer
-            pass
-
-    return content
-
-
-def generate_project(config: ProjectConfig, target_dir: Path) -> bool:
-    """Génère la structure complète du projet."""
-    env = get_template_env()
+    """
+    Génère le contenu du .pre-commit-config.yaml en concaténant les fragments.
 
-    # Créer le dossier principal
-    target_dir.mkdir(parents=True, exist_ok=True)
+    Les technologies sans fragment pre-commit (comme 'ide') sont ignorées.
+    """
+    return precommit_content(technologies)
+
+
+def render_project(config: ProjectConfig) -> VirtualTree:
+    """Génère la structure complète du projet dans une arborescence en mémoire."""
+    env = get_template_env()
+    tree = VirtualTree()
 
     # Créer le dossier terraform
-    terraform_dir = target_dir / "terraform"
-    terraform_dir.mkdir(exist_ok=True)
+    terraform_dir = PurePosixPath("terraform")
+    tree.mkdir(terraform_dir)
 
     # Contexte pour les templates
     context = {
@@ -99,12 +86,13 @@ def generate_project(config: ProjectConfig, target_dir: Path) -> bool:
     }
 
     # Générer le .gitignore dynamiquement à partir des fragments
-    gitignore_content = generate_gitignore_content(env, config.technologies)
-    (target_dir / ".gitignore").write_text(gitignore_content)
+    tree.write(".gitignore", generate_gitignore_content(env, config.technologies))
 
     # Générer le .pre-commit-config.yaml dynamiquement à partir des fragments
-    precommit_content = generate_precommit_content(env, config.technologies)
-    (target_dir / ".pre-commit-config.yaml").write_text(precommit_content)
+    tree.write(
+        ".pre-commit-config.yaml",
+        generate_precommit_content(env, config.technologies),
+    )
 
     # Générer les autres fichiers racine
     root_files = [
@@ -117,8 +105,7 @@ def generate_project(config: ProjectConfig, target_dir: Path) -> bool:
 
     for template_name, output_name in root_files:
         template = env.get_template(template_name)
-        content = template.render(**context)
-        (target_dir / output_name).write_text(content)
+        tree.write(output_name, template.render(**context))
 
     # Générer les fichiers Terraform
     terraform_files = [
@@ -131,43 +118,40 @@ def generate_project(config: ProjectConfig, target_dir: Path) -> bool:
 
     for template_name, output_name in terraform_files:
         template = env.get_template(template_name)
-        content = template.render(**context)
-        (terraform_dir / output_name).write_text(content)
-
+        tree.write(terraform_dir / output_name, template.render(**context))
+
+    return tree
+
+
+def generate_project(
+    config: ProjectConfig,
+    target_dir: Path,
+    sink: DiskSink | ArchiveSink | None = None,
+    tree: VirtualTree | None = None,
+) -> bool:
+    """
+    Génère la structure complète du projet.
+
+    Le projet est rendu en mémoire (ou tree est utilisé s'il est déjà rendu)
+    puis écrit en une passe par le sink (par défaut, dans target_dir).
+    """
+    if tree is None:
+        tree = render_project(config)
+    (sink or DiskSink(target_dir)).write(tree)
     return True
 
 
-def init_git_repository(target_dir: Path) -> bool:
-    """Initialise le dépôt git avec le premier commit."""
-    try:
-        # git init
-        subprocess.run(
-            ["git", "init", "-b", "main"],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
-        )
-
-        # git add .
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
-        )
-
-        # git commit
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit - project scaffolding"],
-            cwd=target_dir,
-            capture_output=True,
-            check=True,
-        )
+def init_git_repository(target_dir: Path, tree: VirtualTree) -> bool:
+    """
+    Initialise le dépôt git avec le premier commit.
 
+    Le commit est construit directement à partir de l'arborescence générée,
+    sans relire les fichiers avec `git add`.
+    """
+    if bootstrap_repository(target_dir, tree):
         return True
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Erreur lors de l'initialisation git : {e}[/red]")
-        return False
+    console.print("[red]Erreur lors de l'initialisation git[/red]")
+    return False
 
 
 def allow_direnv(target_dir: Path) -> bool:
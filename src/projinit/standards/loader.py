@@ -4,12 +4,15 @@
 
 import yaml
 
+from projinit.core.merger import deep_merge, merge_lists
 from projinit.core.models import ProjectType
+from projinit.core.tracing import span, traced
 
 # Path to default standards
 DEFAULTS_DIR = Path(__file__).parent / "defaults"
 
 
+@traced("load_standards", "load")
 def load_standards(
     project_type: ProjectType,
     project_path: Path | None = None,
@@ -73,20 +76,18 @@ def _apply_config_overrides(standards: dict, config) -> dict:
 
     # Remove disabled checks
     if config.standards.disabled_checks:
+        disabled = set(config.standards.disabled_checks)
         standards["checks"] = [
-            c
-            for c in standards.get("checks", [])
-            if c.get("id") not in config.standards.disabled_checks
+            c for c in standards.get("checks", []) if c.get("id") not in disabled
         ]
 
-    # Add extra checks
+    # Add extra checks (avoiding duplicates)
     if config.standards.extra_checks:
-        for extra_check in config.standards.extra_checks:
-            if extra_check.get("id"):
-                # Avoid duplicates
-                existing_ids = {c.get("id") for c in standards.get("checks", [])}
-                if extra_check["id"] not in existing_ids:
-                    standards.setdefault("checks", []).append(extra_check)
+        standards["checks"] = merge_lists(
+            standards.get("checks", []),
+            [c for c in config.standards.extra_checks if c.get("id")],
+            key_fields=("id",),
+        )
 
     # Add extra pre-commit hooks
     if config.standards.extra_precommit_hooks:
@@ -138,7 +139,7 @@ def get_checks_for_type(project_type: ProjectType) -> list[dict]:
 def _load_yaml(path: Path) -> dict:
     """Load a YAML file and return its content."""
     try:
-        with open(path, encoding="utf-8") as f:
+        with span("yaml", "load", file=path.name), open(path, encoding="utf-8") as f:
             return yaml.safe_load(f) or {}
     except (OSError, yaml.YAMLError) as e:
         raise RuntimeError(f"Failed to load standards from {path}: {e}") from e
@@ -148,28 +149,8 @@ def _merge_standards(base: dict, overlay: dict) -> dict:
     """
     Merge two standards dictionaries.
 
-    Lists (checks, hooks) are concatenated, other values are overwritten.
-    Does not modify the original base dictionary.
+    Lists (checks, hooks) are merged by key (id, name or repo) with base
+    items kept, other values are overwritten. Does not modify the original
+    base dictionary.
     """
-    # Deep copy lists to avoid modifying the original
-    result = {}
-    for key, value in base.items():
-        if isinstance(value, list):
-            result[key] = list(value)  # Create a copy of the list
-        else:
-            result[key] = value
-
-    for key, value in overlay.items():
-        if key in ("checks", "precommit_hooks") and isinstance(value, list):
-            # Concatenate lists, avoiding duplicates by id
-            if key not in result:
-                result[key] = []
-            existing_ids = {item.get("id") for item in result[key]}
-            for item in value:
-                if item.get("id") not in existing_ids:
-                    result[key].append(item)
-                    existing_ids.add(item.get("id"))
-        else:
-            result[key] = value
-
-    return result
+    return deep_merge(base, overlay, overwrite=True)
@@ -1,10 +1,19 @@
 """Shared fixtures for projinit tests."""
 
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from projinit.core.models import (
+    AuditReport,
+    CheckLevel,
+    CheckResult,
+    CheckStatus,
+    ProjectType,
+)
+
 
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
@@ -213,3 +222,48 @@ def complete_python_project(python_cli_project: Path) -> Path:
     (claude_commands / "quality.md").write_text("# Quality Check")
 
     return project
+
+
+@pytest.fixture
+def make_report() -> Callable[..., AuditReport]:
+    """Factory of audit reports with one check per status."""
+
+    def make(
+        path: str,
+        *statuses: CheckStatus,
+        project_type: ProjectType = ProjectType.PYTHON_CLI,
+        level: CheckLevel | dict[str, CheckLevel] = CheckLevel.REQUIRED,
+        message: str = "",
+        suggestion: str | None = None,
+        file_path: str | None = None,
+        execution_time_ms: float = 0.0,
+        **named_statuses: CheckStatus,
+    ) -> AuditReport:
+        """
+        Build a report.
+
+        Positional statuses become checks check_0, check_1...; keyword
+        statuses are named after their keyword. The message may contain
+        "{status}". The suggestion is set on failed checks and the file
+        path (relative to path) on the first check only.
+        """
+        checks = {f"check_{i}": status for i, status in enumerate(statuses)}
+        checks.update(named_statuses)
+        return AuditReport(
+            project_path=Path(path),
+            project_type=project_type,
+            checks=[
+                CheckResult(
+                    id=check_id,
+                    status=status,
+                    message=message.format(status=status.value),
+                    level=level[check_id] if isinstance(level, dict) else level,
+                    suggestion=suggestion if status == CheckStatus.FAILED else None,
+                    file_path=Path(path) / file_path if file_path and i == 0 else None,
+                )
+                for i, (check_id, status) in enumerate(checks.items())
+            ],
+            execution_time_ms=execution_time_ms,
+        )
+
+    return make
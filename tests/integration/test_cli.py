@@ -1,7 +1,9 @@
 """Integration tests for projinit CLI."""
 
+import json
 import subprocess
 import sys
+import tarfile
 from pathlib import Path
 
 import pytest
@@ -81,6 +83,201 @@ def test_check_with_type_override(self, python_cli_project: Path):
         # Should run with specified type
         assert result.returncode in (0, 1)  # 0 = pass, 1 = failures
 
+    def test_check_fleet_ndjson(self, python_cli_project: Path, temp_dir: Path):
+        """Test streaming NDJSON records for several projects."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "projinit",
+                "check",
+                str(python_cli_project),
+                str(temp_dir / "nonexistent"),
+                "-f",
+                "ndjson",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        types = [r["type"] for r in records]
+        assert result.returncode == 2
+        assert types[0] == "check"
+        assert types[-2:] == ["summary", "error"]
+        assert records[-2]["project"] == str(python_cli_project)
+
+    def test_check_plain_skips_rich(self, python_cli_project: Path):
+        """Test that plain output loads neither rich nor questionary."""
+        code = (
+            "import sys\n"
+            "from projinit.main_cli import main\n"
+            f"sys.argv = ['projinit', 'check', {str(python_cli_project)!r}, '-f', 'plain']\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in ('rich', 'questionary') if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+
+        assert "PASS" in result.stdout
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    def test_check_record_and_history(self, python_cli_project: Path, temp_dir: Path):
+        """Test recording audits and querying the history database."""
+        db = temp_dir / "history.db"
+        check = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "projinit",
+                "check",
+                "--record",
+                str(python_cli_project),
+                "-f",
+                "json",
+                "--record-db",
+                str(db),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        history = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "projinit",
+                "history",
+                "--db",
+                str(db),
+                "-f",
+                "json",
+                "worst",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert check.returncode in (0, 1)
+        assert json.loads(check.stdout)["project_path"] == str(python_cli_project)
+        assert history.returncode == 0
+        [latest] = json.loads(history.stdout)
+        assert latest["project"] == str(python_cli_project)
+        assert round(latest["score"], 1) == json.loads(check.stdout)["score"]
+
+    def test_check_record_unwritable_db(self, python_cli_project: Path, temp_dir: Path):
+        """Test that a database that cannot be opened is reported without a traceback."""
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", str(python_cli_project), "-f", "plain", "--record-db", str(temp_dir)],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 2
+        assert f"Error: cannot record in {temp_dir}" in result.stderr
+        assert "Traceback" not in result.stderr
+
+    def test_check_fleet_ndjson_record_and_export(self, python_cli_project: Path, temp_dir: Path):
+        """Test that streamed reports are recorded and exported as they complete."""
+        project = str(python_cli_project)
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", project, project, "-f", "ndjson", "--record-db", str(temp_dir / "history.db"), "--export", str(temp_dir / "audit.pjr")],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode in (0, 1)
+        assert "Recorded 2 audit(s)" in result.stderr
+        assert "Exported 2 audit(s)" in result.stderr
+
+    def test_check_export(self, python_cli_project: Path, temp_dir: Path):
+        """Test that an exported result file compares equal to the JSON report."""
+        exported = temp_dir / "audit.pjr"
+        check = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "projinit",
+                "check",
+                str(python_cli_project),
+                "-f",
+                "json",
+                "--export",
+                str(exported),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        document = temp_dir / "audit.json"
+        document.write_text(check.stdout)
+
+        diff = subprocess.run(
+            [sys.executable, "-m", "projinit", "diff-report", str(document), str(exported), "-f", "json"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert exported.read_bytes().startswith(b"PJRF")
+        assert "Exported 1 audit(s)" in check.stderr
+        assert diff.returncode == 0
+        assert json.loads(diff.stdout)["transitions"] == []
+
+    def test_check_trace(self, python_cli_project: Path, temp_dir: Path):
+        """Test that --trace writes a Chrome trace of the audit phases."""
+        trace = temp_dir / "trace.json"
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", str(python_cli_project), "-f", "json", "--trace", str(trace)],
+            capture_output=True,
+            text=True,
+        )
+
+        events = json.loads(trace.read_text())["traceEvents"]
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        assert result.returncode in (0, 1)
+        assert spans["check"]["cat"] == "cli"
+        assert spans["audit"]["args"]["repo"] == str(python_cli_project)
+        assert spans["detect_project_type"]["cat"] == "detect"
+
+    def test_check_memprofile(self, python_cli_project: Path, temp_dir: Path):
+        """Test that --memprofile writes a memory profile per project and phase."""
+        profile_path = temp_dir / "memory.json"
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", str(python_cli_project), str(temp_dir / "missing"), "-f", "ndjson", "--memprofile", str(profile_path)],
+            capture_output=True,
+            text=True,
+        )
+
+        profile = json.loads(profile_path.read_text())
+        repo, missing = profile["repos"]
+        assert result.returncode == 2
+        assert repo["repo"] == str(python_cli_project)
+        assert list(repo["phases"]) == ["detection", "standards", "checks", "reporting"]
+        assert missing["phases"] == {}
+        assert profile["peak_bytes"] >= repo["peak_bytes"] > 0
+        assert profile["phases"]["standards"]["top_sites"]
+
+    def test_check_metrics_file(self, python_cli_project: Path, temp_dir: Path):
+        """Test that --metrics-file writes Prometheus gauges per project."""
+        metrics_path = temp_dir / "projinit.prom"
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", str(python_cli_project), str(temp_dir / "missing"), "-f", "ndjson", "--metrics-file", str(metrics_path)],
+            capture_output=True,
+            text=True,
+        )
+
+        text = metrics_path.read_text()
+        assert result.returncode == 2
+        assert "# TYPE projinit_score_ratio gauge" in text
+        assert f'projinit_compliant{{repo="{python_cli_project}",project_type="python-cli"}} ' in text
+        assert 'check="has_readme"' in text
+        assert "missing" not in text
+        assert "Metrics written to" in result.stderr
+
     def test_check_nonexistent_path(self, temp_dir: Path):
         """Test check command with non-existent path."""
         result = subprocess.run(
@@ -92,6 +289,93 @@ def test_check_nonexistent_path(self, temp_dir: Path):
         assert result.returncode != 0
 
 
+class TestDiffReportCommand:
+    """Tests for diff-report command."""
+
+    def test_diff_report_regression(self, python_cli_project: Path, temp_dir: Path):
+        """Test that a regression between two reports is reported and fails."""
+        readme = python_cli_project / "README.md"
+        readme.write_text("# my-cli\n")
+        reports = []
+        for name in ("old.json", "new.json"):
+            result = subprocess.run(
+                [sys.executable, "-m", "projinit", "check", str(python_cli_project), "-f", "json"],
+                capture_output=True,
+                text=True,
+            )
+            path = temp_dir / name
+            path.write_text(result.stdout)
+            reports.append(path)
+            # Break a passing check before the second audit
+            readme.unlink(missing_ok=True)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "diff-report", *map(str, reports), "-f", "json"],
+            capture_output=True,
+            text=True,
+        )
+
+        diff = json.loads(result.stdout)
+        assert result.returncode == 1
+        assert diff["summary"]["regressions"] == 1
+        assert diff["transitions"][0]["check_id"] == "has_readme"
+
+
+class TestStatsCommand:
+    """Tests for stats command."""
+
+    def test_stats_json(self, python_cli_project: Path, temp_dir: Path):
+        """Test fleet statistics over a saved NDJSON audit."""
+        pytest.importorskip("numpy")
+        report = temp_dir / "fleet.ndjson"
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "check", str(python_cli_project), "-f", "ndjson"],
+            capture_output=True,
+            text=True,
+        )
+        report.write_text(result.stdout)
+
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "stats", str(report), "-f", "json"],
+            capture_output=True,
+            text=True,
+        )
+
+        stats = json.loads(result.stdout)
+        assert result.returncode == 0
+        assert stats["projects"] == 1
+        assert stats["scores"][0]["project_type"] == "python-cli"
+        assert stats["failure_rates"][0]["failed"] == 1
+
+
+class TestBenchCommand:
+    """Tests for bench command."""
+
+    def test_bench_json(self):
+        """Test a benchmark of a small synthetic fleet."""
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "bench", "-n", "2", "-t", "python-lib", "-t", "lab"],
+            capture_output=True,
+            text=True,
+        )
+
+        bench = json.loads(result.stdout)
+        assert result.returncode == 0
+        assert bench["projects"] == 4
+        assert set(bench["by_type"]) == {"python-lib", "lab"}
+        assert bench["phases"]["check"]["count"] == 4
+
+    def test_bench_invalid_rate(self):
+        """Test that rates outside [0, 1] are rejected."""
+        result = subprocess.run(
+            [sys.executable, "-m", "projinit", "bench", "--missing-rate", "2"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 1
+
+
 class TestInitCommand:
     """Tests for the init command."""
 
@@ -191,6 +475,50 @@ def test_new_with_all_types(self, temp_dir: Path):
             if result.returncode == 0:
                 assert project_path.exists(), f"Project not created for type {ptype}"
 
+    def test_new_output_archive(self, temp_dir: Path):
+        """Test new command writing the project into an archive."""
+        archive = temp_dir / "project.tar.gz"
+
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "projinit", "new",
+                "archived-project",
+                "-t", "python-lib",
+                "--output-archive", str(archive),
+                "-y",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert not (temp_dir / "archived-project").exists()
+        with tarfile.open(archive) as tar:
+            assert "archived-project/pyproject.toml" in tar.getnames()
+
+    def test_new_output_archive_zstd_unavailable(self, temp_dir: Path):
+        """Test that a missing zstd module is reported before any prompt."""
+        archive = temp_dir / "project.tar.zst"
+        code = (
+            "import sys\n"
+            "sys.modules['zstandard'] = sys.modules['compression.zstd'] = None\n"
+            "from projinit.main_cli import main\n"
+            f"sys.argv = ['projinit', 'new', '--output-archive', {str(archive)!r}]\n"
+            "main()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+
+        output = " ".join(result.stdout.split())
+        assert result.returncode == 1
+        assert "Cannot write project.tar.zst" in output
+        assert "Project name" not in output
+        assert not archive.exists()
+
 
 class TestUpdateCommand:
     """Tests for the update command."""
@@ -0,0 +1,217 @@
+"""Performance regression harness and large synthetic fixtures.
+
+Benchmarks are marked `perf` and excluded from the default run:
+
+    pytest -m perf                            # compare to the baselines
+    PROJINIT_PERF_UPDATE=1 pytest -m perf     # record new baselines
+
+Durations are stored in calibration units, multiples of the time of a
+fixed pure-Python workload timed in rounds interleaved with the benchmark,
+so the baselines hold on faster or slower (or busy) machines. A benchmark fails when it is
+slower than its baseline by more than its tolerance (default +100%).
+"""
+
+import json
+import os
+import timeit
+from pathlib import Path
+
+import pytest
+
+from projinit.core import config
+from projinit.core.bench import new_project_renderer
+from projinit.core.models import ProjectType
+from projinit.core.tree import DiskSink
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+UPDATE_ENV = "PROJINIT_PERF_UPDATE"
+
+
+def _calibration_workload() -> None:
+    """Fixed interpreter-bound work (dict, string and sort operations)."""
+    table: dict[str, int] = {}
+    for i in range(20_000):
+        key = f"check_{i % 500}"
+        table[key] = table.get(key, 0) + len(key)
+    sorted(table.items())
+
+
+class PerfHarness:
+    """Times benchmarks and compares them to stored baselines."""
+
+    def __init__(self, baselines: dict, update: bool):
+        self.baselines = baselines
+        self.update = update
+
+    def check(self, name: str, func, number: int = 1, rounds: int = 7) -> float:
+        """
+        Time a function and compare it to its baseline.
+
+        Each round times the calibration workload then the function; the
+        best time of each is kept, so a slow period affects both.
+
+        Args:
+            name: Baseline key.
+            func: Function to time, called without arguments.
+            number: Calls per round.
+            rounds: Number of rounds.
+
+        Returns:
+            Duration of one call in calibration units.
+        """
+        func()  # warm caches and lazy imports
+        calibration_timer = timeit.Timer(_calibration_workload)
+        timer = timeit.Timer(func)
+        calibration = seconds = float("inf")
+        for _ in range(rounds):
+            calibration = min(calibration, calibration_timer.timeit(1))
+            seconds = min(seconds, timer.timeit(number))
+        units = seconds / number / calibration
+
+        benchmarks = self.baselines.setdefault("benchmarks", {})
+        if self.update:
+            benchmarks.setdefault(name, {})["units"] = float(f"{units:.3g}")
+            return units
+        if name not in benchmarks:
+            pytest.fail(f"No baseline for {name}: run `{UPDATE_ENV}=1 pytest -m perf`")
+
+        baseline = benchmarks[name]["units"]
+        tolerance = benchmarks[name].get(
+            "tolerance", self.baselines.get("default_tolerance", 1.0)
+        )
+        if units > baseline * (1 + tolerance):
+            pytest.fail(
+                f"{name}: {seconds / number * 1000:.2f} ms per call, "
+                f"{units:.3g} units for a baseline of {baseline:.3g} "
+                f"(tolerance +{tolerance:.0%})"
+            )
+        return units
+
+
+@pytest.fixture(scope="session")
+def perf_harness():
+    """Session harness; writes the measured baselines in update mode."""
+    baselines = (
+        json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+        if BASELINES_FILE.exists()
+        else {"default_tolerance": 1.0, "benchmarks": {}}
+    )
+    harness = PerfHarness(baselines, update=bool(os.environ.get(UPDATE_ENV)))
+    yield harness
+    if harness.update:
+        baselines["benchmarks"] = dict(sorted(baselines["benchmarks"].items()))
+        BASELINES_FILE.write_text(
+            json.dumps(baselines, indent=2) + "\n", encoding="utf-8"
+        )
+
+
+@pytest.fixture
+def perf(perf_harness: PerfHarness) -> PerfHarness:
+    """Benchmark harness (see PerfHarness.check)."""
+    return perf_harness
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_global_config(tmp_path_factory: pytest.TempPathFactory):
+    """Ignore the user's global configuration during benchmarks."""
+    missing = tmp_path_factory.mktemp("config") / "config.yaml"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config, "GLOBAL_CONFIG_FILE", missing)
+        yield
+
+
+@pytest.fixture(scope="session")
+def large_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A generated Python library with 2,000 modules and 300 dependencies."""
+    tree = new_project_renderer()("large-lib", ProjectType.PYTHON_LIB)
+    pyproject = tree.read("pyproject.toml").decode()
+    dependencies = "".join(f'    "package-{i}>=1.{i}",\n' for i in range(300))
+    tree.write(
+        "pyproject.toml",
+        pyproject.replace("dependencies = []", f"dependencies = [\n{dependencies}]", 1),
+    )
+    for package in range(50):
+        for module in range(40):
+            tree.write(
+                f"src/large_lib/pkg_{package}/mod_{module}.py",
+                f'"""Module {module}."""\n\nVALUE = {module}\n' * 20,
+            )
+        tree.write(f"tests/test_pkg_{package}.py", "def test_ok():\n    pass\n")
+    for page in range(200):
+        tree.write(f"docs/page_{page}.md", f"# Page {page}\n\n" + "text " * 200)
+
+    path = tmp_path_factory.mktemp("repos") / "large-lib"
+    DiskSink(path).write(tree)
+    return path
+
+
+@pytest.fixture(scope="session")
+def large_config_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project whose local config overrides, disables and adds many checks."""
+    local = {
+        "standards": {
+            "check_overrides": {f"extra_check_{i}": "optional" for i in range(200)},
+            "disabled_checks": [f"extra_check_{i}" for i in range(400, 500)],
+            "extra_checks": [
+                {
+                    "id": f"extra_check_{i}",
+                    "description": f"Extra check {i}",
+                    "level": "recommended",
+                    "type": "file_exists",
+                    "path": f"config/file_{i}.yaml",
+                    "alternatives": [f"config/file_{i}.yml"],
+                }
+                for i in range(1000)
+            ],
+            "extra_precommit_hooks": [
+                {
+                    "repo": f"https://example.com/hooks-{i}",
+                    "rev": "v1.0.0",
+                    "hooks": [{"id": f"hook-{i}"}],
+                }
+                for i in range(200)
+            ],
+        }
+    }
+    path = tmp_path_factory.mktemp("configs") / "configured"
+    path.mkdir()
+    (path / config.LOCAL_CONFIG_FILE).write_text(
+        json.dumps(local, indent=2), encoding="utf-8"
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def large_precommit_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A commented .pre-commit-config.yaml with 300 repositories."""
+    blocks = [
+        f"  # Repository {i}\n"
+        f"  - repo: https://example.com/hooks-{i}\n"
+        f"    rev: v{i}.0.0  # pinned\n"
+        f"    hooks:\n"
+        f"      - id: hook-{i}-a\n"
+        f"        args: [--fix]\n"
+        f"      - id: hook-{i}-b\n"
+        for i in range(300)
+    ]
+    path = tmp_path_factory.mktemp("precommit") / ".pre-commit-config.yaml"
+    path.write_text(
+        "# Team configuration\ndefault_stages: [pre-commit]\n\nrepos:\n"
+        + "\n".join(blocks)
+        + "\nci:\n  autofix_prs: true\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def precommit_hooks_to_add() -> list[dict]:
+    """100 repositories to merge: half new, half with one new hook."""
+    return [
+        {
+            "repo": f"https://example.com/hooks-{i}",
+            "rev": "v9.0.0",
+            "hooks": [{"id": f"hook-{i}-new", "args": ["--strict"]}],
+        }
+        for i in range(250, 350)
+    ]
@@ -0,0 +1,115 @@
+"""Performance regression benchmarks for the core engines."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from projinit.core.checker import Checker
+from projinit.core.detector import detect_project_type
+from projinit.core.merger import merge_precommit_config
+from projinit.core.models import CheckStatus, ProjectType
+from projinit.standards.loader import load_standards
+
+pytestmark = pytest.mark.perf
+
+
+class TestCheckerPerf:
+    """Benchmarks for Checker."""
+
+    def test_run_checks_large_repo(self, perf, large_repo: Path):
+        """Test the audit time of a repository of 2,000 modules."""
+        checker = Checker(large_repo, ProjectType.PYTHON_LIB)
+
+        perf.check("checker.run_checks.large_repo", checker.run_checks, number=5)
+
+        report = checker.run_checks()
+        assert report.checks
+        assert all(
+            c.status != CheckStatus.FAILED
+            for c in report.checks
+            if c.id == "has_readme"
+        )
+
+
+class TestDetectorPerf:
+    """Benchmarks for detect_project_type."""
+
+    def test_detect_large_repo(self, perf, large_repo: Path):
+        """Test the detection time of a repository with a large pyproject.toml."""
+        perf.check(
+            "detector.detect_project_type.large_repo",
+            lambda: detect_project_type(large_repo),
+            number=20,
+        )
+
+        assert detect_project_type(large_repo).project_type == ProjectType.PYTHON_LIB
+
+
+class TestLoaderPerf:
+    """Benchmarks for load_standards."""
+
+    def test_load_standards_defaults(self, perf):
+        """Test the loading time of the default standards."""
+        perf.check(
+            "loader.load_standards.defaults",
+            lambda: load_standards(ProjectType.NODE_FRONTEND),
+            number=10,
+        )
+
+    def test_load_standards_large_config(self, perf, large_config_project: Path):
+        """Test loading standards with 1,000 extra checks and overrides."""
+        perf.check(
+            "loader.load_standards.large_config",
+            lambda: load_standards(ProjectType.PYTHON_LIB, large_config_project),
+        )
+
+        standards = load_standards(ProjectType.PYTHON_LIB, large_config_project)
+        ids = {c["id"] for c in standards["checks"]}
+        assert "extra_check_999" in ids
+        assert len(standards["precommit_hooks"]) > 200
+
+
+class TestMergerPerf:
+    """Benchmarks for merge_precommit_config."""
+
+    def test_merge_large_config(
+        self, perf, large_precommit_config: Path, precommit_hooks_to_add: list[dict]
+    ):
+        """Test patching a commented config of 300 repositories."""
+        perf.check(
+            "merger.merge_precommit_config.large_config",
+            lambda: merge_precommit_config(
+                large_precommit_config, precommit_hooks_to_add
+            ),
+        )
+
+        merged = merge_precommit_config(large_precommit_config, precommit_hooks_to_add)
+        assert "# Repository 299" in merged
+        assert len(yaml.safe_load(merged)["repos"]) == 350
+
+    def test_merge_flow_style_config(
+        self,
+        perf,
+        large_precommit_config: Path,
+        precommit_hooks_to_add: list[dict],
+        tmp_path: Path,
+    ):
+        """Test the full-parse fallback on a flow-style config of 300 repositories."""
+        flow = tmp_path / ".pre-commit-config.yaml"
+        document = yaml.safe_load(large_precommit_config.read_text(encoding="utf-8"))
+        flow.write_text(yaml.safe_dump(document, default_flow_style=True))
+
+        perf.check(
+            "merger.merge_precommit_config.flow_style",
+            lambda: merge_precommit_config(flow, precommit_hooks_to_add),
+        )
+
+        assert (
+            len(
+                yaml.safe_load(merge_precommit_config(flow, precommit_hooks_to_add))[
+                    "repos"
+                ]
+            )
+            == 350
+        )
@@ -0,0 +1,127 @@
+"""Tests for projinit.core.backup module."""
+
+from pathlib import Path
+
+from projinit.core.backup import BACKUP_DIR, BackupStore
+from projinit.core.models import ProjectType
+from projinit.core.updater import Updater
+
+
+class TestBackupStore:
+    """Tests for BackupStore class."""
+
+    def test_backup_records_digest(self, temp_dir: Path):
+        """Test that a backup stores the file content under its digest."""
+        target = temp_dir / "config.yaml"
+        target.write_text("key: value\n")
+
+        store = BackupStore(temp_dir)
+        digest = store.backup(target)
+
+        assert digest is not None
+        assert store.read_object(digest) == b"key: value\n"
+
+    def test_backup_missing_file(self, temp_dir: Path):
+        """Test that missing files are not backed up."""
+        store = BackupStore(temp_dir)
+
+        assert store.backup(temp_dir / "missing.txt") is None
+        assert store.commit() is None
+
+    def test_identical_contents_deduplicated(self, temp_dir: Path):
+        """Test that identical contents are stored once."""
+        (temp_dir / "a.txt").write_text("same")
+        (temp_dir / "b.txt").write_text("same")
+
+        store = BackupStore(temp_dir)
+        store.backup(temp_dir / "a.txt")
+        store.backup(temp_dir / "b.txt")
+
+        objects = [p for p in store.objects_dir.rglob("*") if p.is_file()]
+        assert len(objects) == 1
+
+    def test_first_backup_wins_within_run(self, temp_dir: Path):
+        """Test that the pre-run content is kept when a file is backed up twice."""
+        target = temp_dir / "file.txt"
+        target.write_text("original")
+
+        store = BackupStore(temp_dir)
+        first = store.backup(target)
+        target.write_text("modified")
+        second = store.backup(target)
+
+        assert first == second
+        assert store.read_object(first) == b"original"
+
+    def test_uncompressed_objects(self, temp_dir: Path):
+        """Test storing objects without compression."""
+        target = temp_dir / "file.txt"
+        target.write_text("plain")
+
+        store = BackupStore(temp_dir, compress=False)
+        digest = store.backup(target)
+
+        assert (store.objects_dir / digest[:2] / digest[2:]).read_text() == "plain"
+
+    def test_commit_and_restore(self, temp_dir: Path):
+        """Test that a committed run can be restored exactly."""
+        target = temp_dir / "sub" / "file.txt"
+        target.parent.mkdir()
+        target.write_bytes(b"line 1\r\nline 2\n")
+
+        store = BackupStore(temp_dir)
+        store.backup(target)
+        index_path = store.commit()
+        target.write_text("changed")
+
+        assert index_path is not None
+        assert store.list_runs() == [store.run_id]
+        assert store.load_run(store.run_id) == {"sub/file.txt": store._files["sub/file.txt"]}
+
+        restored = BackupStore(temp_dir).restore(store.run_id)
+
+        assert restored == [target]
+        assert target.read_bytes() == b"line 1\r\nline 2\n"
+
+    def test_runs_have_unique_ids(self, temp_dir: Path):
+        """Test that runs started in the same second do not collide."""
+        assert BackupStore(temp_dir).run_id != BackupStore(temp_dir).run_id
+
+    def test_runs_listed_in_creation_order(self, temp_dir: Path):
+        """Test that runs made within the same second are listed oldest first."""
+        (temp_dir / "file.txt").write_text("content")
+        run_ids = []
+        for _ in range(20):
+            store = BackupStore(temp_dir)
+            store.backup(temp_dir / "file.txt")
+            store.commit()
+            run_ids.append(store.run_id)
+
+        assert len({run_id.split(".")[0] for run_id in run_ids}) <= 2
+        assert BackupStore(temp_dir).list_runs() == run_ids
+
+
+class TestUpdaterBackups:
+    """Tests for backups made by the Updater."""
+
+    def test_merge_backs_up_to_store(self, complete_python_project: Path):
+        """Test that merges back up to the store instead of .bak files."""
+        precommit = complete_python_project / ".pre-commit-config.yaml"
+        original = precommit.read_bytes()
+
+        updater = Updater(complete_python_project, ProjectType.PYTHON_CLI)
+        updater._backup_file(precommit)
+        updater.apply_actions([])
+
+        assert not list(complete_python_project.glob("*.bak"))
+        assert (complete_python_project / BACKUP_DIR / "runs").is_dir()
+        files = updater.backup_store.load_run(updater.backup_store.run_id)
+        assert updater.backup_store.read_object(files[".pre-commit-config.yaml"]) == original
+
+    def test_no_backup_disables_store(self, complete_python_project: Path):
+        """Test that create_backup=False disables the store."""
+        updater = Updater(
+            complete_python_project, ProjectType.PYTHON_CLI, create_backup=False
+        )
+
+        assert updater.backup_store is None
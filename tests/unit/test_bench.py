@@ -0,0 +1,90 @@
+"""Tests for projinit.core.bench module."""
+
+import random
+from pathlib import Path
+
+from projinit.core.bench import (
+    PHASES,
+    FleetSpec,
+    PhaseStats,
+    new_project_renderer,
+    percentile,
+    run_benchmark,
+    synthesize,
+)
+from projinit.core.models import ProjectType
+
+
+class TestPercentile:
+    """Tests for percentile and PhaseStats."""
+
+    def test_interpolated(self):
+        """Test that percentiles interpolate between ranks."""
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 50) == 0.0
+
+    def test_phase_stats(self):
+        """Test throughput and percentile keys of a phase."""
+        stats = PhaseStats.from_samples([1_000_000, 3_000_000]).to_dict()
+
+        assert stats["count"] == 2
+        assert stats["total_ms"] == 4.0
+        assert stats["per_second"] == 500.0
+        assert stats["p50_ms"] == 2.0
+
+
+class TestSynthesize:
+    """Tests for synthetic project variants."""
+
+    def test_deterministic(self):
+        """Test that the same seed gives the same project."""
+        render = new_project_renderer()
+        tree = render("demo", ProjectType.NODE_FRONTEND)
+        spec = FleetSpec(max_extra_files=5)
+
+        first = synthesize(tree, ProjectType.NODE_FRONTEND, spec, random.Random(1))
+        second = synthesize(tree, ProjectType.NODE_FRONTEND, spec, random.Random(1))
+
+        assert first.files() == second.files()
+        assert first.size == second.size
+
+    def test_variations(self):
+        """Test missing files, alternative paths and extra files."""
+        tree = new_project_renderer()("demo", ProjectType.NODE_FRONTEND)
+        spec = FleetSpec(missing_rate=0.0, alternative_rate=1.0, max_extra_files=3)
+
+        variant = synthesize(tree, ProjectType.NODE_FRONTEND, spec, random.Random(0))
+        dropped = synthesize(
+            tree,
+            ProjectType.NODE_FRONTEND,
+            FleetSpec(missing_rate=1.0, max_extra_files=0),
+            random.Random(0),
+        )
+
+        assert "vite.config.ts" in tree
+        assert "vite.config.ts" not in variant
+        assert {"vite.config.js", "vite.config.mts"} & {str(p) for p in variant.files()}
+        assert len(variant.files()) >= len(tree.files())
+        assert dropped.files() == []
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark."""
+
+    def test_all_phases_timed(self, temp_dir: Path):
+        """Test that every phase is timed once per project."""
+        spec = FleetSpec(projects_per_type=2, project_types=[ProjectType.PYTHON_CLI])
+
+        benchmark = run_benchmark(temp_dir, spec, new_project_renderer())
+        document = benchmark.to_dict()
+
+        assert document["projects"] == 2
+        assert (temp_dir / "python-cli" / "bench-python-cli-1").is_dir()
+        for phase in PHASES:
+            assert document["phases"][phase]["count"] == 2
+        assert document["by_type"]["python-cli"]["check"]["count"] == 2
+        assert document["spec"]["project_types"] == ["python-cli"]
@@ -6,6 +6,7 @@
 
 from projinit.core.checker import Checker
 from projinit.core.models import CheckLevel, CheckStatus, ProjectType
+from projinit.standards.loader import get_checks_for_type
 
 
 class TestChecker:
@@ -27,6 +28,25 @@ def test_run_checks_returns_audit_report(self, python_cli_project: Path):
         assert report.project_type == ProjectType.PYTHON_CLI
         assert len(report.checks) > 0
 
+    def test_iter_checks_is_lazy(self, python_cli_project: Path):
+        """Test that iter_checks yields results one by one."""
+        checker = Checker(python_cli_project, ProjectType.PYTHON_CLI)
+
+        results = checker.iter_checks()
+        first = next(results)
+
+        assert first.id == checker.run_checks().checks[0].id
+        assert len(list(results)) == len(checker.run_checks().checks) - 1
+
+    def test_preloaded_checks(self, python_cli_project: Path):
+        """Test that only the given check definitions run."""
+        checks = get_checks_for_type(ProjectType.PYTHON_CLI)[:2]
+
+        checker = Checker(python_cli_project, ProjectType.PYTHON_CLI, checks)
+        report = checker.run_checks()
+
+        assert [c.id for c in report.checks] == [c["id"] for c in checks]
+
     def test_execution_time_recorded(self, python_cli_project: Path):
         """Test that execution time is recorded."""
         checker = Checker(python_cli_project, ProjectType.PYTHON_CLI)
@@ -0,0 +1,49 @@
+"""Tests for projinit.checks module."""
+
+from pathlib import Path
+
+import pytest
+
+from projinit import checks
+from projinit.checks import check_pass_secret_exists, pass_secret_exists
+
+
+@pytest.fixture
+def password_store(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a password store holding one secret."""
+    store = temp_dir / "store"
+    (store / "github").mkdir(parents=True)
+    (store / "github" / "terraform-token.gpg").write_bytes(b"encrypted")
+    monkeypatch.setenv("PASSWORD_STORE_DIR", str(store))
+    monkeypatch.setattr(checks, "_secret_cache", {})
+    return store
+
+
+class TestPassSecret:
+    """Tests for pass secret lookup."""
+
+    def test_secret_found_by_path(self, password_store: Path):
+        """Test that an existing secret is found without pass or gpg."""
+        assert pass_secret_exists("github/terraform-token")
+        assert check_pass_secret_exists("github/terraform-token")
+
+    def test_missing_secret(self, password_store: Path):
+        """Test that a missing secret is reported."""
+        assert not pass_secret_exists("github/other")
+        assert not check_pass_secret_exists("github/other")
+
+    def test_result_cached_until_ttl(
+        self, password_store: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that lookups are cached for the TTL duration."""
+        now = [1000.0]
+        monkeypatch.setattr(checks.time, "monotonic", lambda: now[0])
+        (password_store / "github" / "terraform-token.gpg").unlink()
+
+        assert not pass_secret_exists("github/terraform-token", ttl=60)
+        (password_store / "github" / "terraform-token.gpg").write_bytes(b"x")
+        now[0] += 30
+        assert not pass_secret_exists("github/terraform-token", ttl=60)
+
+        now[0] += 31
+        assert pass_secret_exists("github/terraform-token", ttl=60)
@@ -0,0 +1,145 @@
+"""Tests for projinit.core.diff module."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from projinit.core.checker import Checker
+from projinit.core.diff import (
+    ChangeKind,
+    DiffSummary,
+    diff_reports,
+    iter_report_results,
+)
+from projinit.core.models import (
+    AuditReport,
+    CheckLevel,
+    CheckResult,
+    CheckStatus,
+    ProjectType,
+)
+from projinit.core.reporter import NdjsonReporter, Reporter
+
+
+def _write_json(path: Path, project: str, **statuses: CheckStatus) -> Path:
+    """Save a `check -f json` report with one required check per keyword."""
+    report = AuditReport(
+        project_path=Path(project),
+        project_type=ProjectType.PYTHON_CLI,
+        checks=[
+            CheckResult(
+                id=check_id, status=status, message="", level=CheckLevel.REQUIRED
+            )
+            for check_id, status in statuses.items()
+        ],
+    )
+    path.write_text(Reporter(report).to_json(), encoding="utf-8")
+    return path
+
+
+class TestIterReportResults:
+    """Tests for iter_report_results function."""
+
+    def test_json_and_ndjson_agree(self, python_cli_project: Path, temp_dir: Path):
+        """Test that both formats of the same audit yield the same results."""
+        checker = Checker(python_cli_project, ProjectType.PYTHON_CLI)
+        stream = io.StringIO()
+        report = NdjsonReporter(stream).audit(checker)
+        ndjson = temp_dir / "report.ndjson"
+        ndjson.write_text(stream.getvalue(), encoding="utf-8")
+        document = temp_dir / "report.json"
+        document.write_text(Reporter(report).to_json(), encoding="utf-8")
+
+        results = list(iter_report_results(ndjson))
+
+        assert results == list(iter_report_results(document))
+        assert len(results) == len(report.checks)
+
+    def test_escaped_strings(self, temp_dir: Path):
+        """Test records that the fast path cannot match."""
+        path = temp_dir / "report.ndjson"
+        record = {
+            "type": "check",
+            "project": 'C:\\src\\"quoted"',
+            "id": "has_readme",
+            "status": "failed",
+            "level": "required",
+        }
+        path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+        [(project, check_id, _, _)] = iter_report_results(path)
+
+        assert project == 'C:\\src\\"quoted"'
+        assert check_id == "has_readme"
+
+    def test_not_a_report(self, temp_dir: Path):
+        """Test that other JSON documents are rejected."""
+        path = temp_dir / "other.json"
+        path.write_text('{"name": "x"}', encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            list(iter_report_results(path))
+
+
+class TestDiffReports:
+    """Tests for diff_reports function."""
+
+    def test_transitions(self, temp_dir: Path):
+        """Test that only changed, added and removed checks are yielded."""
+        old = _write_json(
+            temp_dir / "old.json",
+            "/a",
+            readme=CheckStatus.PASSED,
+            license=CheckStatus.FAILED,
+            same=CheckStatus.PASSED,
+            gone=CheckStatus.PASSED,
+        )
+        new = _write_json(
+            temp_dir / "new.json",
+            "/a",
+            readme=CheckStatus.FAILED,
+            license=CheckStatus.PASSED,
+            same=CheckStatus.PASSED,
+            tests=CheckStatus.FAILED,
+        )
+
+        transitions = {t.check_id: t for t in diff_reports(old, new)}
+
+        assert set(transitions) == {"readme", "license", "tests", "gone"}
+        assert transitions["readme"].is_regression
+        assert transitions["license"].is_fix
+        assert transitions["tests"].kind == ChangeKind.ADDED
+        assert transitions["gone"].kind == ChangeKind.REMOVED
+        assert transitions["gone"].old == CheckStatus.PASSED
+
+    def test_keyed_by_project(self, temp_dir: Path):
+        """Test that the same check of different projects is not matched."""
+        old = _write_json(temp_dir / "old.json", "/a", readme=CheckStatus.PASSED)
+        new = _write_json(temp_dir / "new.json", "/b", readme=CheckStatus.PASSED)
+
+        kinds = sorted(t.kind.value for t in diff_reports(old, new))
+
+        assert kinds == ["added", "removed"]
+
+    def test_summary(self, temp_dir: Path):
+        """Test transition counts."""
+        old = _write_json(
+            temp_dir / "old.json",
+            "/a",
+            readme=CheckStatus.PASSED,
+            license=CheckStatus.FAILED,
+        )
+        new = _write_json(
+            temp_dir / "new.json",
+            "/a",
+            readme=CheckStatus.WARNING,
+            license=CheckStatus.PASSED,
+        )
+        summary = DiffSummary()
+
+        for transition in diff_reports(old, new):
+            summary.count(transition)
+
+        assert summary == DiffSummary(regressions=1, fixes=1, changed=2)
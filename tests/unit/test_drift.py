@@ -0,0 +1,142 @@
+"""Tests for projinit.core.drift module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from projinit.cli.init_cmd import _build_project_tree, _create_template_env
+from projinit.core.drift import (
+    DriftChecker,
+    DriftStatus,
+    context_hash,
+    infer_context,
+    similarity,
+)
+from projinit.core.models import AuditReport, ProjectType
+from projinit.core.reporter import Reporter
+from projinit.core.tree import DiskSink
+
+
+def _generate(parent: Path, name: str) -> Path:
+    """Generate a Python CLI project the way `projinit new` does."""
+    tree = _build_project_tree(
+        _create_template_env(), name, ProjectType.PYTHON_CLI, "Demo project"
+    )
+    DiskSink(parent / name).write(tree)
+    return parent / name
+
+
+@pytest.fixture
+def generated_project(temp_dir: Path) -> Path:
+    """Create a freshly generated Python CLI project."""
+    return _generate(temp_dir, "demo-cli")
+
+
+def _statuses(report) -> dict[str, DriftStatus]:
+    return {r.path: r.status for r in report.results}
+
+
+class TestInferContext:
+    """Tests for infer_context function."""
+
+    def test_from_pyproject(self, generated_project: Path):
+        """Test that name and description are read from pyproject.toml."""
+        context = infer_context(generated_project, ProjectType.PYTHON_CLI)
+
+        assert context["project_name"] == "demo-cli"
+        assert context["project_name_snake"] == "demo_cli"
+        assert context["description"] == "Demo project"
+        assert context["use_direnv"] is False
+
+    def test_empty_project(self, temp_dir: Path):
+        """Test defaults for a project without metadata files."""
+        context = infer_context(temp_dir, ProjectType.LAB)
+
+        assert context["project_name"] == temp_dir.name
+        assert context["python_version"] == "3.10"
+
+    def test_context_hash_ignores_key_order(self):
+        """Test that equal contexts hash identically."""
+        assert context_hash({"a": 1, "b": 2}) == context_hash({"b": 2, "a": 1})
+
+
+class TestDriftChecker:
+    """Tests for DriftChecker class."""
+
+    def test_fresh_project_matches(self, generated_project: Path):
+        """Test that a just-generated project has no drift."""
+        report = DriftChecker().check(generated_project, ProjectType.PYTHON_CLI)
+
+        assert report.compared
+        assert report.drifted_count == 0
+        assert all(r.similarity == 1.0 for r in report.compared)
+
+    def test_drift_and_missing(self, generated_project: Path):
+        """Test that edited files drift and deleted files are reported."""
+        claude_md = generated_project / "CLAUDE.md"
+        claude_md.write_text(claude_md.read_text() + "\nLocal notes\n")
+        (generated_project / "README.md").unlink()
+
+        report = DriftChecker().check(generated_project, ProjectType.PYTHON_CLI)
+        statuses = _statuses(report)
+
+        assert statuses["CLAUDE.md"] == DriftStatus.DRIFTED
+        assert statuses["README.md"] == DriftStatus.MISSING
+        drifted = next(r for r in report.results if r.path == "CLAUDE.md")
+        assert 0.8 < drifted.similarity < 1.0
+
+    def test_fragment_files_skipped(self, generated_project: Path):
+        """Test that files without a single template are not compared."""
+        report = DriftChecker().check(generated_project, ProjectType.PYTHON_CLI)
+
+        assert _statuses(report)[".gitignore"] == DriftStatus.NO_TEMPLATE
+
+    def test_renders_shared_across_projects(self, temp_dir: Path):
+        """Test that projects with the same context reuse renders."""
+        first = _generate(temp_dir / "a", "demo-cli")
+        second = _generate(temp_dir / "b", "demo-cli")
+        checker = DriftChecker()
+
+        checker.check(first, ProjectType.PYTHON_CLI)
+        renders = checker.render_count
+        report = checker.check(second, ProjectType.PYTHON_CLI)
+
+        assert renders > 0
+        assert checker.render_count == renders
+        assert report.drifted_count == 0
+
+    def test_similarity(self):
+        """Test the line-based similarity score."""
+        assert similarity("a\nb\n", "a\nb\n") == 1.0
+        assert similarity("a\nb\n", "c\nd\n") == 0.0
+
+
+class TestDriftReporting:
+    """Tests for drift output in reports."""
+
+    def test_json_includes_drift(self, generated_project: Path):
+        """Test that the JSON report lists drift results."""
+        drift = DriftChecker().check(generated_project, ProjectType.PYTHON_CLI)
+        report = AuditReport(generated_project, ProjectType.PYTHON_CLI)
+
+        data = json.loads(Reporter(report, drift=drift).to_json())
+
+        readme = next(d for d in data["drift"] if d["path"] == "README.md")
+        assert readme == {
+            "check_id": "has_readme",
+            "path": "README.md",
+            "template": "README.md.j2",
+            "status": "match",
+            "similarity": 1.0,
+        }
+
+    def test_markdown_includes_drift(self, generated_project: Path):
+        """Test that the Markdown report has a drift section."""
+        drift = DriftChecker().check(generated_project, ProjectType.PYTHON_CLI)
+        report = AuditReport(generated_project, ProjectType.PYTHON_CLI)
+
+        markdown = Reporter(report, drift=drift).to_markdown()
+
+        assert "## Template Drift" in markdown
+        assert "| MATCH | `README.md` | `README.md.j2` | 100% |" in markdown
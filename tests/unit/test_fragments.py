@@ -0,0 +1,52 @@
+"""Tests for projinit.core.fragments module."""
+
+import pytest
+
+from projinit.core.fragments import (
+    _assemble,
+    assemble_fragments,
+    clear_fragment_cache,
+    gitignore_content,
+    precommit_content,
+    render_fragment,
+)
+
+
+class TestFragments:
+    """Tests for fragment assembly."""
+
+    def setup_method(self):
+        """Start each test with empty caches."""
+        clear_fragment_cache()
+
+    def test_base_fragment_first(self):
+        """Test that the base fragment starts the assembled output."""
+        content = gitignore_content(["python"])
+
+        assert content.startswith(render_fragment("gitignore", "_common"))
+        assert content.endswith(render_fragment("gitignore", "python"))
+
+    def test_order_independent(self):
+        """Test that technologies are assembled in sorted order."""
+        assert gitignore_content(["terraform", "ansible"]) == gitignore_content(
+            ["ansible", "terraform", "ansible"]
+        )
+
+    def test_same_stack_memoized(self):
+        """Test that the same technology set is assembled only once."""
+        precommit_content(["python", "ide"])
+        precommit_content(["ide", "python"])
+
+        info = _assemble.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_missing_fragment_skipped(self):
+        """Test that technologies without a fragment are skipped."""
+        assert render_fragment("precommit", "ide") is None
+        assert precommit_content(["ide"]) == render_fragment("precommit", "_header")
+
+    def test_unknown_kind(self):
+        """Test that unknown fragment kinds are rejected."""
+        with pytest.raises(ValueError):
+            assemble_fragments("dockerignore", ["python"])
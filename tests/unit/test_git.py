@@ -0,0 +1,127 @@
+"""Tests for projinit.core.git module."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from projinit.core.git import bootstrap_repository
+from projinit.core.tree import DiskSink, VirtualTree
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture(autouse=True)
+def git_env(monkeypatch: pytest.MonkeyPatch):
+    """Provide a git identity independent of the user configuration."""
+    for kind in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{kind}_NAME", "Test User")
+        monkeypatch.setenv(f"GIT_{kind}_EMAIL", "test@example.com")
+
+
+def _git(repo: Path, *args: str) -> str:
+    """Run a git command in repo and return its output."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, check=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def written_tree(temp_dir: Path) -> tuple[Path, VirtualTree]:
+    """Write a small project tree to disk."""
+    tree = VirtualTree()
+    tree.write("README.md", "# demo\n")
+    tree.write("src/demo/__init__.py", "")
+    tree.write("src/demo-cli.py", "print()\n")
+    tree.write("bin/run", "#!/bin/sh\n", mode=0o755)
+    tree.mkdir("empty")
+    tree.write(".gitignore", ".env\nbuild/\n")
+    tree.write(".env", "TOKEN=secret\n")
+    tree.write("build/out.txt", "")
+    logo = temp_dir / "logo.png"
+    logo.write_bytes(bytes(range(256)) * 64)
+    tree.copy("assets/logo.png", logo)
+    target = temp_dir / "demo"
+    DiskSink(target).write(tree)
+    return target, tree
+
+
+class TestBootstrapRepository:
+    """Tests for bootstrap_repository function."""
+
+    def test_commit_matches_git_add(self, written_tree, temp_dir: Path):
+        """Test that the commit tree is the one `git add .` would produce."""
+        target, tree = written_tree
+
+        assert bootstrap_repository(target, tree)
+
+        reference = temp_dir / "reference"
+        shutil.copytree(target, reference, ignore=shutil.ignore_patterns(".git"))
+        _git(reference, "init", "-q")
+        _git(reference, "add", ".")
+        assert _git(target, "rev-parse", "HEAD^{tree}") == _git(reference, "write-tree")
+
+    def test_repository_is_consistent(self, written_tree):
+        """Test that the repository passes fsck and has a clean status."""
+        target, tree = written_tree
+
+        bootstrap_repository(target, tree, message="Scaffold")
+
+        _git(target, "fsck", "--strict")
+        assert _git(target, "status", "--porcelain") == ""
+        assert _git(target, "log", "--format=%an|%s") == "Test User|Scaffold\n"
+        assert _git(target, "branch", "--show-current") == "main\n"
+        assert _git(target, "reflog", "--format=%gs") == "commit (initial): Scaffold\n"
+        assert "100755 blob" in _git(target, "ls-tree", "HEAD", "bin/run")
+
+    def test_ignored_files_left_out(self, written_tree):
+        """Test that files matched by the generated .gitignore are not committed."""
+        target, tree = written_tree
+
+        assert bootstrap_repository(target, tree)
+
+        committed = _git(target, "ls-tree", "-r", "--name-only", "HEAD").split()
+        assert ".gitignore" in committed
+        assert ".env" not in committed
+        assert "build/out.txt" not in committed
+
+    def test_identity_per_repository(
+        self, written_tree, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that each repository gets the identity included for its gitdir."""
+        target, tree = written_tree
+        for kind in ("AUTHOR", "COMMITTER"):
+            monkeypatch.delenv(f"GIT_{kind}_EMAIL")
+        work_config = temp_dir / "work.gitconfig"
+        work_config.write_text("[user]\n\temail = work@example.com\n")
+        global_config = temp_dir / "gitconfig"
+        global_config.write_text(
+            "[user]\n\temail = home@example.com\n"
+            f'[includeIf "gitdir:{target}/"]\n\tpath = {work_config}\n'
+        )
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        other = temp_dir / "other"
+        DiskSink(other).write(tree)
+
+        assert bootstrap_repository(target, tree)
+        assert bootstrap_repository(other, tree)
+
+        assert _git(target, "log", "--format=%ae|%ce") == (
+            "work@example.com|work@example.com\n"
+        )
+        assert _git(other, "log", "--format=%ae|%ce") == (
+            "home@example.com|home@example.com\n"
+        )
+
+    def test_missing_identity(self, written_tree, monkeypatch: pytest.MonkeyPatch):
+        """Test that a missing identity is reported as a failure."""
+        target, tree = written_tree
+
+        def no_identity(*args):
+            raise subprocess.CalledProcessError(128, "git var")
+
+        monkeypatch.setattr("projinit.core.git.git_identity", no_identity)
+
+        assert bootstrap_repository(target, tree) is False
@@ -0,0 +1,123 @@
+"""Tests for projinit.core.history module."""
+
+from pathlib import Path
+
+import pytest
+
+from projinit.cli.history_cmd import parse_since
+from projinit.core.history import HistoryStore
+from projinit.core.models import CheckStatus
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(temp_dir: Path):
+    """Create a history store in a temporary directory."""
+    history = HistoryStore(temp_dir / "history.db")
+    yield history
+    history.close()
+
+
+class TestHistoryStore:
+    """Tests for HistoryStore class."""
+
+    def test_wal_mode(self, store: HistoryStore):
+        """Test that the database uses WAL journaling."""
+        assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_score_history(self, store: HistoryStore, make_report):
+        """Test the score of a project over recorded runs."""
+        store.record(
+            [make_report("/a", readme=CheckStatus.PASSED, license=CheckStatus.FAILED)],
+            recorded_at=1 * DAY,
+        )
+        store.record(
+            [make_report("/a", readme=CheckStatus.PASSED, license=CheckStatus.PASSED)],
+            recorded_at=2 * DAY,
+        )
+
+        points = store.score_history("/a")
+
+        assert [p.score for p in points] == [50.0, 100.0]
+        assert [p.is_compliant for p in points] == [False, True]
+        assert [p.score for p in store.score_history("/a", since=2 * DAY)] == [100.0]
+
+    def test_regressions(self, store: HistoryStore, make_report):
+        """Test that only passed -> failed/warning transitions are reported."""
+        store.record(
+            [
+                make_report(
+                    "/a", readme=CheckStatus.PASSED, license=CheckStatus.FAILED
+                ),
+                make_report("/b", readme=CheckStatus.PASSED),
+            ],
+            recorded_at=1 * DAY,
+        )
+        store.record(
+            [
+                make_report(
+                    "/a", readme=CheckStatus.FAILED, license=CheckStatus.PASSED
+                ),
+                make_report("/b", readme=CheckStatus.PASSED, tests=CheckStatus.FAILED),
+            ],
+            recorded_at=2 * DAY,
+        )
+
+        regressions = store.regressions(since=2 * DAY)
+
+        assert [(r.project, r.check_id) for r in regressions] == [("/a", "readme")]
+        assert regressions[0].previous == CheckStatus.PASSED
+        assert regressions[0].status == CheckStatus.FAILED
+        assert store.regressions(since=2 * DAY, check_id="license") == []
+        assert store.regressions(since=3 * DAY) == []
+
+    def test_worst_projects_use_latest_run(self, store: HistoryStore, make_report):
+        """Test that projects are ranked by their latest score."""
+        store.record(
+            [
+                make_report("/a", readme=CheckStatus.FAILED),
+                make_report("/b", readme=CheckStatus.PASSED),
+            ],
+            recorded_at=1 * DAY,
+        )
+        store.record(
+            [make_report("/a", readme=CheckStatus.PASSED)], recorded_at=2 * DAY
+        )
+        store.record(
+            [make_report("/c", readme=CheckStatus.PASSED, license=CheckStatus.FAILED)],
+            recorded_at=3 * DAY,
+        )
+
+        worst = store.worst_projects(limit=2)
+
+        assert [(p.project, p.score) for p in worst] == [("/c", 50.0), ("/a", 100.0)]
+
+    def test_reopen(self, temp_dir: Path, make_report):
+        """Test that runs persist across connections."""
+        db = temp_dir / "history.db"
+        first = HistoryStore(db)
+        first.record([make_report("/a", readme=CheckStatus.PASSED)], recorded_at=DAY)
+        first.close()
+
+        second = HistoryStore(db)
+        try:
+            assert len(second.score_history("/a")) == 1
+        finally:
+            second.close()
+
+
+class TestParseSince:
+    """Tests for parse_since function."""
+
+    def test_durations(self):
+        """Test relative durations."""
+        now = 100 * DAY
+        assert parse_since("7d", now) == 93 * DAY
+        assert parse_since("2w", now) == 86 * DAY
+        assert parse_since("12h", now) == now - DAY / 2
+
+    def test_invalid(self):
+        """Test that unknown values are rejected."""
+        with pytest.raises(ValueError):
+            parse_since("last week")
@@ -228,6 +228,15 @@ def test_precommit_hooks_concatenated(self):
 
         assert len(result["precommit_hooks"]) == 2
 
+    def test_precommit_hooks_merged_by_repo(self):
+        """Test that precommit_hooks without ids are deduplicated by repo."""
+        base = {"precommit_hooks": [{"repo": "a", "rev": "v1"}]}
+        overlay = {"precommit_hooks": [{"repo": "a", "rev": "v2"}, {"repo": "b"}]}
+
+        result = _merge_standards(base, overlay)
+
+        assert result["precommit_hooks"] == [{"repo": "a", "rev": "v1"}, {"repo": "b"}]
+
     def test_base_not_modified(self):
         """Test that original base dict is not modified."""
         base = {"checks": [{"id": "check1"}]}
@@ -0,0 +1,144 @@
+"""Tests for batch project creation from a manifest."""
+
+import argparse
+from pathlib import Path
+
+from projinit.cli.init_cmd import load_manifest, run_manifest
+from projinit.core.models import ProjectType
+
+
+def _write_manifest(temp_dir: Path, content: str) -> Path:
+    """Write a manifest file in temp_dir."""
+    path = temp_dir / "projects.yaml"
+    path.write_text(content)
+    return path
+
+
+class TestLoadManifest:
+    """Tests for load_manifest function."""
+
+    def test_defaults_and_shorthand_entries(self, temp_dir: Path):
+        """Test that defaults apply to entries given by name only."""
+        manifest = _write_manifest(
+            temp_dir,
+            "defaults:\n"
+            "  type: python-lib\n"
+            "projects:\n"
+            "  - lib-a\n"
+            "  - name: cli-b\n"
+            "    type: python-cli\n"
+            "    description: A CLI\n"
+            "    path: services\n",
+        )
+
+        specs, errors = load_manifest(manifest, temp_dir)
+
+        assert errors == []
+        assert [s.project_type for s in specs] == [
+            ProjectType.PYTHON_LIB,
+            ProjectType.PYTHON_CLI,
+        ]
+        assert specs[0].description == "Project lib-a"
+        assert specs[1].target_dir == (temp_dir / "services" / "cli-b").resolve()
+
+    def test_all_errors_reported(self, temp_dir: Path):
+        """Test that every invalid entry is reported up front."""
+        (temp_dir / "existing").mkdir()
+        manifest = _write_manifest(
+            temp_dir,
+            "- name: Bad_Name\n"
+            "  type: python-cli\n"
+            "- name: no-type\n"
+            "- name: dup\n"
+            "  type: lab\n"
+            "- name: dup\n"
+            "  type: lab\n"
+            "- name: existing\n"
+            "  type: lab\n",
+        )
+
+        specs, errors = load_manifest(manifest, temp_dir)
+
+        assert len(errors) == 4
+        assert [s.name for s in specs] == ["dup"]
+
+    def test_non_string_fields_reported(self, temp_dir: Path):
+        """Test that a non-string path or description is an entry error."""
+        manifest = _write_manifest(
+            temp_dir,
+            "defaults:\n"
+            "  type: lab\n"
+            "projects:\n"
+            "  - name: bad-path\n"
+            "    path: 3\n"
+            "  - name: bad-description\n"
+            "    description: [a, b]\n"
+            "  - good\n",
+        )
+
+        specs, errors = load_manifest(manifest, temp_dir)
+
+        assert errors == [
+            "Entry 1 (bad-path): path must be a string: 3",
+            "Entry 2 (bad-description): description must be a string: ['a', 'b']",
+        ]
+        assert [s.name for s in specs] == ["good"]
+
+    def test_default_type_from_cli(self, temp_dir: Path):
+        """Test that the --type value is used when the manifest has none."""
+        manifest = _write_manifest(temp_dir, "- docs-a\n")
+
+        specs, errors = load_manifest(manifest, temp_dir, default_type="documentation")
+
+        assert errors == []
+        assert specs[0].project_type == ProjectType.DOCUMENTATION
+
+    def test_empty_manifest(self, temp_dir: Path):
+        """Test that an empty manifest is rejected."""
+        manifest = _write_manifest(temp_dir, "projects: []\n")
+
+        specs, errors = load_manifest(manifest, temp_dir)
+
+        assert specs == []
+        assert errors
+
+
+class TestRunManifest:
+    """Tests for run_manifest function."""
+
+    def test_projects_created_in_parallel(self, temp_dir: Path):
+        """Test that all manifest projects are generated."""
+        manifest = _write_manifest(
+            temp_dir, "defaults:\n  type: python-lib\nprojects: [lib-a, lib-b, lib-c]\n"
+        )
+        args = argparse.Namespace(
+            manifest=str(manifest),
+            path=str(temp_dir),
+            type=None,
+            direnv=None,
+            no_direnv=False,
+            no_git=True,
+            yes=True,
+            jobs=3,
+        )
+
+        assert run_manifest(args) == 0
+        for name in ("lib-a", "lib-b", "lib-c"):
+            assert (temp_dir / name / "pyproject.toml").exists()
+
+    def test_invalid_manifest_creates_nothing(self, temp_dir: Path):
+        """Test that validation errors abort before any project is created."""
+        manifest = _write_manifest(temp_dir, "- name: ok-one\n  type: lab\n- BAD\n")
+        args = argparse.Namespace(
+            manifest=str(manifest),
+            path=str(temp_dir),
+            type=None,
+            direnv=None,
+            no_direnv=False,
+            no_git=True,
+            yes=True,
+            jobs=2,
+        )
+
+        assert run_manifest(args) == 1
+        assert not (temp_dir / "ok-one").exists()
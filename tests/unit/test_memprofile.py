@@ -0,0 +1,88 @@
+"""Tests for projinit.core.memprofile module."""
+
+import tracemalloc
+
+from projinit.core.memprofile import MemoryProfiler, NullProfiler
+
+
+def _allocate(count: int) -> list[bytes]:
+    return [bytes(1000) for _ in range(count)]
+
+
+class TestMemoryProfiler:
+    """Tests for MemoryProfiler."""
+
+    def test_phases_and_sites(self):
+        """Test retained memory, peaks and allocation sites per phase."""
+        profiler = MemoryProfiler()
+        profiler.start()
+        kept = []
+        with profiler.repo("/fleet/a"):
+            kept.append(_allocate(100))
+            profiler.phase("load")
+            _allocate(500)
+            profiler.phase("check")
+        profile = profiler.stop()
+
+        load, check = profile["phases"]["load"], profile["phases"]["check"]
+        assert load["retained_bytes"] >= 100_000
+        assert abs(check["retained_bytes"]) < 100_000
+        assert check["peak_bytes"] >= 500_000
+        assert load["top_sites"][0]["site"].endswith(f"test_memprofile.py:{_line()}")
+        assert load["top_sites"][0]["count"] >= 100
+        repo = profile["repos"][0]
+        assert repo["repo"] == "/fleet/a"
+        assert list(repo["phases"]) == ["load", "check"]
+        assert profile["peak_bytes"] == repo["peak_bytes"] >= 500_000
+        assert not tracemalloc.is_tracing()
+
+    def test_repos_profiled_separately(self):
+        """Test that each project gets its own phases and peak."""
+        profiler = MemoryProfiler()
+        profiler.start()
+        for path, count in (("/fleet/a", 1000), ("/fleet/b", 10)):
+            with profiler.repo(path):
+                _allocate(count)
+                profiler.phase("check")
+        profile = profiler.stop()
+
+        a, b = profile["repos"]
+        assert a["peak_bytes"] > b["peak_bytes"] + 500_000
+        assert profile["phases"]["check"]["peak_bytes"] == a["peak_bytes"]
+
+    def test_phase_outside_repo_ignored(self):
+        """Test that phases outside of a project are not recorded."""
+        profiler = MemoryProfiler()
+        profiler.start()
+        profiler.phase("detection")
+
+        assert profiler.stop()["phases"] == {}
+
+    def test_existing_tracing_kept(self):
+        """Test that tracing started by someone else is left running."""
+        tracemalloc.start()
+        try:
+            profiler = MemoryProfiler()
+            profiler.start()
+            profiler.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+
+class TestNullProfiler:
+    """Tests for NullProfiler."""
+
+    def test_records_nothing(self):
+        """Test that the null profiler runs blocks without tracing."""
+        profiler = NullProfiler()
+
+        with profiler.repo("/fleet/a"):
+            profiler.phase("check")
+
+        assert not tracemalloc.is_tracing()
+
+
+def _line() -> int:
+    """Line of the allocation in _allocate."""
+    return _allocate.__code__.co_firstlineno + 1
@@ -0,0 +1,347 @@
+"""Tests for projinit.core.merger module."""
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from projinit.core.merger import (
+    deep_merge,
+    merge_lists,
+    merge_precommit_config,
+    merge_toml_section,
+    merge_yaml,
+)
+
+RUFF_HOOKS = {
+    "repo": "https://github.com/astral-sh/ruff-pre-commit",
+    "rev": "v0.8.3",
+    "hooks": [{"id": "ruff", "args": ["--fix"]}, {"id": "ruff-format"}],
+}
+
+MYPY_HOOKS = {
+    "repo": "https://github.com/pre-commit/mirrors-mypy",
+    "rev": "v1.13.0",
+    "hooks": [{"id": "mypy"}],
+}
+
+COMMENTED_CONFIG = """# Team pre-commit configuration
+default_stages: [pre-commit]
+
+repos:
+  # Basic hygiene
+  - repo: https://github.com/pre-commit/pre-commit-hooks
+    rev: v5.0.0  # pinned
+    hooks:
+      - id: trailing-whitespace
+      - id: end-of-file-fixer
+
+  - repo: https://github.com/astral-sh/ruff-pre-commit
+    rev: "v0.4.4"
+    hooks:
+      - id: ruff  # lint
+        args: [--fix]
+
+# CI settings
+ci:
+  autofix_prs: true
+"""
+
+
+@pytest.fixture
+def precommit_file(temp_dir: Path) -> Path:
+    """Create a commented .pre-commit-config.yaml."""
+    path = temp_dir / ".pre-commit-config.yaml"
+    path.write_text(COMMENTED_CONFIG)
+    return path
+
+
+class TestMergeYaml:
+    """Tests for merge_yaml function."""
+
+    def test_missing_keys_added(self):
+        """Test that missing keys are added from the template."""
+        result = merge_yaml({"a": 1}, {"b": 2})
+
+        assert result == {"a": 1, "b": 2}
+
+    def test_existing_values_kept(self):
+        """Test that existing values are not overwritten."""
+        result = merge_yaml({"a": 1}, {"a": 2})
+
+        assert result["a"] == 1
+
+    def test_lists_merged_by_key(self):
+        """Test that list items are deduplicated by key fields."""
+        existing = {"items": [{"id": "x", "v": 1}]}
+        template = {"items": [{"id": "x", "v": 2}, {"id": "y"}]}
+
+        result = merge_yaml(existing, template)
+
+        assert result["items"] == [{"id": "x", "v": 1}, {"id": "y"}]
+
+
+class TestMergeEngine:
+    """Tests for deep_merge and merge_lists functions."""
+
+    def test_key_field_priority(self):
+        """Test that items are matched on the first key field they define."""
+        existing = [{"id": "a", "name": "first"}, {"repo": "r"}]
+        template = [{"id": "a", "name": "other"}, {"name": "first"}, {"repo": "r"}]
+
+        assert merge_lists(existing, template) == existing
+
+    def test_custom_key_fields(self):
+        """Test merging with configurable key fields."""
+        existing = [{"url": "x", "v": 1}]
+        template = [{"url": "x", "v": 2}, {"url": "y"}]
+
+        result = merge_lists(existing, template, key_fields=("url",))
+
+        assert result == [{"url": "x", "v": 1}, {"url": "y"}]
+
+    def test_replace_matching_items(self):
+        """Test that replace=True swaps matching items in place."""
+        existing = [{"id": "a", "v": 1}, {"id": "b"}]
+
+        result = merge_lists(existing, [{"id": "a", "v": 2}], replace=True)
+
+        assert result == [{"id": "a", "v": 2}, {"id": "b"}]
+
+    def test_unkeyed_items_matched_by_value(self):
+        """Test deduplication of primitives and unkeyed mappings."""
+        existing = ["x", {"k": [1, 2]}]
+        template = ["x", "y", {"k": [1, 2]}, {"k": [2, 1]}]
+
+        result = merge_lists(existing, template)
+
+        assert result == ["x", {"k": [1, 2]}, "y", {"k": [2, 1]}]
+
+    def test_template_duplicates_collapsed(self):
+        """Test that duplicates within the template are added once."""
+        assert merge_lists([], [{"id": "a"}, {"id": "a"}]) == [{"id": "a"}]
+
+    def test_deep_merge_overwrite(self):
+        """Test scalar conflict resolution with overwrite."""
+        base = {"a": 1, "nested": {"b": 1, "c": 1}}
+        overlay = {"a": 2, "nested": {"b": 2, "d": 2}}
+
+        assert deep_merge(base, overlay) == {"a": 1, "nested": {"b": 1, "c": 1, "d": 2}}
+        assert deep_merge(base, overlay, overwrite=True) == {
+            "a": 2,
+            "nested": {"b": 2, "c": 1, "d": 2},
+        }
+
+    def test_inputs_not_modified(self):
+        """Test that neither input is modified."""
+        base = {"items": [{"id": "a"}], "nested": {"x": 1}}
+        overlay = {"items": [{"id": "b"}], "nested": {"y": 2}}
+
+        deep_merge(base, overlay)
+
+        assert base == {"items": [{"id": "a"}], "nested": {"x": 1}}
+        assert overlay == {"items": [{"id": "b"}], "nested": {"y": 2}}
+
+    def test_merge_10k_entries_is_linear(self):
+        """Test that merging org configs of 10k entries takes milliseconds."""
+        existing = {"checks": [{"id": f"check_{i}"} for i in range(10_000)]}
+        template = {"checks": [{"id": f"check_{i}"} for i in range(5_000, 15_000)]}
+
+        start = time.perf_counter()
+        result = deep_merge(existing, template)
+        elapsed = time.perf_counter() - start
+
+        assert len(result["checks"]) == 15_000
+        assert elapsed < 0.5
+
+
+class TestMergePrecommitConfig:
+    """Tests for merge_precommit_config function."""
+
+    def test_comments_preserved(self, precommit_file: Path):
+        """Test that comments and formatting survive the merge."""
+        result = merge_precommit_config(precommit_file, [MYPY_HOOKS])
+
+        assert result.startswith(COMMENTED_CONFIG.split("# CI settings")[0].rstrip())
+        assert "# Basic hygiene" in result
+        assert "rev: v5.0.0  # pinned" in result
+        assert "- id: ruff  # lint" in result
+        assert result.endswith("# CI settings\nci:\n  autofix_prs: true\n")
+
+    def test_new_repo_appended_to_sequence(self, precommit_file: Path):
+        """Test that a missing repo is added at the end of repos."""
+        result = merge_precommit_config(precommit_file, [MYPY_HOOKS])
+        parsed = yaml.safe_load(result)
+
+        assert parsed["repos"][-1] == MYPY_HOOKS
+        assert parsed["ci"] == {"autofix_prs": True}
+        assert "\n\n  - repo: https://github.com/pre-commit/mirrors-mypy\n" in result
+
+    def test_missing_hook_inserted_in_existing_repo(self, precommit_file: Path):
+        """Test that only the missing hook is added to an existing repo."""
+        result = merge_precommit_config(precommit_file, [RUFF_HOOKS])
+        parsed = yaml.safe_load(result)
+
+        ruff = parsed["repos"][1]
+        assert [h["id"] for h in ruff["hooks"]] == ["ruff", "ruff-format"]
+        assert ruff["hooks"][0]["args"] == ["--fix"]
+        assert len(parsed["repos"]) == 2
+
+    def test_rev_updated_keeping_quotes(self, precommit_file: Path):
+        """Test that rev is updated in place with its original quoting."""
+        result = merge_precommit_config(precommit_file, [RUFF_HOOKS])
+
+        assert 'rev: "v0.8.3"' in result
+        assert "v0.4.4" not in result
+
+    def test_unchanged_when_nothing_missing(self, precommit_file: Path):
+        """Test that the content is returned untouched when up to date."""
+        hooks = [
+            {
+                "repo": "https://github.com/pre-commit/pre-commit-hooks",
+                "rev": "v5.0.0",
+                "hooks": [{"id": "trailing-whitespace"}],
+            }
+        ]
+
+        assert merge_precommit_config(precommit_file, hooks) == COMMENTED_CONFIG
+
+    def test_indentless_sequences(self, temp_dir: Path):
+        """Test patching a config written with indentless sequences."""
+        path = temp_dir / ".pre-commit-config.yaml"
+        path.write_text("repos:\n- repo: a\n  rev: '1'\n  hooks:\n  - id: x\n")
+
+        result = merge_precommit_config(
+            path, [{"repo": "a", "rev": "1", "hooks": [{"id": "y"}]}]
+        )
+
+        assert result == "repos:\n- repo: a\n  rev: '1'\n  hooks:\n  - id: x\n  - id: y\n"
+
+    def test_flow_style_falls_back(self, temp_dir: Path):
+        """Test that flow-style repos fall back to a full merge."""
+        path = temp_dir / ".pre-commit-config.yaml"
+        path.write_text("repos: []\n")
+
+        parsed = yaml.safe_load(merge_precommit_config(path, [MYPY_HOOKS]))
+
+        assert parsed["repos"] == [MYPY_HOOKS]
+
+    def test_flow_document_falls_back(self, temp_dir: Path):
+        """Test that a flow-style document without repos falls back to a full merge."""
+        path = temp_dir / ".pre-commit-config.yaml"
+        path.write_text("{fail_fast: true}\n")
+
+        parsed = yaml.safe_load(merge_precommit_config(path, [MYPY_HOOKS]))
+
+        assert parsed == {"fail_fast": True, "repos": [MYPY_HOOKS]}
+
+    def test_non_mapping_document_falls_back(self, temp_dir: Path):
+        """Test that a top-level block sequence is not patched with a repos key."""
+        path = temp_dir / ".pre-commit-config.yaml"
+        path.write_text("- fail_fast\n- default_stages\n")
+
+        parsed = yaml.safe_load(merge_precommit_config(path, [MYPY_HOOKS]))
+
+        assert parsed == {"repos": [MYPY_HOOKS]}
+
+    def test_missing_file(self, temp_dir: Path):
+        """Test merging into a file that does not exist."""
+        result = merge_precommit_config(temp_dir / "missing.yaml", [MYPY_HOOKS])
+
+        assert yaml.safe_load(result) == {"repos": [MYPY_HOOKS]}
+
+    def test_file_without_repos_key(self, temp_dir: Path):
+        """Test that a repos key is added when absent."""
+        path = temp_dir / ".pre-commit-config.yaml"
+        path.write_text("# empty config\nfail_fast: true\n")
+
+        result = merge_precommit_config(path, [MYPY_HOOKS])
+
+        assert result.startswith("# empty config\nfail_fast: true\nrepos:\n")
+        assert yaml.safe_load(result)["repos"] == [MYPY_HOOKS]
+
+
+class TestMergeTomlSection:
+    """Tests for merge_toml_section function."""
+
+    def test_section_appended(self):
+        """Test that a missing section is appended."""
+        result = merge_toml_section('[project]\nname = "x"\n', "[tool.ruff]", {"line-length": 100})
+
+        assert result.endswith("[tool.ruff]\nline-length = 100\n")
+
+    def test_existing_section_untouched(self):
+        """Test that an existing section is not duplicated."""
+        content = "[tool.ruff]\nline-length = 88\n"
+
+        assert merge_toml_section(content, "[tool.ruff]", {"line-length": 100}) == content
+
+    def test_missing_keys_spliced_into_existing_table(self):
+        """Test that only missing keys are added inside the existing table."""
+        content = (
+            "[tool.ruff]\n"
+            "line-length = 88  # keep\n"
+            "# lint settings below\n"
+            "\n"
+            "[tool.ruff.lint]\n"
+            'select = ["E"]\n'
+        )
+
+        result = merge_toml_section(
+            content, "[tool.ruff]", {"line-length": 100, "target-version": "py310"}
+        )
+
+        assert result == (
+            "[tool.ruff]\n"
+            "line-length = 88  # keep\n"
+            'target-version = "py310"\n'
+            "# lint settings below\n"
+            "\n"
+            "[tool.ruff.lint]\n"
+            'select = ["E"]\n'
+        )
+
+    def test_crlf_table_extended(self):
+        """Test that tables of a CRLF document are found and keep CRLF endings."""
+        content = '[project]\r\nname = "x"\r\n\r\n[tool.ruff]  # lint\r\nline-length = 88\r\n'
+
+        result = merge_toml_section(content, "[tool.ruff]", {"fix": True})
+
+        assert result == content + "fix = true\r\n"
+
+    def test_section_in_comment_not_detected(self):
+        """Test that a section name inside a comment is not taken as the table."""
+        content = '[project]\nname = "x"\n# TODO: add [tool.ruff]\n'
+
+        result = merge_toml_section(content, "[tool.ruff]", {"line-length": 100})
+
+        assert result.endswith("\n[tool.ruff]\nline-length = 100\n")
+
+    def test_multiline_array_not_taken_as_header(self):
+        """Test that nested arrays inside a value are not read as headers."""
+        content = '[tool.ruff]\nselect = [\n    ["E"]\n]\n'
+
+        result = merge_toml_section(content, "[tool.ruff]", {"fix": True})
+
+        assert result == '[tool.ruff]\nselect = [\n    ["E"]\n]\nfix = true\n'
+
+    def test_values_formatted_as_toml(self):
+        """Test formatting of booleans, lists and inline tables."""
+        result = merge_toml_section(
+            "", "[tool.x]", {"flag": False, "items": [1, "a"], "opts": {"k": "v"}}
+        )
+
+        assert result == '[tool.x]\nflag = false\nitems = [1, "a"]\nopts = {k = "v"}\n'
+
+    def test_invalid_toml_untouched(self):
+        """Test that invalid TOML is returned unchanged."""
+        content = "[project\nname = \n"
+
+        assert merge_toml_section(content, "[tool.ruff]", {"line-length": 100}) == content
+
+    def test_dotted_key_table_untouched(self):
+        """Test that tables defined by dotted keys are not given a header."""
+        content = "[tool]\nruff.line-length = 88\n"
+
+        assert merge_toml_section(content, "[tool.ruff]", {"fix": True}) == content
@@ -0,0 +1,94 @@
+"""Tests for projinit.core.metrics module."""
+
+from pathlib import Path
+
+from projinit.core.metrics import METRICS, MetricsFile, escape_label, report_samples
+from projinit.core.models import CheckStatus
+
+
+class TestReportSamples:
+    """Tests for report_samples."""
+
+    def test_samples(self, make_report):
+        """Test the gauges of one project."""
+        samples = report_samples(
+            make_report(
+                "/fleet/a",
+                execution_time_ms=250.0,
+                readme=CheckStatus.PASSED,
+                license=CheckStatus.FAILED,
+            ),
+            1_700_000_000.0,
+        )
+
+        project = 'repo="/fleet/a",project_type="python-cli"'
+        assert list(samples) == list(METRICS)
+        assert samples["projinit_score_ratio"] == [
+            f"projinit_score_ratio{{{project}}} 0.5"
+        ]
+        assert samples["projinit_compliant"] == [f"projinit_compliant{{{project}}} 0"]
+        assert (
+            f'projinit_failed_checks{{{project},level="required"}} 1'
+            in samples["projinit_failed_checks"]
+        )
+        assert (
+            f'projinit_failed_checks{{{project},level="optional"}} 0'
+            in samples["projinit_failed_checks"]
+        )
+        level = 'level="required"'
+        assert samples["projinit_check_status"] == [
+            f'projinit_check_status{{{project},check="readme",{level},status="passed"}} 1',
+            f'projinit_check_status{{{project},check="license",{level},status="failed"}} 1',
+        ]
+        assert samples["projinit_audit_duration_seconds"] == [
+            f"projinit_audit_duration_seconds{{{project}}} 0.250000"
+        ]
+        assert samples["projinit_audit_timestamp_seconds"] == [
+            f"projinit_audit_timestamp_seconds{{{project}}} 1700000000.000"
+        ]
+
+    def test_escape_label(self):
+        """Test escaping of backslashes, quotes and line feeds."""
+        assert escape_label('C:\\repo "x"\nnext') == 'C:\\\\repo \\"x\\"\\nnext'
+
+
+class TestMetricsFile:
+    """Tests for MetricsFile."""
+
+    def test_render_groups_families(self, tmp_path: Path, make_report):
+        """Test that samples are grouped under one HELP and TYPE per family."""
+        metrics = MetricsFile(tmp_path / "projinit.prom", interval=3600)
+        metrics.add(make_report("/fleet/a", readme=CheckStatus.PASSED))
+        metrics.add(make_report("/fleet/b", readme=CheckStatus.FAILED))
+
+        lines = metrics.render().splitlines()
+        start = lines.index("# TYPE projinit_score_ratio gauge")
+        assert lines[start - 1].startswith("# HELP projinit_score_ratio ")
+        assert lines[start + 1].startswith('projinit_score_ratio{repo="/fleet/a"')
+        assert lines[start + 2].startswith('projinit_score_ratio{repo="/fleet/b"')
+        assert sum(line.startswith("# TYPE") for line in lines) == len(METRICS)
+
+    def test_write_throttled(self, tmp_path: Path, make_report):
+        """Test that the file is rewritten at most once per interval."""
+        path = tmp_path / "projinit.prom"
+        metrics = MetricsFile(path, interval=3600)
+        metrics.add(make_report("/fleet/a", readme=CheckStatus.PASSED))
+        assert "/fleet/a" in path.read_text()
+
+        metrics.add(make_report("/fleet/b", readme=CheckStatus.PASSED))
+        assert "/fleet/b" not in path.read_text()
+
+        metrics.write()
+        assert "/fleet/b" in path.read_text()
+        assert [p.name for p in tmp_path.iterdir()] == ["projinit.prom"]
+
+    def test_reaudit_replaces_project(self, tmp_path: Path, make_report):
+        """Test that a project audited again replaces its previous samples."""
+        metrics = MetricsFile(tmp_path / "projinit.prom", interval=0)
+        metrics.add(make_report("/fleet/a", readme=CheckStatus.FAILED))
+        metrics.add(make_report("/fleet/a", readme=CheckStatus.PASSED))
+
+        text = (tmp_path / "projinit.prom").read_text()
+        assert text.count("projinit_score_ratio{") == 1
+        assert 'status="passed"' in text
+        assert 'status="failed"' not in text
@@ -35,7 +35,10 @@ def test_display_name_property(self):
         assert ProjectType.PYTHON_CLI.display_name == "Python CLI Application"
         assert ProjectType.PYTHON_LIB.display_name == "Python Library"
         assert ProjectType.NODE_FRONTEND.display_name == "Node.js Frontend"
-        assert ProjectType.INFRASTRUCTURE.display_name == "Infrastructure (Terraform/Ansible)"
+        assert (
+            ProjectType.INFRASTRUCTURE.display_name
+            == "Infrastructure (Terraform/Ansible)"
+        )
         assert ProjectType.DOCUMENTATION.display_name == "Documentation (MkDocs)"
         assert ProjectType.LAB.display_name == "Lab/Tutorial"
         assert ProjectType.UNKNOWN.display_name == "Unknown"
@@ -128,6 +131,12 @@ def test_with_suggestion(self):
         )
         assert result.suggestion == "Run: pip install package"
 
+    def test_non_string_id_and_message(self):
+        """Test that a numeric id or a missing message is accepted as is."""
+        result = CheckResult(id=42, status=CheckStatus.PASSED, message=None)
+        assert result.id == 42
+        assert result.message is None
+
 
 class TestDetectionResult:
     """Tests for DetectionResult dataclass."""
@@ -161,7 +170,9 @@ def test_is_confident_low(self):
 
     def test_is_confident_threshold(self):
         """Test is_confident at threshold (0.7)."""
-        at_threshold = DetectionResult(project_type=ProjectType.PYTHON_CLI, confidence=0.7)
+        at_threshold = DetectionResult(
+            project_type=ProjectType.PYTHON_CLI, confidence=0.7
+        )
         below = DetectionResult(project_type=ProjectType.PYTHON_CLI, confidence=0.69)
 
         assert at_threshold.is_confident is True
@@ -211,11 +222,36 @@ class TestAuditReport:
     def sample_checks(self) -> list[CheckResult]:
         """Create a sample list of check results."""
         return [
-            CheckResult(id="c1", status=CheckStatus.PASSED, message="ok", level=CheckLevel.REQUIRED),
-            CheckResult(id="c2", status=CheckStatus.PASSED, message="ok", level=CheckLevel.REQUIRED),
-            CheckResult(id="c3", status=CheckStatus.FAILED, message="fail", level=CheckLevel.REQUIRED),
-            CheckResult(id="c4", status=CheckStatus.WARNING, message="warn", level=CheckLevel.RECOMMENDED),
-            CheckResult(id="c5", status=CheckStatus.SKIPPED, message="skip", level=CheckLevel.OPTIONAL),
+            CheckResult(
+                id="c1",
+                status=CheckStatus.PASSED,
+                message="ok",
+                level=CheckLevel.REQUIRED,
+            ),
+            CheckResult(
+                id="c2",
+                status=CheckStatus.PASSED,
+                message="ok",
+                level=CheckLevel.REQUIRED,
+            ),
+            CheckResult(
+                id="c3",
+                status=CheckStatus.FAILED,
+                message="fail",
+                level=CheckLevel.REQUIRED,
+            ),
+            CheckResult(
+                id="c4",
+                status=CheckStatus.WARNING,
+                message="warn",
+                level=CheckLevel.RECOMMENDED,
+            ),
+            CheckResult(
+                id="c5",
+                status=CheckStatus.SKIPPED,
+                message="skip",
+                level=CheckLevel.OPTIONAL,
+            ),
         ]
 
     def test_basic_creation(self, sample_checks):
@@ -287,8 +323,18 @@ def test_score_empty_report(self):
     def test_is_compliant_true(self):
         """Test is_compliant when all required checks pass."""
         checks = [
-            CheckResult(id="c1", status=CheckStatus.PASSED, message="ok", level=CheckLevel.REQUIRED),
-            CheckResult(id="c2", status=CheckStatus.FAILED, message="fail", level=CheckLevel.RECOMMENDED),
+            CheckResult(
+                id="c1",
+                status=CheckStatus.PASSED,
+                message="ok",
+                level=CheckLevel.REQUIRED,
+            ),
+            CheckResult(
+                id="c2",
+                status=CheckStatus.FAILED,
+                message="fail",
+                level=CheckLevel.RECOMMENDED,
+            ),
         ]
         report = AuditReport(
             project_path=Path("/tmp"),
@@ -300,7 +346,12 @@ def test_is_compliant_true(self):
     def test_is_compliant_false(self):
         """Test is_compliant when a required check fails."""
         checks = [
-            CheckResult(id="c1", status=CheckStatus.FAILED, message="fail", level=CheckLevel.REQUIRED),
+            CheckResult(
+                id="c1",
+                status=CheckStatus.FAILED,
+                message="fail",
+                level=CheckLevel.REQUIRED,
+            ),
         ]
         report = AuditReport(
             project_path=Path("/tmp"),
@@ -359,3 +410,38 @@ def test_actionable_suggestions(self):
 
         assert len(suggestions) == 1
         assert suggestions[0] == ("c1", "Run: fix command")
+
+    def test_counts_follow_appended_checks(self, sample_checks):
+        """Test that summaries account for checks appended after a read."""
+        report = AuditReport(
+            project_path=Path("/tmp"),
+            project_type=ProjectType.PYTHON_CLI,
+            checks=sample_checks[:2],
+        )
+        assert report.score == 100.0
+
+        report.checks.extend(sample_checks[2:])
+
+        assert report.failed_count == 1
+        assert report.is_compliant is False
+        assert len(report.checks_by_level[CheckLevel.REQUIRED]) == 3
+
+    def test_counts_follow_replaced_checks(self, sample_checks):
+        """Test that replacing the check list resets the summaries."""
+        report = AuditReport(
+            project_path=Path("/tmp"),
+            project_type=ProjectType.PYTHON_CLI,
+            checks=sample_checks,
+        )
+        assert report.failed_count == 1
+
+        report.checks = sample_checks[:2]
+
+        assert report.failed_count == 0
+        assert report.total_count == 2
+
+    def test_slotted(self):
+        """Test that results have no per-instance __dict__."""
+        result = CheckResult(id="c1", status=CheckStatus.PASSED, message="ok")
+
+        assert not hasattr(result, "__dict__")
@@ -0,0 +1,92 @@
+"""Tests for projinit.core.reporter module."""
+
+import io
+import json
+from pathlib import Path
+
+from projinit.core.checker import Checker
+from projinit.core.models import ProjectType
+from projinit.core.reporter import NdjsonReporter, Reporter
+
+
+class _RecordingStream(io.StringIO):
+    """StringIO remembering how many lines were flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed_lines: list[int] = []
+
+    def flush(self):
+        self.flushed_lines.append(self.getvalue().count("\n"))
+        super().flush()
+
+
+class TestNdjsonReporter:
+    """Tests for NdjsonReporter class."""
+
+    def test_one_record_per_check_and_summary(self, python_cli_project: Path):
+        """Test that each check and the project summary get a record."""
+        stream = io.StringIO()
+        checker = Checker(python_cli_project, ProjectType.PYTHON_CLI)
+
+        report = NdjsonReporter(stream).audit(checker)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(records) == len(report.checks) + 1
+        assert {r["type"] for r in records[:-1]} == {"check"}
+        assert records[0]["id"] == report.checks[0].id
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert summary["passed"] == report.passed_count
+        assert summary["is_compliant"] == report.is_compliant
+
+    def test_records_flushed_incrementally(self, python_cli_project: Path):
+        """Test that every record is flushed as soon as it is written."""
+        stream = _RecordingStream()
+
+        NdjsonReporter(stream).audit(
+            Checker(python_cli_project, ProjectType.PYTHON_CLI)
+        )
+
+        assert stream.flushed_lines == list(range(1, len(stream.flushed_lines) + 1))
+
+    def test_error_record(self, temp_dir: Path):
+        """Test the record emitted for a project that cannot be audited."""
+        stream = io.StringIO()
+
+        NdjsonReporter(stream).error(temp_dir, "not a directory")
+
+        assert json.loads(stream.getvalue()) == {
+            "type": "error",
+            "project": str(temp_dir),
+            "message": "not a directory",
+        }
+
+
+class TestPlainReport:
+    """Tests for Reporter.to_plain."""
+
+    def test_fixed_width_lines(self, python_cli_project: Path):
+        """Test that every check gets one aligned line without markup."""
+        report = Checker(python_cli_project, ProjectType.PYTHON_CLI).run_checks()
+        stream = io.StringIO()
+
+        Reporter(report).to_plain(stream)
+
+        lines = stream.getvalue().splitlines()
+        check_lines = [line for line in lines if line.startswith("  ")]
+        assert len(check_lines) == len(report.checks)
+        assert {line[8:40].rstrip() for line in check_lines} == {
+            c.id for c in report.checks
+        }
+        assert all("\x1b" not in line for line in lines)
+        assert any(line.startswith(f"Score:  {report.score:5.1f}%") for line in lines)
+
+    def test_no_rich_import(self, python_cli_project: Path):
+        """Test that plain output does not create a rich console."""
+        report = Checker(python_cli_project, ProjectType.PYTHON_CLI).run_checks()
+        reporter = Reporter(report)
+
+        reporter.to_plain(io.StringIO())
+
+        assert reporter._console is None
@@ -0,0 +1,128 @@
+"""Tests for projinit.core.resultfile module."""
+
+from contextlib import closing
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from projinit.core.checker import Checker
+from projinit.core.diff import iter_report_results
+from projinit.core.models import CheckLevel, CheckStatus, ProjectType
+from projinit.core.reporter import Reporter
+from projinit.core.resultfile import (
+    ResultFile,
+    is_result_file,
+    write_result_file,
+)
+from projinit.core.results import ResultTable
+
+
+@pytest.fixture
+def new_report(make_report):
+    """Report factory for python-lib projects with recommended checks."""
+    return partial(
+        make_report,
+        project_type=ProjectType.PYTHON_LIB,
+        level=CheckLevel.RECOMMENDED,
+        message="{status} message é",
+        suggestion="fix it",
+        file_path="docs/index.md",
+        execution_time_ms=3.5,
+    )
+
+
+class TestResultFile:
+    """Tests for write_result_file and ResultFile."""
+
+    def test_round_trip(self, python_cli_project: Path, temp_dir: Path):
+        """Test that a saved audit reads back as the same report."""
+        report = Checker(python_cli_project, ProjectType.PYTHON_CLI).run_checks()
+        path = temp_dir / "audit.pjr"
+        write_result_file(ResultTable.from_reports([report]), path)
+
+        with closing(ResultFile(path)) as results:
+            restored = results.to_report(0)
+
+            assert len(results) == len(report.checks)
+            assert restored.checks == report.checks
+            assert restored.project_path == report.project_path
+            assert restored.project_type == report.project_type
+            assert results.projects[0].score == report.score
+
+    def test_rows_grouped_by_project(self, temp_dir: Path, new_report):
+        """Test that interleaved results are stored as one range per project."""
+        a = new_report("/fleet/a", CheckStatus.PASSED, CheckStatus.FAILED)
+        b = new_report("/fleet/b", CheckStatus.WARNING)
+        table = ResultTable()
+        index_a = table.add_project(a.project_path, a.project_type)
+        index_b = table.add_project(b.project_path, b.project_type)
+        table.add_result(index_a, a.checks[0])
+        table.add_result(index_b, b.checks[0])
+        table.add_result(index_a, a.checks[1])
+        path = temp_dir / "fleet.pjr"
+        write_result_file(table, path)
+
+        with closing(ResultFile(path)) as results:
+            assert results.rows_for(0) == range(2)
+            assert results.rows_for(1) == range(2, 3)
+            assert results.to_report(0).checks == a.checks
+            assert results.to_report(1).checks == b.checks
+            assert results.projects[0].failed == 1
+
+    def test_strings_decoded_once(self, temp_dir: Path, new_report):
+        """Test that pooled strings are decoded on access and shared."""
+        path = temp_dir / "fleet.pjr"
+        reports = [
+            new_report(f"/fleet/{i}", CheckStatus.FAILED, CheckStatus.PASSED)
+            for i in range(3)
+        ]
+        write_result_file(ResultTable.from_reports(reports), path)
+
+        with closing(ResultFile(path)) as results:
+            assert len(results.messages) == 2
+            assert results.row(0).message is results.row(2).message
+            assert results.messages.find("passed message é") == 1
+            assert results.check_ids.values == ["check_0", "check_1"]
+
+    def test_empty_table(self, temp_dir: Path):
+        """Test saving a table without results."""
+        path = temp_dir / "empty.pjr"
+        write_result_file(ResultTable(), path)
+
+        with closing(ResultFile(path)) as results:
+            assert len(results) == 0
+            assert results.projects == []
+
+    def test_not_a_result_file(self, temp_dir: Path):
+        """Test that other files are rejected."""
+        path = temp_dir / "report.json"
+        path.write_text('{"checks": []}')
+
+        assert not is_result_file(path)
+        with pytest.raises(ValueError, match="not a projinit result file"):
+            ResultFile(path)
+
+    def test_truncated_file(self, temp_dir: Path, new_report):
+        """Test that a truncated file is rejected."""
+        path = temp_dir / "fleet.pjr"
+        report = new_report("/fleet/a", *[CheckStatus.PASSED] * 10)
+        write_result_file(ResultTable.from_reports([report]), path)
+        path.write_bytes(path.read_bytes()[:-8])
+
+        with pytest.raises(ValueError, match="truncated"):
+            ResultFile(path)
+
+    def test_read_by_iter_report_results(self, temp_dir: Path, new_report):
+        """Test that result files read like the JSON report of the same audit."""
+        report = new_report("/fleet/a", CheckStatus.PASSED, CheckStatus.SKIPPED)
+        exported = temp_dir / "a.pjr"
+        write_result_file(ResultTable.from_reports([report]), exported)
+        document = temp_dir / "a.json"
+        document.write_text(Reporter(report).to_json(), encoding="utf-8")
+        types: dict[str, str] = {}
+
+        assert list(iter_report_results(exported, types)) == list(
+            iter_report_results(document)
+        )
+        assert types == {"/fleet/a": "python-lib"}
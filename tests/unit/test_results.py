@@ -0,0 +1,91 @@
+"""Tests for projinit.core.results module."""
+
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from projinit.core.checker import Checker
+from projinit.core.models import CheckStatus, ProjectType
+from projinit.core.results import NONE_INDEX, ResultTable, StringPool
+
+
+@pytest.fixture
+def new_report(make_report):
+    """Report factory with messages, suggestions and file paths."""
+    return partial(
+        make_report,
+        message="{status} message",
+        suggestion="fix it",
+        file_path="README.md",
+    )
+
+
+class TestStringPool:
+    """Tests for StringPool class."""
+
+    def test_distinct_values_stored_once(self):
+        """Test that repeated strings share one index."""
+        pool = StringPool()
+
+        first = pool.add("README.md exists")
+        second = pool.add("README.md exists")
+
+        assert first == second
+        assert len(pool) == 1
+        assert pool.get(first) == "README.md exists"
+
+    def test_none(self):
+        """Test that None maps to NONE_INDEX and back."""
+        pool = StringPool()
+
+        assert pool.add(None) == NONE_INDEX
+        assert pool.get(NONE_INDEX) is None
+        assert len(pool) == 0
+
+
+class TestResultTable:
+    """Tests for ResultTable class."""
+
+    def test_strings_dictionary_encoded(self, new_report):
+        """Test that strings shared by projects are stored once."""
+        statuses = [CheckStatus.PASSED, CheckStatus.FAILED]
+        table = ResultTable.from_reports(
+            [new_report("/fleet/a", *statuses), new_report("/fleet/b", *statuses)]
+        )
+
+        assert len(table) == 4
+        assert len(table.check_ids) == 2
+        assert len(table.messages) == 2
+        assert table.paths.values == ["README.md"]
+
+    def test_summaries_match_reports(self, new_report):
+        """Test that project counters match AuditReport summaries."""
+        report = new_report(
+            "/fleet/a",
+            CheckStatus.PASSED,
+            CheckStatus.FAILED,
+            CheckStatus.WARNING,
+            CheckStatus.SKIPPED,
+        )
+        table = ResultTable.from_reports([report])
+
+        summary = table.projects[0]
+        assert summary.passed == report.passed_count
+        assert summary.failed == report.failed_count
+        assert summary.warnings == report.warning_count
+        assert summary.total == report.total_count
+        assert summary.score == report.score
+        assert summary.is_compliant is report.is_compliant
+
+    def test_round_trip(self, python_cli_project: Path, new_report):
+        """Test that rows rebuild the original results."""
+        report = Checker(python_cli_project, ProjectType.PYTHON_CLI).run_checks()
+        table = ResultTable()
+        table.add_report(new_report("/fleet/other", CheckStatus.PASSED))
+        index = table.add_report(report)
+
+        rebuilt = table.to_report(index)
+
+        assert rebuilt.checks == report.checks
+        assert rebuilt.score == report.score
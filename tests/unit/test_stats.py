@@ -0,0 +1,180 @@
+"""Tests for projinit.core.stats module."""
+
+import io
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from projinit.core.models import AuditReport, CheckLevel, CheckStatus, ProjectType
+from projinit.core.reporter import NdjsonReporter, Reporter
+from projinit.core.resultfile import write_result_file
+from projinit.core.results import ResultTable
+
+np = pytest.importorskip("numpy")
+
+from projinit.core.stats import MISSING, ComplianceMatrix
+
+P, F, W, S = (
+    CheckStatus.PASSED,
+    CheckStatus.FAILED,
+    CheckStatus.WARNING,
+    CheckStatus.SKIPPED,
+)
+LEVELS = {
+    "readme": CheckLevel.REQUIRED,
+    "license": CheckLevel.REQUIRED,
+    "ci": CheckLevel.RECOMMENDED,
+    "docs": CheckLevel.OPTIONAL,
+}
+
+
+@pytest.fixture
+def new_report(make_report):
+    """Report factory whose checks have the levels of LEVELS."""
+    return partial(make_report, level=LEVELS)
+
+
+@pytest.fixture
+def fleet(new_report) -> list[AuditReport]:
+    """Four projects where license and ci always fail together."""
+    return [
+        new_report("/a", readme=P, license=F, ci=F, docs=P),
+        new_report("/b", readme=P, license=P, ci=P, docs=F),
+        new_report("/c", readme=P, license=F, ci=F, docs=W),
+        new_report(
+            "/d",
+            project_type=ProjectType.NODE_FRONTEND,
+            readme=F,
+            license=P,
+            ci=P,
+            docs=S,
+        ),
+    ]
+
+
+class TestComplianceMatrix:
+    """Tests for ComplianceMatrix loading."""
+
+    def test_from_table(self, fleet: list[AuditReport]):
+        """Test the matrix of in-memory results."""
+        matrix = ComplianceMatrix.from_table(ResultTable.from_reports(fleet))
+
+        assert matrix.shape == (4, 4)
+        assert matrix.check_ids == ["readme", "license", "ci", "docs"]
+        assert matrix.project_types == ["python-cli"] * 3 + ["node-frontend"]
+        assert matrix.failed.sum(axis=0).tolist() == [1, 2, 2, 1]
+        assert matrix.applicable[3].tolist() == [True, True, True, False]
+
+    def test_from_reports_matches_table(self, fleet: list[AuditReport], temp_dir: Path):
+        """Test that saved JSON and NDJSON reports load like in-memory results."""
+        stream = io.StringIO()
+        ndjson = NdjsonReporter(stream)
+        for report in fleet[:3]:
+            for result in report.checks:
+                ndjson.write(
+                    {
+                        "type": "check",
+                        "project": str(report.project_path),
+                        "id": result.id,
+                        "status": result.status.value,
+                        "level": result.level.value,
+                    }
+                )
+            ndjson.summary(report)
+        (temp_dir / "fleet.ndjson").write_text(stream.getvalue(), encoding="utf-8")
+        (temp_dir / "d.json").write_text(Reporter(fleet[3]).to_json(), encoding="utf-8")
+
+        matrix = ComplianceMatrix.from_reports(
+            [temp_dir / "fleet.ndjson", temp_dir / "d.json"]
+        )
+        expected = ComplianceMatrix.from_table(ResultTable.from_reports(fleet))
+
+        assert matrix.projects == expected.projects
+        assert matrix.project_types == expected.project_types
+        assert np.array_equal(matrix.status, expected.status)
+        assert np.array_equal(matrix.levels, expected.levels)
+
+    def test_from_result_file(self, fleet: list[AuditReport], temp_dir: Path):
+        """Test that an exported result file maps to the same matrix."""
+        table = ResultTable.from_reports(fleet)
+        write_result_file(table, temp_dir / "fleet.pjr")
+
+        matrix = ComplianceMatrix.from_reports([temp_dir / "fleet.pjr"])
+        expected = ComplianceMatrix.from_table(table)
+
+        assert matrix.projects == expected.projects
+        assert matrix.project_types == expected.project_types
+        assert np.array_equal(matrix.status, expected.status)
+        assert np.array_equal(matrix.levels, expected.levels)
+
+    def test_missing_checks(self, new_report):
+        """Test that checks a project did not run are marked missing."""
+        table = ResultTable.from_reports(
+            [
+                new_report("/a", readme=P),
+                new_report("/b", ci=F),
+            ]
+        )
+        matrix = ComplianceMatrix.from_table(table)
+
+        assert matrix.status.tolist() == [[0, MISSING], [MISSING, 1]]
+        assert matrix.failure_rates()[0].applicable == 1
+
+
+class TestFleetAnalytics:
+    """Tests for the ComplianceMatrix computations."""
+
+    @pytest.fixture
+    def matrix(self, fleet: list[AuditReport]) -> ComplianceMatrix:
+        return ComplianceMatrix.from_table(ResultTable.from_reports(fleet))
+
+    def test_failure_rates(self, matrix: ComplianceMatrix):
+        """Test failure rates over applicable projects, highest first."""
+        rates = {r.check_id: r for r in matrix.failure_rates()}
+
+        assert [r.check_id for r in matrix.failure_rates()][:2] == ["license", "ci"]
+        assert rates["license"].rate == 50.0
+        assert rates["ci"].level == CheckLevel.RECOMMENDED
+        # The skipped result of /d does not count
+        assert rates["docs"].applicable == 3
+        assert rates["docs"].rate == pytest.approx(100 / 3)
+
+    def test_co_failures(self, matrix: ComplianceMatrix):
+        """Test that checks failing on the same projects are paired first."""
+        pairs = matrix.co_failures(top=5)
+
+        assert (pairs[0].check_a, pairs[0].check_b) == ("license", "ci")
+        assert pairs[0].correlation == 1.0
+        assert pairs[0].both_failed == 2
+        assert all(pair.correlation > 0 for pair in pairs)
+
+    def test_weighted_scores(self, matrix: ComplianceMatrix):
+        """Test that checks weigh by level (required 3, recommended 2, optional 1)."""
+        scores = matrix.weighted_scores()
+
+        # /a: readme (3) and docs (1) pass out of 3 + 3 + 2 + 1
+        assert scores[0] == pytest.approx(400 / 9)
+        assert scores[1] == pytest.approx(800 / 9)
+        # /d: docs skipped, readme (3) fails
+        assert scores[3] == pytest.approx(500 / 8)
+
+    def test_score_distributions(self, matrix: ComplianceMatrix):
+        """Test score percentiles per project type."""
+        distributions = {
+            d.project_type: d for d in matrix.score_distributions(percentiles=(50,))
+        }
+
+        assert distributions["python-cli"].projects == 3
+        assert distributions["python-cli"].percentiles[50] == pytest.approx(
+            44.44, abs=0.01
+        )
+        assert distributions["node-frontend"].mean == pytest.approx(62.5)
+
+    def test_failure_patterns(self, matrix: ComplianceMatrix):
+        """Test that projects are grouped by identical failing checks."""
+        patterns = matrix.failure_patterns()
+
+        assert patterns[0].failed_checks == ["license", "ci"]
+        assert patterns[0].projects == 2
+        assert sum(p.projects for p in patterns) == 4
@@ -0,0 +1,74 @@
+"""Tests for projinit.core.steps module."""
+
+import asyncio
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from projinit.core import steps
+from projinit.core.steps import run_command, run_post_generation
+from projinit.core.tree import DiskSink, VirtualTree
+
+
+@pytest.fixture
+def project(temp_dir: Path) -> tuple[Path, VirtualTree]:
+    """Write a one-file project to disk."""
+    tree = VirtualTree()
+    tree.write("README.md", "# demo\n")
+    target = temp_dir / "demo"
+    DiskSink(target).write(tree)
+    return target, tree
+
+
+class TestRunCommand:
+    """Tests for run_command function."""
+
+    def test_exit_status(self, temp_dir: Path):
+        """Test that the exit status is reported."""
+        ok = [sys.executable, "-c", "pass"]
+        fail = [sys.executable, "-c", "raise SystemExit(3)"]
+
+        assert asyncio.run(run_command(ok, temp_dir)) is True
+        assert asyncio.run(run_command(fail, temp_dir)) is False
+
+    def test_missing_executable(self, temp_dir: Path):
+        """Test that a missing executable is a failure, not an exception."""
+        assert asyncio.run(run_command(["projinit-no-such-tool"], temp_dir)) is False
+
+
+class TestRunPostGeneration:
+    """Tests for run_post_generation function."""
+
+    def test_nothing_to_do(self, project):
+        """Test that no step runs when all are disabled."""
+        target, tree = project
+
+        assert run_post_generation(target, tree, init_git=False) == {}
+
+    def test_selected_steps_run(self, project, monkeypatch: pytest.MonkeyPatch):
+        """Test that git and direnv steps are both run and reported."""
+        target, tree = project
+        monkeypatch.setattr(steps, "bootstrap_repository", lambda *args: True)
+
+        async def fake_command(args, cwd):
+            return args == ["direnv", "allow"] and cwd == target
+
+        monkeypatch.setattr(steps, "run_command", fake_command)
+
+        result = run_post_generation(target, tree, allow_direnv=True)
+
+        assert result == {"git": True, "direnv": True}
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_repository_created(self, project, monkeypatch: pytest.MonkeyPatch):
+        """Test that the git step creates the repository."""
+        target, tree = project
+        monkeypatch.setenv("GIT_AUTHOR_NAME", "Test User")
+        monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+        monkeypatch.setenv("GIT_COMMITTER_NAME", "Test User")
+        monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+        assert run_post_generation(target, tree) == {"git": True}
+        assert (target / ".git" / "refs" / "heads" / "main").is_file()
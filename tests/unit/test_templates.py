@@ -0,0 +1,186 @@
+"""Tests for projinit.core.templates module."""
+
+import os
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, TemplateNotFound
+
+from projinit.cli.init_cmd import _build_project_tree, _create_template_env
+from projinit.core import templates
+from projinit.core.config import TemplatesConfig
+from projinit.core.models import ProjectType
+from projinit.core.templates import (
+    LayeredLoader,
+    add_custom_files,
+    create_template_env,
+    iter_project_files,
+    resolve_templates_dir,
+)
+from projinit.core.tree import VirtualTree
+
+
+def _make_templates_dir(root: Path) -> Path:
+    """Create a custom templates directory with common and typed files."""
+    files = root / "templates" / "files"
+    (files / "_common" / "assets").mkdir(parents=True)
+    (files / "_common" / "assets" / "logo.png").write_bytes(b"\x89PNG" + bytes(100))
+    (files / "_common" / "CONTRIBUTING.md.j2").write_text("# {{ project_name }}\n")
+    (files / "python-cli").mkdir()
+    (files / "python-cli" / "README.md").write_text("custom readme\n")
+    (files / "lab").mkdir()
+    (files / "lab" / "notes.txt").write_text("lab only\n")
+    return root / "templates"
+
+
+class TestResolveTemplatesDir:
+    """Tests for resolve_templates_dir function."""
+
+    def test_unset_or_missing(self, temp_dir: Path):
+        """Test that unset and missing directories are ignored."""
+        assert resolve_templates_dir(None) is None
+        assert resolve_templates_dir(temp_dir / "missing") is None
+
+    def test_existing(self, temp_dir: Path):
+        """Test that an existing directory is resolved."""
+        assert resolve_templates_dir(str(temp_dir)) == temp_dir.resolve()
+
+
+class TestCustomFiles:
+    """Tests for custom project files."""
+
+    def test_files_for_type(self, temp_dir: Path):
+        """Test that only common and matching type files are listed."""
+        templates_dir = _make_templates_dir(temp_dir)
+
+        paths = [
+            p.as_posix() for p, _ in iter_project_files(templates_dir, "python-cli")
+        ]
+
+        assert paths == ["CONTRIBUTING.md.j2", "assets/logo.png", "README.md"]
+
+    def test_static_files_copied_templates_rendered(self, temp_dir: Path):
+        """Test that static files become copy entries and .j2 files are rendered."""
+        templates_dir = _make_templates_dir(temp_dir)
+        tree = VirtualTree()
+
+        count = add_custom_files(tree, templates_dir, "lab", {"project_name": "demo"})
+
+        assert count == 3
+        logo = next(e for e in tree if e.path.as_posix() == "assets/logo.png")
+        assert logo.is_copy
+        assert logo.data is None
+        assert tree.read("CONTRIBUTING.md") == b"# demo\n"
+        assert tree.read("notes.txt") == b"lab only\n"
+
+    def test_custom_files_in_generated_project(self, temp_dir: Path):
+        """Test that custom files are added to, and override, generated files."""
+        templates_dir = _make_templates_dir(temp_dir)
+
+        tree = _build_project_tree(
+            _create_template_env(),
+            "demo-cli",
+            ProjectType.PYTHON_CLI,
+            "Demo",
+            templates_dir=templates_dir,
+        )
+
+        assert tree.read("README.md") == b"custom readme\n"
+        assert "assets/logo.png" in tree
+        assert "pyproject.toml" in tree
+
+
+class TestLayeredLoader:
+    """Tests for LayeredLoader class."""
+
+    @pytest.fixture
+    def user_dir(self, temp_dir: Path) -> Path:
+        """Create a custom templates directory replacing one packaged template."""
+        user_dir = temp_dir / "templates"
+        (user_dir / "gitignore").mkdir(parents=True)
+        (user_dir / "LICENSE.j2").write_text("custom license {{ year }}\n")
+        (user_dir / "gitignore" / "elixir.j2").write_text("_build/\n")
+        return user_dir
+
+    def _render(self, loader: LayeredLoader, name: str, **context) -> str:
+        env = Environment(loader=loader, keep_trailing_newline=True)
+        return env.get_template(name).render(context)
+
+    def test_layer_priority(self, user_dir: Path, temp_dir: Path):
+        """Test that overrides win over the user directory, then packaged files."""
+        readme = temp_dir / "my-readme.j2"
+        readme.write_text("my readme\n")
+
+        loader = LayeredLoader(
+            user_dir,
+            {"README.md.j2": str(readme)},
+            cache_file=temp_dir / "index.json",
+        )
+
+        assert self._render(loader, "README.md.j2") == "my readme\n"
+        assert self._render(loader, "LICENSE.j2", year=2026) == "custom license 2026\n"
+        assert self._render(loader, "gitignore/elixir.j2") == "_build/\n"
+        assert "gitignore/python.j2" in loader.list_templates()
+
+    def test_missing_override_falls_through(self, temp_dir: Path):
+        """Test that an override pointing to a missing file is ignored."""
+        loader = LayeredLoader(
+            None,
+            {"LICENSE.j2": str(temp_dir / "missing.j2")},
+            cache_file=temp_dir / "index.json",
+        )
+
+        assert loader.index["LICENSE.j2"].startswith(
+            str(templates.PACKAGED_TEMPLATES_DIR)
+        )
+
+    def test_unknown_template(self, temp_dir: Path):
+        """Test that unknown names raise TemplateNotFound."""
+        loader = LayeredLoader(cache_file=temp_dir / "index.json")
+
+        with pytest.raises(TemplateNotFound):
+            self._render(loader, "nope.j2")
+
+    def test_index_cached_across_loaders(
+        self, user_dir: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a fresh cache avoids walking template directories."""
+        cache_file = temp_dir / "index.json"
+        LayeredLoader(user_dir, cache_file=cache_file)
+        assert cache_file.exists()
+
+        scanned = []
+        original = templates._scan_layer
+        monkeypatch.setattr(
+            templates,
+            "_scan_layer",
+            lambda root: scanned.append(root) or original(root),
+        )
+
+        LayeredLoader(user_dir, cache_file=cache_file)
+        assert scanned == []
+
+        # Adding a template changes the directory mtime: only that layer is rescanned
+        (user_dir / "gitignore" / "zig.j2").write_text("zig-out/\n")
+        stat = (user_dir / "gitignore").stat()
+        os.utime(user_dir / "gitignore", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        loader = LayeredLoader(user_dir, cache_file=cache_file)
+        assert scanned == [user_dir]
+        assert "gitignore/zig.j2" in loader.index
+
+    def test_corrupt_cache_ignored(self, user_dir: Path, temp_dir: Path):
+        """Test that an unreadable cache is rebuilt."""
+        cache_file = temp_dir / "index.json"
+        cache_file.write_text("{not json")
+
+        loader = LayeredLoader(user_dir, cache_file=cache_file)
+
+        assert "LICENSE.j2" in loader.index
+        assert '"version": 1' in cache_file.read_text()
+
+    def test_create_template_env(self, user_dir: Path):
+        """Test building an environment from a templates configuration."""
+        env = create_template_env(TemplatesConfig(templates_dir=user_dir))
+
+        assert env.get_template("LICENSE.j2").render(year=1) == "custom license 1\n"
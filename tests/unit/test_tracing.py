@@ -0,0 +1,118 @@
+"""Tests for projinit.core.tracing module."""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from projinit.core import tracing
+from projinit.core.checker import Checker
+from projinit.core.models import ProjectType
+from projinit.core.tracing import (
+    active_tracer,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Trace for the duration of a test."""
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+@traced("double", "test")
+def _double(value: int) -> int:
+    return value * 2
+
+
+@traced("label", "test", lambda repo, *_, **__: {"repo": str(repo)})
+def _label(repo: Path, suffix: str = "") -> str:
+    return f"{repo}{suffix}"
+
+
+class TestTracingOff:
+    """Tests for the behavior when tracing is off."""
+
+    def test_nothing_recorded(self):
+        """Test that spans and traced functions run without a tracer."""
+        assert active_tracer() is None
+
+        with span("block", "test", repo="/a"):
+            result = _double(2)
+
+        assert result == 4
+        assert span("other") is span("block")
+
+
+class TestTracer:
+    """Tests for recorded spans."""
+
+    def test_nested_spans(self, tracer: tracing.Tracer):
+        """Test that nested spans are complete events on the same thread."""
+        with span("outer", "test", repo="/a"):
+            _double(1)
+
+        inner, outer = tracer.events
+        assert (outer["name"], outer["cat"], outer["ph"]) == ("outer", "test", "X")
+        assert outer["args"] == {"repo": "/a"}
+        assert inner["name"] == "double"
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert inner["pid"] == outer["pid"] == os.getpid()
+        assert inner["tid"] == outer["tid"] == threading.get_native_id()
+
+    def test_traced_attributes(self, tracer: tracing.Tracer):
+        """Test that a traced function labels its span from its arguments."""
+        assert _label(Path("/a"), suffix="!") == "/a!"
+
+        assert tracer.events[0]["args"] == {"repo": "/a"}
+
+    def test_error_recorded(self, tracer: tracing.Tracer):
+        """Test that a span ended by an exception records its type."""
+        with pytest.raises(KeyError), span("failing"):
+            raise KeyError("missing")
+
+        assert tracer.events[0]["args"] == {"error": "KeyError"}
+
+    def test_worker_threads(self, tracer: tracing.Tracer):
+        """Test that spans of other threads get their own named track."""
+        worker = threading.Thread(target=_double, args=(3,), name="worker-1")
+        worker.start()
+        worker.join()
+
+        document = tracer.to_dict()
+        names = {e["args"]["name"] for e in document["traceEvents"] if e["ph"] == "M"}
+        assert "worker-1" in names
+        assert tracer.events[0]["tid"] != threading.get_native_id()
+
+    def test_checker_spans(self, tracer: tracing.Tracer, python_cli_project: Path):
+        """Test that an audit records its phases and one span per check."""
+        report = Checker(python_cli_project, ProjectType.PYTHON_CLI).run_checks()
+
+        by_category: dict[str, set[str]] = {}
+        for event in tracer.events:
+            by_category.setdefault(event["cat"], set()).add(event["name"])
+        assert {c.id for c in report.checks} <= by_category["check"]
+        assert "run_checks" in by_category["check"]
+        [run_checks] = [e for e in tracer.events if e["name"] == "run_checks"]
+        assert run_checks["args"] == {"repo": str(python_cli_project)}
+        assert {"load_standards", "load_config", "yaml"} <= by_category["load"]
+
+    def test_save(self, temp_dir: Path):
+        """Test that stop_tracing writes a Chrome trace document."""
+        start_tracing()
+        with span("block"):
+            pass
+        tracer = stop_tracing(temp_dir / "trace.json")
+
+        document = json.loads((temp_dir / "trace.json").read_text())
+        assert active_tracer() is None
+        assert document["displayTimeUnit"] == "ms"
+        assert tracer.events[0] in document["traceEvents"]
@@ -0,0 +1,165 @@
+"""Tests for projinit.core.tree module."""
+
+import stat
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from projinit.core.tree import ArchiveSink, DiskSink, VirtualTree, archive_format
+
+
+@pytest.fixture
+def tree() -> VirtualTree:
+    """Create a small project tree."""
+    tree = VirtualTree()
+    tree.write("README.md", "# demo\n")
+    tree.write("src/demo/__init__.py", "")
+    tree.write("bin/run", "#!/bin/sh\n", mode=0o755)
+    tree.mkdir("public")
+    return tree
+
+
+class TestVirtualTree:
+    """Tests for VirtualTree class."""
+
+    def test_parents_created(self, tree: VirtualTree):
+        """Test that writing a file adds its parent directories."""
+        assert "src" in tree
+        assert "src/demo" in tree
+        assert tree.files()[0].as_posix() == "README.md"
+
+    def test_read(self, tree: VirtualTree):
+        """Test reading file contents back as bytes."""
+        assert tree.read("README.md") == b"# demo\n"
+        with pytest.raises(KeyError):
+            tree.read("src")
+
+    def test_copy_entry(self, tree: VirtualTree, temp_dir: Path):
+        """Test that copied files keep their source and executable bit."""
+        script = temp_dir / "setup.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+
+        tree.copy("scripts/setup.sh", script)
+
+        entry = next(e for e in tree if e.path.as_posix() == "scripts/setup.sh")
+        assert entry.is_copy and not entry.is_dir
+        assert entry.mode == 0o755
+        assert "scripts" in tree
+        assert tree.read("scripts/setup.sh") == b"#!/bin/sh\n"
+        assert tree.size == len(b"# demo\n#!/bin/sh\n#!/bin/sh\n")
+
+    def test_invalid_paths_rejected(self):
+        """Test that paths escaping the tree are rejected."""
+        tree = VirtualTree()
+
+        with pytest.raises(ValueError):
+            tree.write("../outside", "x")
+        with pytest.raises(ValueError):
+            tree.write("/etc/passwd", "x")
+
+
+class TestDiskSink:
+    """Tests for DiskSink class."""
+
+    def test_tree_written(self, tree: VirtualTree, temp_dir: Path):
+        """Test that files, empty directories and modes are written."""
+        root = temp_dir / "demo"
+
+        written = DiskSink(root).write(tree)
+
+        assert written == 3
+        assert (root / "README.md").read_text() == "# demo\n"
+        assert (root / "public").is_dir()
+        assert (root / "bin" / "run").stat().st_mode & stat.S_IXUSR
+
+    def test_copy_entries_written(self, tree: VirtualTree, temp_dir: Path):
+        """Test that copy entries are materialized from their source."""
+        source = temp_dir / "font.woff2"
+        source.write_bytes(b"\x00\x01" * 50_000)
+        tree.copy("assets/font.woff2", source)
+
+        DiskSink(temp_dir / "demo").write(tree)
+
+        copied = temp_dir / "demo" / "assets" / "font.woff2"
+        assert copied.read_bytes() == source.read_bytes()
+
+    def test_up_to_date_files_skipped(self, tree: VirtualTree, temp_dir: Path):
+        """Test that a second write leaves identical files untouched."""
+        DiskSink(temp_dir).write(tree)
+
+        assert DiskSink(temp_dir).write(tree) == 0
+
+
+class TestArchiveSink:
+    """Tests for ArchiveSink class."""
+
+    @pytest.mark.parametrize(
+        "name", ["p.tar", "p.tar.gz", "p.tgz", "p.tar.xz", "p.tar.bz2"]
+    )
+    def test_tar_archives(self, tree: VirtualTree, temp_dir: Path, name: str):
+        """Test streaming a tree into tar archives."""
+        path = temp_dir / name
+
+        ArchiveSink(path, prefix="demo").write(tree)
+
+        with tarfile.open(path) as tar:
+            names = tar.getnames()
+            assert tar.extractfile("demo/README.md").read() == b"# demo\n"
+            assert tar.getmember("demo/bin/run").mode == 0o755
+        assert "demo/public" in names
+        assert names[0] == "demo"
+
+    def test_zip_archive(self, tree: VirtualTree, temp_dir: Path):
+        """Test streaming a tree into a zip archive."""
+        path = temp_dir / "p.zip"
+
+        ArchiveSink(path, prefix="demo").write(tree)
+
+        with zipfile.ZipFile(path) as zf:
+            assert zf.read("demo/README.md") == b"# demo\n"
+            assert "demo/public/" in zf.namelist()
+
+    @pytest.mark.parametrize("name", ["p.tar.gz", "p.zip"])
+    def test_copy_entries_streamed(self, tree: VirtualTree, temp_dir: Path, name: str):
+        """Test that copy entries are streamed from their source."""
+        source = temp_dir / "data.bin"
+        source.write_bytes(bytes(range(256)) * 1000)
+        tree.copy("data/data.bin", source)
+        path = temp_dir / name
+
+        ArchiveSink(path, prefix="demo").write(tree)
+
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(path) as zf:
+                assert zf.read("demo/data/data.bin") == source.read_bytes()
+        else:
+            with tarfile.open(path) as tar:
+                member = tar.extractfile("demo/data/data.bin")
+                assert member.read() == source.read_bytes()
+
+    def test_unsupported_format(self, temp_dir: Path):
+        """Test that unknown suffixes are rejected."""
+        with pytest.raises(ValueError):
+            archive_format(temp_dir / "p.rar")
+
+    def test_zstd_unavailable(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that zstd archives are rejected up front without a zstd module."""
+        monkeypatch.setitem(sys.modules, "compression.zstd", None)
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+
+        with pytest.raises(ValueError, match="zstandard"):
+            archive_format(temp_dir / "p.tar.zst")
+
+    def test_no_partial_archive_on_error(self, temp_dir: Path):
+        """Test that a failed write leaves no archive or temporary file."""
+        tree = VirtualTree()
+        tree._entries["bad"] = None  # corrupt entry
+
+        with pytest.raises(AttributeError):
+            ArchiveSink(temp_dir / "p.tar").write(tree)
+
+        assert list(temp_dir.iterdir()) == []
@@ -0,0 +1,203 @@
+"""Tests for projinit.core.writer module."""
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from projinit.core import writer
+from projinit.core.models import ActionType, MergeStrategy, ProjectType, UpdateAction
+from projinit.core.updater import Updater
+from projinit.core.writer import (
+    atomic_open,
+    atomic_write,
+    copy_file,
+    is_unchanged,
+    write_if_changed,
+)
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed function."""
+
+    def test_new_file_written(self, temp_dir: Path):
+        """Test that a missing file is created."""
+        target = temp_dir / "new.txt"
+
+        assert write_if_changed(target, "hello\n") is True
+        assert target.read_text() == "hello\n"
+
+    def test_identical_content_skipped(self, temp_dir: Path):
+        """Test that identical content leaves the file and its mtime untouched."""
+        target = temp_dir / "same.txt"
+        target.write_text("hello\n")
+        os.utime(target, (1_000_000, 1_000_000))
+
+        assert write_if_changed(target, "hello\n") is False
+        assert target.stat().st_mtime == 1_000_000
+
+    def test_same_size_different_content_written(self, temp_dir: Path):
+        """Test that content of equal size but different bytes is written."""
+        target = temp_dir / "file.txt"
+        target.write_text("aaaa")
+
+        assert write_if_changed(target, "bbbb") is True
+        assert target.read_text() == "bbbb"
+
+    def test_bytes_content(self, temp_dir: Path):
+        """Test comparing and writing raw bytes."""
+        target = temp_dir / "file.bin"
+        target.write_bytes(b"\x00\x01")
+
+        assert is_unchanged(target, b"\x00\x01")
+        assert not is_unchanged(target, b"\x00\x02")
+
+
+class TestAtomicOpen:
+    """Tests for atomic_open and atomic_write functions."""
+
+    def test_replaces_target(self, temp_dir: Path):
+        """Test that the target is replaced and keeps its permissions."""
+        target = temp_dir / "metrics.prom"
+        target.write_text("old\n")
+        target.chmod(0o640)
+
+        atomic_write(target, "new\n")
+
+        assert target.read_text() == "new\n"
+        assert target.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in temp_dir.iterdir()] == ["metrics.prom"]
+
+    def test_new_file_permissions(self, temp_dir: Path):
+        """Test that a new file gets the umask permissions, not mkstemp's 0600."""
+        target = temp_dir / "sub" / "export.pjr"
+
+        atomic_write(target, b"data")
+
+        umask = os.umask(0)
+        os.umask(umask)
+        assert target.read_bytes() == b"data"
+        assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_failure_keeps_target(self, temp_dir: Path):
+        """Test that a failed write leaves the target and no temporary file."""
+        target = temp_dir / "metrics.prom"
+        target.write_text("old\n")
+
+        with pytest.raises(RuntimeError), atomic_open(target, "w") as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+
+        assert target.read_text() == "old\n"
+        assert [p.name for p in temp_dir.iterdir()] == ["metrics.prom"]
+
+    def test_concurrent_writers(self, temp_dir: Path):
+        """Test that two writers of the same path use separate temporary files."""
+        target = temp_dir / "metrics.prom"
+
+        with atomic_open(target, "w") as first, atomic_open(target, "w") as second:
+            assert first.name != second.name
+            first.write("first\n")
+            second.write("second\n")
+
+        assert target.read_text() == "first\n"
+        assert [p.name for p in temp_dir.iterdir()] == ["metrics.prom"]
+
+
+class TestUpdaterNoOp:
+    """Tests for no-op merges in the Updater."""
+
+    def test_unchanged_merge_not_backed_up(self, temp_dir: Path):
+        """Test that a merge producing identical content is recorded as a no-op."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text(
+            '[tool.ruff]\nline-length = 100\ntarget-version = "py310"\n'
+        )
+        action = UpdateAction(
+            action_type=ActionType.MERGE,
+            source=None,
+            target=pyproject,
+            merge_strategy=MergeStrategy.SMART,
+            description="Add [tool.ruff] section to pyproject.toml",
+            template_vars={
+                "section": {"name": "[tool.ruff]", "values": {"line-length": 100}}
+            },
+        )
+
+        updater = Updater(temp_dir, ProjectType.PYTHON_CLI)
+        applied = updater.apply_actions([action])
+
+        assert applied == [action]
+        assert updater.unchanged_actions == [action]
+        assert updater.backup_index is None
+
+
+class TestCopyFile:
+    """Tests for copy_file function."""
+
+    @pytest.fixture
+    def source(self, temp_dir: Path) -> Path:
+        """Create a binary file larger than a single copy chunk."""
+        path = temp_dir / "asset.bin"
+        path.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+        return path
+
+    def test_copy(self, source: Path, temp_dir: Path):
+        """Test that the copy is identical whatever the method used."""
+        target = temp_dir / "copy.bin"
+
+        method = copy_file(source, target)
+
+        assert method in ("reflink", "copy_file_range", "sendfile", "copy")
+        assert target.read_bytes() == source.read_bytes()
+
+    def test_empty_file(self, temp_dir: Path):
+        """Test copying an empty file."""
+        source = temp_dir / "empty"
+        source.touch()
+
+        copy_file(source, temp_dir / "copy")
+
+        assert (temp_dir / "copy").read_bytes() == b""
+
+    def test_fallback_chain(
+        self, source: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test falling back when kernel copies are unsupported."""
+        target = temp_dir / "copy.bin"
+        target.write_bytes(b"stale content")
+
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        monkeypatch.setattr(writer, "_reflink", lambda src, dst: False)
+        monkeypatch.setattr(
+            writer,
+            "_KERNEL_COPIES",
+            (("copy_file_range", unsupported), ("sendfile", unsupported)),
+        )
+
+        assert copy_file(source, target) == "copy"
+        assert target.read_bytes() == source.read_bytes()
+
+    def test_partial_kernel_copy_restarted(
+        self, source: Path, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a method failing midway leaves no partial data."""
+        target = temp_dir / "copy.bin"
+        calls = []
+
+        def fails_after_first_chunk(src_fd, dst_fd, offset, count):
+            if calls:
+                raise OSError(errno.EINVAL, "unsupported")
+            calls.append(offset)
+            return os.write(dst_fd, b"x" * 10)
+
+        monkeypatch.setattr(writer, "_reflink", lambda src, dst: False)
+        monkeypatch.setattr(
+            writer, "_KERNEL_COPIES", (("sendfile", fails_after_first_chunk),)
+        )
+
+        assert copy_file(source, target) == "copy"
+        assert target.read_bytes() == source.read_bytes()